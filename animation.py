@@ -0,0 +1,132 @@
+from assets import assets
+
+
+class AnimationClip:
+    """
+    Séquence d'images d'une animation, chargée une seule fois et partagée par
+    toutes les entités. Chaque clip connaît sa variante miroir (sens opposé),
+    ce qui permet de faire demi-tour sans créer de nouvelle surface.
+    """
+    def __init__(self, name, frames, frame_duration, loop=True, facing="droite"):
+        """
+        Initialise un clip.
+        :param name: Nom du clip dans la bibliothèque.
+        :param frames: Liste des images (surfaces) du clip.
+        :param frame_duration: Durée d'affichage d'une image, en secondes.
+        :param loop: Si True, l'animation reprend au début une fois terminée.
+        :param facing: Sens du clip ("droite" ou "gauche").
+        """
+        self.name = name
+        self.frames = tuple(frames)
+        self.frame_duration = frame_duration
+        self.loop = loop
+        self.facing = facing
+        self.mirror = self # Variante dans l'autre sens (renseignée par la bibliothèque)
+
+    def __len__(self):
+        return len(self.frames)
+
+
+class ClipLibrary:
+    """
+    Bibliothèque des clips d'animation du jeu, avec leurs variantes gauche/droite
+    pré-calculées.
+    """
+    def __init__(self):
+        self.clips = {} # (nom, sens) -> AnimationClip
+
+    def has(self, name):
+        """ Indique si un clip est déjà enregistré. """
+        return (name, "droite") in self.clips
+
+    def add(self, name, paths, frame_duration, loop=True, mirror_paths=None):
+        """
+        Enregistre un clip et sa variante miroir.
+        :param name: Nom du clip.
+        :param paths: Chemins des images, dans le sens "droite".
+        :param frame_duration: Durée d'affichage d'une image, en secondes.
+        :param loop: Si True, l'animation boucle.
+        :param mirror_paths: Chemins des images dessinées pour le sens "gauche".
+                             Si None, ce sont les images de 'paths' retournées horizontalement.
+        :return: Le clip dans le sens "droite".
+        """
+        right = AnimationClip(name, assets.get_images(paths), frame_duration, loop, "droite")
+        if mirror_paths is None:
+            left_frames = [assets.get_image(path, flip_x=True) for path in paths]
+        else:
+            left_frames = assets.get_images(mirror_paths)
+        left = AnimationClip(name, left_frames, frame_duration, loop, "gauche")
+        right.mirror = left
+        left.mirror = right
+        self.clips[(name, "droite")] = right
+        self.clips[(name, "gauche")] = left
+        return right
+
+    def get(self, name, facing="droite"):
+        """
+        Retourne le clip demandé dans le sens voulu (KeyError s'il n'existe pas).
+        """
+        return self.clips[(name, facing)]
+
+
+class Animator:
+    """
+    Lecture d'un clip par une entité : seulement une référence au clip,
+    l'indice de l'image courante et une minuterie.
+    """
+    __slots__ = ("clip", "index", "timer", "finished")
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.index = 0
+        self.timer = 0
+        self.finished = False
+
+    @property
+    def image(self):
+        """ Image courante du clip. """
+        return self.clip.frames[self.index]
+
+    def play(self, clip, restart=False):
+        """
+        Change de clip (simple changement de référence).
+        :param restart: Si True, reprend l'animation au début. Sinon l'indice courant
+                        est conservé (ramené dans les bornes du nouveau clip).
+        """
+        if restart:
+            self.index = 0
+            self.timer = 0
+            self.finished = False
+        elif clip is not self.clip and self.index >= len(clip.frames):
+            self.index = 0
+        self.clip = clip
+
+    def turn(self):
+        """ Passe à la variante miroir du clip courant (demi-tour). """
+        self.clip = self.clip.mirror
+
+    def update(self, dt):
+        """
+        Fait avancer l'animation.
+        :return: False si le clip (non bouclé) est terminé, True sinon.
+        """
+        if self.finished:
+            return False
+        frame_count = len(self.clip.frames)
+        self.timer += dt
+        if self.timer > self.clip.frame_duration:
+            self.timer = 0
+            if self.clip.loop:
+                self.index = (self.index + 1) % frame_count
+            elif self.index + 1 >= frame_count:
+                self.finished = True
+                return False
+            else:
+                self.index += 1
+        if frame_count == 1:
+            self.index = 0
+        return True
+
+
+# Bibliothèque partagée par tout le jeu
+clips = ClipLibrary()
@@ -0,0 +1,145 @@
+import os
+import json
+import pygame as pg
+
+# Index des atlas de sprites générés par build_atlas.py
+ATLAS_INDEX = "Sprites/atlas/atlas.json"
+
+class AssetManager:
+    """
+    Gestionnaire central des images du jeu.
+    Chaque image est chargée et convertie une seule fois, puis partagée par tous
+    les objets qui la demandent. Les variantes transformées (redimensionnées,
+    retournées) sont elles aussi mises en cache, avec leur propre clé.
+    Les surfaces retournées sont partagées : ne pas les modifier directement.
+    Si un atlas de sprites existe (voir build_atlas.py), les images qu'il contient
+    sont découpées dans l'atlas (sous-surfaces) au lieu d'être lues une à une.
+    """
+    def __init__(self):
+        """
+        Initialise un cache vide.
+        """
+        self.images = {} # (chemin, alpha, colorkey, taille, flip_x, flip_y) -> surface
+        self.hits = 0
+        self.misses = 0
+        self.atlas = None # Chemin du sprite -> (chemin de la page, rectangle) ; chargé au premier besoin
+        self.decoded = {} # Chemin du fichier -> surface déjà décodée mais pas encore convertie (voir level_loader.py)
+
+    def load_atlas(self, index_path=ATLAS_INDEX):
+        """
+        Lit l'index des atlas de sprites. Sans atlas, les images sont lues depuis leurs fichiers.
+        """
+        self.atlas = {}
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Avertissement: Index d'atlas '{index_path}' illisible, les sprites seront chargés un par un: {e}")
+            return
+        for path, (page, x, y, width, height) in index["sprites"].items():
+            self.atlas[os.path.normpath(path)] = (os.path.normpath(index["pages"][page]), (x, y, width, height))
+
+    def get_image(self, path, alpha=True, colorkey=None, size=None, flip_x=False, flip_y=False):
+        """
+        Retourne l'image demandée, en la chargeant au premier appel.
+        :param path: Chemin de l'image.
+        :param alpha: Si True, conserve la transparence par pixel (convert_alpha), sinon convert.
+        :param colorkey: Couleur de transparence optionnelle (implique une image sans alpha).
+        :param size: Taille (largeur, hauteur) optionnelle de l'image redimensionnée.
+        :param flip_x, flip_y: Retournement horizontal / vertical de l'image.
+        :return: Surface Pygame partagée.
+        """
+        path = os.path.normpath(path)
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, alpha, colorkey, size, flip_x, flip_y)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        if size is not None or flip_x or flip_y:
+            # Variante transformée : construite à partir de l'image d'origine (elle aussi en cache)
+            image = self.get_image(path, alpha, colorkey)
+            if size is not None:
+                image = pg.transform.scale(image, size)
+            if flip_x or flip_y:
+                image = pg.transform.flip(image, flip_x, flip_y)
+        else:
+            if self.atlas is None:
+                self.load_atlas()
+            region = self.atlas.get(path)
+            if region is not None and alpha and colorkey is None:
+                # Sous-surface de la page d'atlas : aucun fichier ouvert pour ce sprite
+                page_path, rect = region
+                self.images[key] = image = self.get_image(page_path).subsurface(rect)
+                return image
+
+            image = self.decoded.pop(path, None)
+            if image is None:
+                image = pg.image.load(path)
+            if colorkey is not None:
+                image = image.convert()
+                image.set_colorkey(colorkey)
+            elif alpha:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+
+        self.images[key] = image
+        return image
+
+    def get_file_path(self, path, alpha=True, colorkey=None):
+        """
+        Retourne le fichier réellement lu pour une image : la page d'atlas qui la contient,
+        ou l'image elle-même. L'index des atlas doit déjà être chargé (load_atlas).
+        """
+        path = os.path.normpath(path)
+        region = self.atlas.get(path) if self.atlas else None
+        if region is not None and alpha and colorkey is None:
+            return region[0]
+        return path
+
+    def add_decoded(self, path, image):
+        """
+        Fournit une image décodée ailleurs (thread de chargement) : elle sera convertie
+        au format de l'écran lors de sa première demande, sans relire le fichier.
+        """
+        self.decoded[os.path.normpath(path)] = image
+
+    def get_images(self, paths, **kwargs):
+        """
+        Retourne la liste des images demandées (mêmes options pour toutes).
+        """
+        return [self.get_image(path, **kwargs) for path in paths]
+
+    def preload(self, paths, **kwargs):
+        """
+        Charge des images à l'avance (hors des frames de jeu).
+        Les images introuvables sont signalées mais n'interrompent pas le chargement.
+        """
+        for path in paths:
+            try:
+                self.get_image(path, **kwargs)
+            except (pg.error, FileNotFoundError) as e:
+                print(f"Erreur: Impossible de précharger l'image '{path}': {e}")
+
+    def get_stats(self):
+        """
+        Retourne les statistiques du cache (nombre d'images, succès, échecs).
+        """
+        return {"images": len(self.images), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        """
+        Vide le cache (les surfaces déjà distribuées restent valides).
+        """
+        self.images.clear()
+        self.decoded.clear()
+
+
+# Instance partagée par tout le jeu
+assets = AssetManager()
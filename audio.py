@@ -0,0 +1,190 @@
+# audio.py
+"""
+Gestionnaire central du son : effets sonores préchargés, joués sur un ensemble
+fixe de canaux, et volumes par bus (musique, effets) multipliés par le volume général.
+
+Un effet n'est jamais lu depuis le disque pendant une partie : il est chargé et
+décodé une fois (preload), puis seulement rejoué. Le nombre de voix est borné :
+un même son ne se superpose pas plus de AUDIO_MAX_VOICES fois, et quand tous les
+canaux sont occupés, la voix la moins prioritaire (la plus ancienne à priorité égale)
+est remplacée. Un volume n'est transmis au mixeur que lorsqu'il change.
+"""
+import os
+import pygame as pg
+from settings import GAME_VOLUME, MUSIC_VOLUME, SFX_VOLUME, AUDIO_CHANNELS, AUDIO_MAX_VOICES
+
+# Priorités des effets sonores
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+
+class AudioManager:
+    """
+    Effets sonores, canaux et bus de volume ("master", "music", "sfx").
+    Sans mixeur (pas de carte son), toutes les méthodes sont sans effet.
+    """
+    def __init__(self):
+        self.sounds = {} # Chemin -> pg.mixer.Sound, décodé une seule fois
+        self.volumes = {"master": GAME_VOLUME, "music": MUSIC_VOLUME, "sfx": SFX_VOLUME}
+        self.channels = [] # Canaux du mixeur réservés aux effets
+        self.voice_sounds = [] # Par canal : son joué (None si libre)
+        self.voice_priorities = []
+        self.voice_starts = [] # Par canal : numéro de lecture (plus petit = plus ancien)
+        self.play_count = 0
+        self.dropped = 0 # Effets non joués (non préchargés, ou canaux occupés par plus prioritaire)
+        self.stolen = 0 # Voix interrompues pour en jouer une autre
+        self.missing = set() # Effets demandés sans avoir été préchargés (signalés une seule fois)
+
+    @property
+    def enabled(self):
+        return bool(self.channels)
+
+    def init(self, channel_count=AUDIO_CHANNELS):
+        """
+        Crée l'ensemble des canaux (à appeler après pg.mixer.init).
+        """
+        if not pg.mixer.get_init():
+            print("Avertissement: Mixeur audio indisponible, le jeu sera muet.")
+            return
+        pg.mixer.set_num_channels(channel_count)
+        self.channels = [pg.mixer.Channel(index) for index in range(channel_count)]
+        self.voice_sounds = [None] * channel_count
+        self.voice_priorities = [PRIORITY_LOW] * channel_count
+        self.voice_starts = [0] * channel_count
+        self.apply_volume("music")
+
+    def get_volume(self, bus):
+        return self.volumes[bus]
+
+    def set_volume(self, bus, volume):
+        """
+        Change le volume d'un bus (0.0 à 1.0). Le mixeur n'est mis à jour que si la valeur change.
+        """
+        volume = max(0.0, min(volume, 1.0))
+        if volume == self.volumes[bus]:
+            return
+        self.volumes[bus] = volume
+        if bus == "master":
+            self.apply_volume("music")
+            self.apply_volume("sfx")
+        else:
+            self.apply_volume(bus)
+
+    def apply_volume(self, bus):
+        """ Transmet au mixeur le volume effectif d'un bus (volume général x volume du bus). """
+        if not self.enabled:
+            return
+        volume = self.volumes["master"] * self.volumes[bus]
+        if bus == "music":
+            pg.mixer.music.set_volume(volume)
+        else:
+            for sound in self.sounds.values():
+                sound.set_volume(volume)
+
+    def load_sound(self, path):
+        """
+        Retourne l'effet demandé, en le chargeant au premier appel.
+        """
+        path = os.path.normpath(path)
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = self.sounds[path] = pg.mixer.Sound(path)
+            sound.set_volume(self.volumes["master"] * self.volumes["sfx"])
+        return sound
+
+    def preload(self, paths):
+        """
+        Charge des effets à l'avance (hors des frames de jeu).
+        Les effets introuvables sont signalés mais n'interrompent pas le chargement.
+        """
+        if not self.enabled:
+            return
+        for path in paths:
+            try:
+                self.load_sound(path)
+            except (pg.error, FileNotFoundError) as e:
+                print(f"Erreur: Impossible de précharger le son '{path}': {e}")
+
+    def play(self, path, priority=PRIORITY_NORMAL):
+        """
+        Joue un effet préchargé sur un canal libre, ou à la place d'une voix moins prioritaire.
+        Un effet non préchargé est ignoré (jamais de lecture de fichier pendant une partie).
+        :return: Le canal utilisé, ou None si l'effet n'est pas joué.
+        """
+        if not self.enabled:
+            return None
+        sound = self.sounds.get(os.path.normpath(path))
+        if sound is None:
+            if path not in self.missing:
+                self.missing.add(path)
+                print(f"Avertissement: Son '{path}' non préchargé, ignoré.")
+            self.dropped += 1
+            return None
+
+        free = None
+        same_sound = [] # Voix en cours du même son
+        candidate = None # Voix remplaçable : la moins prioritaire, puis la plus ancienne
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                if free is None:
+                    free = index
+                continue
+            if self.voice_sounds[index] is sound:
+                same_sound.append(index)
+            key = (self.voice_priorities[index], self.voice_starts[index])
+            if self.voice_priorities[index] <= priority and (candidate is None or key < candidate[0]):
+                candidate = (key, index)
+
+        if len(same_sound) >= AUDIO_MAX_VOICES:
+            # Limite de voix du son atteinte : la plus ancienne est relancée
+            index = min(same_sound, key=lambda i: self.voice_starts[i])
+            self.stolen += 1
+        elif free is not None:
+            index = free
+        elif candidate is not None:
+            index = candidate[1]
+            self.stolen += 1
+        else:
+            self.dropped += 1
+            return None
+
+        self.play_count += 1
+        self.voice_sounds[index] = sound
+        self.voice_priorities[index] = priority
+        self.voice_starts[index] = self.play_count
+        channel = self.channels[index]
+        channel.play(sound)
+        return channel
+
+    def play_music(self, path, loops=-1):
+        """
+        Lance une musique en boucle (lue en continu depuis le fichier par le mixeur).
+        :return: False si la musique n'a pas pu être lancée.
+        """
+        if not self.enabled:
+            return False
+        try:
+            pg.mixer.music.load(path)
+            pg.mixer.music.set_volume(self.volumes["master"] * self.volumes["music"])
+            pg.mixer.music.play(loops)
+        except pg.error as e:
+            print(f"Erreur: Impossible de charger ou jouer la musique '{path}': {e}")
+            return False
+        return True
+
+    def stop_music(self):
+        if self.enabled:
+            pg.mixer.music.stop()
+
+    def get_stats(self):
+        """
+        Retourne les statistiques du son (effets chargés, voix en cours, voix interrompues,
+        effets non joués).
+        """
+        voices = sum(1 for channel in self.channels if channel.get_busy())
+        return {"sounds": len(self.sounds), "voices": voices, "stolen": self.stolen, "dropped": self.dropped}
+
+
+# Instance partagée par tout le jeu
+audio = AudioManager()
@@ -0,0 +1,319 @@
+# benchmark.py
+"""
+Banc d'essai des performances du jeu, sans fenêtre.
+
+Charge TileMap/game_map.tmx et joue des scénarios scriptés (attente au point
+de départ, ascension de toute la carte, lancers de javelot en rafale, carte
+remplie de zombies, horde de plusieurs milliers de zombies) en mesurant chaque
+image : GameState.update, GameState.draw et, à l'intérieur, Map.render, les
+collisions du joueur (Player.move_x/y), le vol des javelots (Javelin.update)
+et les monstres (MonsterSystem.update).
+Le chargement (Map + Map.load_map_objects) est mesuré à part.
+
+Pour chaque phase : moyenne, p95, p99 et maximum du temps par image (ms).
+Les résultats peuvent être enregistrés comme référence, puis comparés :
+    python benchmark.py --save benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json
+Le code de sortie vaut 1 si une phase est plus lente que la référence au-delà du seuil.
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+from settings import SIM_DT
+from replay import LiveInput, TickInput, KEY_LEFT, KEY_RIGHT
+from map import Map
+from player import Player
+from javelin import Javelin
+from monstre import MonsterSystem
+from animation import clips
+
+FRAME_TIME = 1 / 60 # Une image mesurée = les pas de simulation d'1/60 s, puis un dessin
+LOAD_REPEAT = 5 # Nombre de chargements de la carte mesurés
+
+
+class PhaseStats:
+    """
+    Temps par image d'une phase (somme des appels pendant l'image).
+    """
+    def __init__(self):
+        self.samples = []
+        self.current = 0.0
+
+    def add(self, duration):
+        self.current += duration
+
+    def end_frame(self):
+        self.samples.append(self.current)
+        self.current = 0.0
+
+    def summary(self):
+        """ Moyenne, p95, p99 et maximum en millisecondes. """
+        values = sorted(self.samples)
+        if not values:
+            return {"mean": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        def percentile(p):
+            return values[max(0, math.ceil(p * len(values)) - 1)]
+        return {"mean": 1000 * sum(values) / len(values), "p95": 1000 * percentile(0.95),
+                "p99": 1000 * percentile(0.99), "max": 1000 * values[-1]}
+
+
+class Instrument:
+    """
+    Remplace temporairement des méthodes de classes par des versions chronométrées.
+    """
+    def __init__(self):
+        self.originals = []
+
+    def wrap(self, cls, name, stats):
+        original = getattr(cls, name)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                stats.add(time.perf_counter() - start)
+        setattr(cls, name, timed)
+        self.originals.append((cls, name, original))
+
+    def restore(self):
+        for cls, name, original in reversed(self.originals):
+            setattr(cls, name, original)
+        self.originals.clear()
+
+
+class ScriptedInput(LiveInput):
+    """
+    Entrées produites par une fonction de scénario : script(pas, game_state) -> TickInput.
+    """
+    def __init__(self, script):
+        super().__init__()
+        self.script = script
+        self.step = 0
+        self.game_state = None
+
+    def start(self, level):
+        super().start(level)
+        self.step = 0
+
+    def next_tick(self):
+        tick = self.script(self.step, self.game_state)
+        self.step += 1
+        return tick
+
+
+# --- Scénarios : (préparation du niveau, script des entrées) ---
+
+def make_invulnerable(game_state):
+    """ Le joueur ne meurt pas : le scénario va jusqu'au bout. """
+    game_state.player.die = lambda: None
+
+def script_idle(step, game_state):
+    return TickInput()
+
+def setup_climb(game_state):
+    make_invulnerable(game_state)
+
+def script_climb(step, game_state):
+    # Le joueur est déplacé du bas vers le haut de la carte (la caméra et le rendu suivent)
+    player = game_state.player
+    top = game_state.end_y + 300 # Reste sous le portail de fin
+    progress = min(1.0, step / max(1, game_state.benchmark_steps - 1))
+    player.rect.midbottom = (game_state.map.width // 2, round(game_state.start_y + (top - game_state.start_y) * progress))
+    player.sync_position()
+    player.vel.update(0, 0)
+    return TickInput(KEY_RIGHT if (step // 120) % 2 else KEY_LEFT)
+
+def setup_javelin_spam(game_state):
+    make_invulnerable(game_state)
+
+def script_javelin_spam(step, game_state):
+    # Lance le javelot (ou le rappelle s'il est planté) toutes les 10 pas, vers des cibles variées
+    if step % 10:
+        return TickInput()
+    cx, cy = game_state.player.rect.center
+    angle = math.radians((step * 37) % 180)
+    return TickInput(throws=[(cx + round(400 * math.cos(angle)), cy - round(300 * math.sin(angle)))])
+
+def setup_zombies(game_state, count=200):
+    """
+    Ajoute des zombies posés sur des tuiles solides, répartis sur toute la carte.
+    S'il y a plus de zombies que de tuiles, plusieurs zombies partagent une tuile.
+    """
+    make_invulnerable(game_state)
+    grid = game_state.map.collision_grid
+    rng = random.Random(1234)
+    walk_clip = clips.get("zombie_walk")
+    death_clip = clips.get("zombie_death")
+    spots = [(col, row) for row in range(2, grid.rows) for col in range(grid.columns)
+             if grid.is_solid(col, row) and not grid.is_solid(col, row - 1) and not grid.is_solid(col, row - 2)]
+    chosen = rng.sample(spots, count) if count <= len(spots) else [rng.choice(spots) for _ in range(count)]
+    spawns = [(col * grid.tile_width, row * grid.tile_height - 38, 60, rng.randint(60, 200)) for col, row in chosen]
+    game_state.monsters.add_many(spawns, walk_clip, death_clip)
+
+def setup_horde(game_state):
+    setup_zombies(game_state, count=3000)
+
+def script_zombies(step, game_state):
+    # Le joueur monte à travers la carte pour faire défiler les zombies à l'écran
+    return script_climb(step, game_state)
+
+SCENARIOS = {
+    "idle": (None, script_idle),
+    "climb": (setup_climb, script_climb),
+    "javelin_spam": (setup_javelin_spam, script_javelin_spam),
+    "zombies": (setup_zombies, script_zombies),
+    "horde": (setup_horde, script_zombies),
+}
+
+
+def bench_load(game_state, map_path):
+    """ Mesure le chargement de la carte (Map puis load_map_objects). """
+    stats = {"map_load": PhaseStats(), "load_map_objects": PhaseStats()}
+    for _ in range(LOAD_REPEAT):
+        start = time.perf_counter()
+        level_map = Map(game_state, map_path)
+        stats["map_load"].add(time.perf_counter() - start)
+        start = time.perf_counter()
+        level_map.load_map_objects()
+        stats["load_map_objects"].add(time.perf_counter() - start)
+        for phase in stats.values():
+            phase.end_frame()
+    return {name: phase.summary() for name, phase in stats.items()}
+
+
+def bench_scenario(game, name, frames, warmup=0):
+    """
+    Joue un scénario pendant 'frames' images et retourne le résumé de chaque phase.
+    :param warmup: Nombre d'images jouées au début sans être mesurées (caches, blocs de carte).
+    """
+    setup, script = SCENARIOS[name]
+    input_source = ScriptedInput(script)
+    game.input_source = input_source
+    game.state_manager.set_state("game")
+    game_state = game.state_manager.get_active_state()
+    input_source.game_state = game_state
+    steps_per_frame = max(1, round(FRAME_TIME / SIM_DT))
+    game_state.benchmark_steps = (warmup + frames) * steps_per_frame
+    if setup:
+        setup(game_state)
+
+    phases = {name: PhaseStats() for name in
+              ("frame", "update", "draw", "map_render", "player_collision", "javelin_update", "monster_update")}
+    instrument = Instrument()
+    instrument.wrap(Map, "render", phases["map_render"])
+    instrument.wrap(Player, "move_x", phases["player_collision"])
+    instrument.wrap(Player, "move_y", phases["player_collision"])
+    instrument.wrap(Javelin, "update", phases["javelin_update"])
+    instrument.wrap(MonsterSystem, "update", phases["monster_update"])
+    try:
+        for frame in range(warmup + frames):
+            if game.state_manager.get_active_state() is not game_state:
+                print(f"  Scénario '{name}' interrompu (changement d'état).")
+                break
+            pg.event.pump()
+            frame_start = time.perf_counter()
+            for _ in range(steps_per_frame):
+                game_state.update(SIM_DT)
+            update_end = time.perf_counter()
+            game_state.draw(game.screen)
+            frame_end = time.perf_counter()
+            phases["update"].add(update_end - frame_start)
+            phases["draw"].add(frame_end - update_end)
+            phases["frame"].add(frame_end - frame_start)
+            for phase in phases.values():
+                if frame < warmup:
+                    phase.current = 0.0
+                else:
+                    phase.end_frame()
+    finally:
+        instrument.restore()
+        game.state_manager.set_state("menu")
+    return {phase_name: phase.summary() for phase_name, phase in phases.items()}
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare les résultats à la référence (moyenne et p95 de chaque phase).
+    :return: Liste des régressions (scénario, phase, mesure, référence, actuel).
+    """
+    regressions = []
+    for scenario, phases in results.items():
+        for phase, values in phases.items():
+            reference = baseline.get(scenario, {}).get(phase)
+            if not reference:
+                continue
+            for metric in ("mean", "p95"):
+                # Les phases très courtes (< 0,05 ms) sont trop bruitées pour être comparées
+                if reference[metric] >= 0.05 and values[metric] > reference[metric] * (1 + threshold):
+                    regressions.append((scenario, phase, metric, reference[metric], values[metric]))
+    return regressions
+
+
+def print_results(results, baseline=None):
+    print(f"{'scénario':<14}{'phase':<20}{'moyenne':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for scenario, phases in results.items():
+        for phase, values in phases.items():
+            line = f"{scenario:<14}{phase:<20}" + "".join(f"{values[m]:>9.3f}" for m in ("mean", "p95", "p99", "max"))
+            reference = (baseline or {}).get(scenario, {}).get(phase)
+            if reference and reference["mean"] > 0:
+                line += f"  {100 * (values['mean'] / reference['mean'] - 1):+.1f}%"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure les performances du jeu sur des scénarios scriptés.")
+    parser.add_argument("--frames", type=int, default=600, help="Nombre d'images mesurées par scénario")
+    parser.add_argument("--warmup", type=int, default=30, help="Images jouées avant la mesure")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scénario à jouer (répétable, par défaut tous)")
+    parser.add_argument("--baseline", metavar="FICHIER", help="Référence JSON à laquelle comparer les résultats")
+    parser.add_argument("--save", metavar="FICHIER", help="Enregistre les résultats comme référence JSON")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Ralentissement toléré par rapport à la référence (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    import main as game_main # Après la configuration du pilote vidéo
+    game = game_main.Game()
+    results = {}
+
+    game.state_manager.set_state("game")
+    game_state = game.state_manager.get_active_state()
+    map_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "TileMap", "game_map.tmx")
+    results["load"] = bench_load(game_state, map_path)
+
+    for name in args.scenario or list(SCENARIOS):
+        print(f"Scénario '{name}' ({args.frames} images)...")
+        results[name] = bench_scenario(game, name, args.frames, args.warmup)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        print(f"Référence enregistrée: {args.save}")
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for scenario, phase, metric, reference, value in regressions:
+            print(f"RÉGRESSION {scenario}/{phase} {metric}: {reference:.3f} ms -> {value:.3f} ms")
+        if regressions:
+            return 1
+        print("Aucune régression par rapport à la référence.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# build_atlas.py
+"""
+Étape de build : regroupe les petites images du dossier Sprites/ dans un ou
+plusieurs atlas (grandes images) accompagnés d'un index JSON.
+Au lancement du jeu, le gestionnaire d'assets (assets.py) découpe les sprites
+dans l'atlas au lieu d'ouvrir un fichier par image.
+
+A relancer après chaque ajout ou modification d'un sprite :
+    python build_atlas.py
+"""
+import os
+import sys
+import json
+import math
+import argparse
+import pygame as pg
+
+SPRITES_DIR = "Sprites"
+ATLAS_DIR = os.path.join(SPRITES_DIR, "atlas")
+ATLAS_INDEX_NAME = "atlas.json"
+ATLAS_PADDING = 1 # Pixels vides entre deux sprites (évite les débordements au filtrage)
+
+
+def pack_shelves(sizes, width, max_size, padding):
+    """
+    Range des rectangles dans des pages par étagères (shelf packing).
+    Les rectangles sont triés du plus haut au plus bas, puis placés de gauche
+    à droite ; une nouvelle étagère commence quand la ligne est pleine, une
+    nouvelle page quand la page est pleine.
+    :param sizes: Dictionnaire nom -> (largeur, hauteur).
+    :param width: Largeur d'une étagère (pixels).
+    :param max_size: Hauteur maximale (en pixels) d'une page.
+    :param padding: Espace entre deux rectangles.
+    :return: (placements nom -> (page, x, y), liste des tailles de pages utilisées).
+    """
+    shelf_width = width
+    placements = {}
+    pages = [] # [largeur utilisée, hauteur utilisée] par page
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+
+    page = 0
+    x = y = shelf_height = 0
+    pages.append([0, 0])
+    for name in order:
+        width, height = sizes[name]
+        if width > shelf_width or height > max_size:
+            raise ValueError(f"Le sprite '{name}' ({width}x{height}) dépasse la taille d'une page.")
+        if x + width > shelf_width: # Étagère pleine : on passe à la suivante
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > max_size: # Page pleine : on passe à la suivante
+            page += 1
+            pages.append([0, 0])
+            x = y = shelf_height = 0
+        placements[name] = (page, x, y)
+        pages[page][0] = max(pages[page][0], x + width)
+        pages[page][1] = max(pages[page][1], y + height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements, pages
+
+
+def build_atlas(sprites_dir=SPRITES_DIR, atlas_dir=ATLAS_DIR, max_size=1024, padding=ATLAS_PADDING):
+    """
+    Construit les pages d'atlas et l'index JSON à partir des .png de sprites_dir.
+    :return: Chemin de l'index écrit.
+    """
+    names = sorted(name for name in os.listdir(sprites_dir) if name.lower().endswith(".png"))
+    images = {name: pg.image.load(os.path.join(sprites_dir, name)) for name in names}
+    sizes = {name: image.get_size() for name, image in images.items()}
+
+    # Largeur des pages : puissance de 2 proche d'un carré contenant tous les sprites
+    area = sum((width + padding) * (height + padding) for width, height in sizes.values())
+    widest = max(width for width, _ in sizes.values())
+    shelf_width = min(max_size, max(widest, 2 ** math.ceil(math.log2(max(1, math.sqrt(area))))))
+    placements, pages = pack_shelves(sizes, shelf_width, max_size, padding)
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    page_surfaces = [pg.Surface((width, height), pg.SRCALPHA, 32) for width, height in pages]
+    for surface in page_surfaces:
+        surface.fill((0, 0, 0, 0))
+
+    index = {"version": 1, "pages": [], "sprites": {}}
+    for name, (page, x, y) in placements.items():
+        page_surfaces[page].blit(images[name], (x, y))
+        width, height = sizes[name]
+        # Clé : chemin du sprite tel qu'il est demandé par le jeu (ex. "Sprites/Zombie1.png")
+        index["sprites"][f"{sprites_dir}/{name}"] = [page, x, y, width, height]
+
+    for page, surface in enumerate(page_surfaces):
+        page_name = f"atlas_{page}.png"
+        pg.image.save(surface, os.path.join(atlas_dir, page_name))
+        index["pages"].append(f"{atlas_dir}/{page_name}".replace(os.sep, "/"))
+
+    # Un sprite par ligne pour garder des diffs lisibles
+    index_path = os.path.join(atlas_dir, ATLAS_INDEX_NAME)
+    sprite_lines = [f"  {json.dumps(path)}: {json.dumps(region)}" for path, region in sorted(index["sprites"].items())]
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(f' "version": {index["version"]},\n')
+        f.write(f' "pages": {json.dumps(index["pages"])},\n')
+        f.write(' "sprites": {\n' + ",\n".join(sprite_lines) + "\n }\n}\n")
+
+    print(f"{len(placements)} sprites regroupés dans {len(page_surfaces)} atlas "
+          f"({', '.join(f'{w}x{h}' for w, h in pages)}) -> {index_path}")
+    return index_path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Regroupe les sprites dans des atlas.")
+    parser.add_argument("--max-size", type=int, default=1024, help="Taille maximale d'une page d'atlas (pixels)")
+    parser.add_argument("--padding", type=int, default=ATLAS_PADDING, help="Espace entre deux sprites (pixels)")
+    args = parser.parse_args()
+    build_atlas(max_size=args.max_size, padding=args.padding)
+    sys.exit(0)
@@ -21,6 +21,16 @@ class Camera:
         """
         return entity_rect.move(self.camera_rect.topleft)
 
+    def get_view_rect(self, margin=0):
+        """
+        Retourne le rectangle du monde actuellement visible à l'écran,
+        agrandi de 'margin' pixels de chaque côté.
+        """
+        view_rect = pg.Rect(-self.camera_rect.x, -self.camera_rect.y, WIDTH, HEIGHT)
+        if margin:
+            view_rect.inflate_ip(2 * margin, 2 * margin)
+        return view_rect
+
     def update(self, target_rect):
         """
         Mettre à jour la position de la caméra pour qu'elle soit centrée sur la cible (target_rect) 
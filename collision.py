@@ -0,0 +1,90 @@
+# collision.py
+"""
+Collisions continues (swept AABB) contre la géométrie solide.
+
+Au lieu de déplacer un rectangle puis de tester s'il chevauche un obstacle
+(ce qui laisse passer à travers les obstacles fins aux grandes vitesses), on
+calcule l'instant du premier contact le long du déplacement : l'objet s'arrête
+exactement au point d'impact, quelle que soit sa vitesse ou la fréquence de
+simulation. Les positions sont en flottants ; les obstacles sont des pg.Rect.
+"""
+import math
+import pygame as pg
+
+def get_swept_rect(x, y, width, height, dx, dy):
+    """
+    Rectangle entier couvrant tout le trajet d'une boîte (x, y, width, height)
+    déplacée de (dx, dy) : zone à interroger pour trouver les obstacles possibles.
+    """
+    left = math.floor(min(x, x + dx))
+    top = math.floor(min(y, y + dy))
+    right = math.ceil(max(x, x + dx) + width)
+    bottom = math.ceil(max(y, y + dy) + height)
+    return pg.Rect(left, top, right - left, bottom - top)
+
+
+def sweep_axis(start, size, delta, obstacles, axis):
+    """
+    Déplacement le long d'un seul axe, arrêté au premier obstacle rencontré.
+    Les obstacles doivent déjà chevaucher la boîte sur l'autre axe. Un obstacle que
+    la boîte chevauche déjà, mais qui commence devant son bord arrière, la repousse
+    contre lui (correction bornée : un seul recul, jamais de boucle).
+    :param start: Position de départ du bord gauche (axis=0) ou haut (axis=1).
+    :param size: Largeur ou hauteur de la boîte.
+    :param delta: Déplacement voulu.
+    :param obstacles: Rectangles solides.
+    :param axis: 0 pour l'axe X, 1 pour l'axe Y.
+    :return: (nouvelle position, rectangle touché ou None).
+    """
+    end = start + delta
+    hit = None
+    for obstacle in obstacles:
+        near = obstacle.left if axis == 0 else obstacle.top
+        far = obstacle.right if axis == 0 else obstacle.bottom
+        if delta > 0 and near > start:
+            if near - size < end:
+                end = near - size
+                hit = obstacle
+        elif delta < 0 and far < start + size:
+            if far > end:
+                end = far
+                hit = obstacle
+    return end, hit
+
+
+def sweep_box(x, y, width, height, dx, dy, obstacles):
+    """
+    Instant du premier contact d'une boîte déplacée de (dx, dy) avec des obstacles
+    (swept AABB, les deux axes à la fois).
+    :return: (t, rectangle touché) avec t entre 0 et 1 la fraction du déplacement
+             effectuée avant le contact, ou (1.0, None) si rien n'est touché.
+             Une boîte qui chevauche déjà un obstacle le touche à t = 0.
+    """
+    best_t = 1.0
+    hit = None
+    for obstacle in obstacles:
+        entry_x, exit_x = get_axis_times(x, width, dx, obstacle.left, obstacle.right)
+        entry_y, exit_y = get_axis_times(y, height, dy, obstacle.top, obstacle.bottom)
+        entry = max(entry_x, entry_y)
+        exit = min(exit_x, exit_y)
+        if entry >= exit or exit <= 0:
+            continue # Jamais en contact pendant le déplacement (ou déjà dépassé)
+        entry = max(0.0, entry)
+        if entry < best_t:
+            best_t = entry
+            hit = obstacle
+    return best_t, hit
+
+
+def get_axis_times(start, size, delta, near, far):
+    """
+    Intervalle de temps (fractions du déplacement) pendant lequel le segment
+    [start, start + size] chevauche [near, far] sur un axe.
+    """
+    if delta == 0:
+        if start < far and start + size > near:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
+    if delta > 0:
+        return (near - (start + size)) / delta, (far - start) / delta
+    return (far - start) / delta, (near - (start + size)) / delta
@@ -1,7 +1,54 @@
 import pygame as pg
-import pygame.mixer
 import math
-from settings import JAVELIN_SPEED, JAVELIN_GRAVITY, JAVELIN_RECALL_SPEED, TILE_SIZE
+from settings import JAVELIN_SPEED, JAVELIN_GRAVITY, JAVELIN_RECALL_SPEED, JAVELIN_CATCH_DISTANCE, TILE_SIZE, JAVELIN_ROTATION_STEP, JAVELIN_TIP_SIZE
+from assets import assets
+from collision import get_swept_rect, sweep_box
+from audio import audio, PRIORITY_LOW
+
+JAVELIN_IMAGE = "Sprites/javelot.png"
+JAVELIN_HIT_SOUND = "Sound/Lance.wav"
+
+
+class RotationCache:
+    """
+    Images pré-tournées d'une surface à des angles quantifiés.
+    Chaque image est accompagnée de sa taille et de son demi-décalage,
+    pour placer le rectangle autour du centre sans recalcul.
+    """
+    def __init__(self, image, step=JAVELIN_ROTATION_STEP):
+        """
+        Pré-calcule les rotations de l'image.
+        :param image: Surface d'origine (orientée à 0°).
+        :param step: Pas entre deux angles, en degrés.
+        """
+        self.source = image
+        self.count = max(1, round(360 / step))
+        self.step = 360 / self.count
+        self.frames = [] # (image, largeur, hauteur, demi-largeur, demi-hauteur)
+        for index in range(self.count):
+            rotated = pg.transform.rotate(image, index * self.step)
+            width, height = rotated.get_size()
+            self.frames.append((rotated, width, height, width // 2, height // 2))
+
+    def get(self, angle):
+        """
+        Retourne l'image pré-tournée la plus proche de l'angle donné (en degrés).
+        """
+        return self.frames[round(angle / self.step) % self.count]
+
+
+# Caches de rotation partagés par tous les javelots, par image source
+rotation_caches = {}
+
+def get_rotation_cache(image):
+    """
+    Retourne le cache de rotation d'une image, en le créant au premier appel.
+    """
+    cache = rotation_caches.get(id(image))
+    if cache is None or cache.source is not image:
+        cache = rotation_caches[id(image)] = RotationCache(image)
+    return cache
+
 
 class Javelin(pg.sprite.Sprite):
     """
@@ -18,15 +65,16 @@ class Javelin(pg.sprite.Sprite):
         self.game_state = game_state
         self.player = player  # Le propriétaire du javelot
 
-        # Chargement de l'image du javelot
+        # Chargement de l'image du javelot (partagée, chargée une seule fois)
         try:
-            self.original_image = pg.image.load("Sprites/javelot.png").convert_alpha()
-        except pg.error as e:
+            self.original_image = assets.get_image(JAVELIN_IMAGE)
+        except (pg.error, FileNotFoundError) as e:
             print(f"Erreur: Impossible de charger 'Sprites/javelot.png': {e}")
             self.original_image = pg.Surface((TILE_SIZE, TILE_SIZE // 4))  # Fallback
             self.original_image.fill((100, 100, 100))  # Gris foncé
 
-        self.image = self.original_image.copy()
+        self.rotation_cache = get_rotation_cache(self.original_image)
+        self.image = self.original_image
         self.rect = self.image.get_rect()
 
         # Calcul de la direction initiale
@@ -39,12 +87,13 @@ class Javelin(pg.sprite.Sprite):
         self.pos = pg.math.Vector2(player.rect.center) + spawn_offset
         self.rect.center = self.pos
 
-        # Calcul de la vélocité initiale
+        # Calcul de la vélocité initiale (pixels par seconde)
         self.vel = direction_vector.normalize() * JAVELIN_SPEED
 
         # État du javelot: 'flying', 'stuck', 'returning'
         self.state = 'flying'
         self.stuck_angle = 0  # Angle auquel le javelot est planté
+        self.can_hit = False  # Vrai si le javelot a volé pendant la dernière mise à jour (peut toucher un monstre)
 
         self.rotate()  # Oriente le javelot initialement
 
@@ -60,43 +109,25 @@ class Javelin(pg.sprite.Sprite):
             self.stuck_angle = math.degrees(angle_rad) # Met à jour l'angle pour le cas où il se plante
         
         # La rotation se fait depuis le centre, donc on sauvegarde et restaure le centre.
-        center_before_rotation = self.rect.center
-        self.image = pg.transform.rotate(self.original_image, self.stuck_angle)
-        self.rect = self.image.get_rect(center=center_before_rotation)
-
-    def update(self, dt): # dt (delta time) n'est pas utilisé ici pour rester simple, mais serait utile pour des FPS variables
-        """ Met à jour la position et l'état du javelot. """
+        # L'image est choisie parmi les rotations pré-calculées (aucune allocation par frame).
+        center_x, center_y = self.rect.center
+        self.image, width, height, half_width, half_height = self.rotation_cache.get(self.stuck_angle)
+        self.rect = pg.Rect(center_x - half_width, center_y - half_height, width, height)
+
+    def update(self, dt):
+        """ Met à jour la position et l'état du javelot (dt : durée du pas en secondes). """
+        self.can_hit = self.state == 'flying'
         if self.state == 'flying':
             # Équation de trajectoire (Mouvement d'un projectile)
             # 1. Appliquer la gravité à la vélocité verticale
-            self.vel.y += JAVELIN_GRAVITY
-            
-            # 2. Mettre à jour la position basée sur la vélocité
-            self.pos += self.vel # pos.x += vel.x; pos.y += vel.y
-            self.rect.center = self.pos
+            self.vel.y += JAVELIN_GRAVITY * dt
             
-            self.rotate() # Réorienter le javelot en vol
-
-            # --- Détection collision avec zombies ---
-            if hasattr(self.game_state, "monsters"):
-                for monster in self.game_state.monsters:
-                    if not getattr(monster, "is_dead", False) and self.rect.colliderect(monster.rect):
-                        # Animation de mort du zombie
-                        # Charge les sprites de mort (à adapter selon vos assets)
-                        try:
-                            death_imgs = [
-                                pg.image.load("Sprites/Zombie_dead1.png").convert_alpha(),
-                                pg.image.load("Sprites/Zombie_dead2.png").convert_alpha(),
-                                pg.image.load("Sprites/Zombie_dead3.png").convert_alpha(),
-                            ]
-                        except Exception:
-                            death_imgs = [monster.image]
-                        monster.die(death_imgs)
-                        # Empêche la collision avec le joueur (optionnel: retire du groupe monsters)
-                        self.game_state.monsters.remove(monster)
-                        break
-
-            self.check_collision_walls()
+            self.rotate() # Réorienter le javelot selon sa nouvelle vélocité
+
+            # 2. Avancer jusqu'au premier mur sur la trajectoire (ou de tout le pas)
+            # La collision avec les zombies est détectée par le GameState (broadphase),
+            # qui appelle hit_monster pour chaque zombie touché.
+            self.check_collision_walls(self.vel * dt)
 
         elif self.state == 'stuck':
             # Le javelot ne bouge plus et ne tourne plus une fois planté.
@@ -105,45 +136,63 @@ class Javelin(pg.sprite.Sprite):
 
         elif self.state == 'returning':
             direction_to_player = pg.math.Vector2(self.player.rect.center) - self.pos
-            if direction_to_player.length_squared() < (JAVELIN_RECALL_SPEED * JAVELIN_RECALL_SPEED /4) : # Proche du joueur
+            # Rattrapé s'il est proche du joueur ou s'il l'atteindrait pendant ce pas (pas de dépassement)
+            catch_distance = max(JAVELIN_CATCH_DISTANCE, JAVELIN_RECALL_SPEED * dt)
+            if direction_to_player.length_squared() <= catch_distance * catch_distance:
                 self.player.retrieve_javelin() # Notifie le joueur
                 self.kill() # Se supprime de tous les groupes
                 return
 
             self.vel = direction_to_player.normalize() * JAVELIN_RECALL_SPEED
-            self.pos += self.vel
+            self.pos += self.vel * dt
             self.rect.center = self.pos
             self.rotate() # S'oriente vers le joueur pendant le retour
 
-    def check_collision_walls(self):
-        """ Vérifie la collision avec les plateformes (murs). """
-        collided_platforms = pg.sprite.spritecollide(self, self.game_state.platforms, False)
-        if collided_platforms:
+    def hit_monster(self, monster):
+        """ Tue un monstre touché par le javelot en vol. """
+        # Animation de mort du zombie : il ne touche plus ni le joueur ni les javelots
+        monster.die()
+
+    def check_collision_walls(self, step):
+        """
+        Déplace le javelot de 'step' en vérifiant la collision avec les murs (grille de collision)
+        et les autres plateformes sur toute la trajectoire (swept AABB) : c'est la pointe qui se
+        plante, exactement au point d'impact.
+        """
+        # Pointe : à une demi-longueur du centre, dans la direction du vol (l'image d'origine est horizontale)
+        direction = pg.math.Vector2(1, 0).rotate(-self.stuck_angle)
+        tip = self.pos + direction * (self.original_image.get_width() / 2)
+        x, y = tip.x - JAVELIN_TIP_SIZE / 2, tip.y - JAVELIN_TIP_SIZE / 2
+        swept = get_swept_rect(x, y, JAVELIN_TIP_SIZE, JAVELIN_TIP_SIZE, step.x, step.y)
+        t, hit = sweep_box(x, y, JAVELIN_TIP_SIZE, JAVELIN_TIP_SIZE, step.x, step.y,
+                           self.game_state.get_solid_rects(swept))
+        self.pos += step * t
+        self.rect.center = self.pos
+        if hit:
             # Le javelot a touché un mur/plateforme
             self.state = 'stuck'
 
-            # Jouer le son Lance.wav
-            try:
-                lance_sound = pg.mixer.Sound("Sound/Lance.wav")
-                lance_sound.play()
-            except pg.error as e:
-                print(f"Erreur: Impossible de jouer le son 'Sound/Lance.wav': {e}")
+            # Jouer le son Lance.wav (préchargé avec le niveau) ; fréquent, il cède sa voix aux autres sons
+            audio.play(JAVELIN_HIT_SOUND, PRIORITY_LOW)
 
             # Ajoute ce javelot au groupe des plateformes
             self.game_state.platforms.add(self)
 
-            # Vérifie si le joueur chevauche le javelot et ajuste sa position
-            while self.player.rect.colliderect(self.rect):
-                if self.player.vel.y > 0:  # Descending
-                    self.player.rect.bottom = self.rect.top
-                    self.player.vel.y = 0
-                    self.player.on_ground = True
-                elif self.player.vel.y < 0:  # Ascending
-                    self.player.rect.top = self.rect.bottom
-                    self.player.vel.y = 0
-                else:
-                    # If the player is stationary, nudge them out of the collision
-                    self.player.rect.y += 1  # Push the player downward slightly
+            # Si le joueur chevauche le javelot, il en est sorti en une seule correction
+            self.player.push_out_of(self.rect)
+
+    def restore(self, state, pos, vel, stuck_angle):
+        """
+        Place le javelot dans un état donné (point de contrôle, voir snapshot.py).
+        Les groupes dont il fait partie sont gérés par l'appelant.
+        """
+        self.state = state
+        self.pos = pg.math.Vector2(pos)
+        self.vel = pg.math.Vector2(vel)
+        self.stuck_angle = stuck_angle
+        self.can_hit = False
+        self.rect.center = self.pos
+        self.rotate()
 
     def recall(self):
         """ Commence le processus de rappel du javelot. """
@@ -0,0 +1,218 @@
+import os
+import pickle
+import hashlib
+from array import array
+import pytmx
+
+# Version du format compilé : à incrémenter à chaque changement de structure
+LEVEL_CACHE_VERSION = 1
+LEVEL_CACHE_EXTENSION = ".lvl"
+
+
+def greedy_mesh(solid, columns, rows):
+    """
+    Fusionne les tuiles solides adjacentes en rectangles maximaux.
+    Les tuiles sont d'abord regroupées en segments horizontaux sur chaque ligne,
+    puis les segments identiques de lignes consécutives sont fusionnés verticalement.
+    :param solid: Liste de lignes de booléens, solid[ligne][colonne].
+    :param columns, rows: Dimensions de la grille en tuiles.
+    :return: Liste de rectangles (colonne, ligne, largeur, hauteur) en tuiles.
+    """
+    rects = []
+    open_rects = {} # (colonne de début, largeur) -> indice du rectangle prolongeable à la ligne suivante
+    for row in range(rows):
+        # 1. Segments horizontaux de la ligne
+        runs = []
+        col = 0
+        while col < columns:
+            if solid[row][col]:
+                start = col
+                while col < columns and solid[row][col]:
+                    col += 1
+                runs.append((start, col - start))
+            else:
+                col += 1
+
+        # 2. Fusion verticale avec les segments identiques de la ligne précédente
+        next_open_rects = {}
+        for run in runs:
+            index = open_rects.get(run)
+            if index is not None:
+                col, top, width, height = rects[index]
+                rects[index] = (col, top, width, height + 1)
+            else:
+                index = len(rects)
+                rects.append((run[0], row, run[1], 1))
+            next_open_rects[run] = index
+        open_rects = next_open_rects
+    return rects
+
+
+def get_cache_path(filename):
+    """
+    Retourne le chemin du fichier compilé associé à un fichier .tmx.
+    """
+    return os.path.splitext(filename)[0] + LEVEL_CACHE_EXTENSION
+
+
+def hash_file(filename):
+    """
+    Retourne l'empreinte SHA-1 du contenu d'un fichier.
+    """
+    with open(filename, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def compile_level(filename, collidable_layer_names):
+    """
+    Analyse un fichier TMX avec pytmx (sans charger les images) et le convertit
+    en un niveau compilé : tableaux de tuiles, rectangles de collision, objets
+    et références aux tilesets.
+    :param filename: Chemin vers le fichier .tmx.
+    :param collidable_layer_names: Noms des calques de tuiles qui génèrent des collisions.
+    :return: Dictionnaire du niveau compilé.
+    """
+    tmx_data = pytmx.TiledMap(filename)
+    columns = tmx_data.width
+    rows = tmx_data.height
+
+    # Tilesets : chemin de l'image (relatif au .tmx) et couleur de transparence éventuelle
+    tilesets = []
+    for tileset in tmx_data.tilesets:
+        tilesets.append({
+            "source": tileset.source,
+            "colorkey": getattr(tileset, "trans", None),
+        })
+
+    # Table des tuiles utilisées, indexée par le GID interne de pytmx :
+    # (indice du tileset, rectangle dans l'image, retournements)
+    tiles = [None] * tmx_data.maxgid
+    for index, tileset in enumerate(tmx_data.tilesets):
+        if tileset.source is None:
+            continue
+        positions = [(x, y)
+                     for y in range(tileset.margin, tileset.height + tileset.margin - tileset.tileheight + 1,
+                                    tileset.tileheight + tileset.spacing)
+                     for x in range(tileset.margin, tileset.width + tileset.margin - tileset.tilewidth + 1,
+                                    tileset.tilewidth + tileset.spacing)]
+        for real_gid, (x, y) in enumerate(positions, tileset.firstgid):
+            for gid, flags in tmx_data.map_gid(real_gid) or ():
+                tiles[gid] = (index, (x, y, tileset.tilewidth, tileset.tileheight),
+                              (bool(flags.flipped_horizontally), bool(flags.flipped_vertically),
+                               bool(flags.flipped_diagonally)))
+
+    # Calques de tuiles, à plat (ligne * columns + colonne)
+    layers = []
+    solid = [[False] * columns for _ in range(rows)]
+    tile_count = 0
+    for layer in tmx_data.layers:
+        if not isinstance(layer, pytmx.TiledTileLayer):
+            continue
+        data = array('H', (gid for row in layer.data for gid in row))
+        layers.append({"name": layer.name, "visible": bool(layer.visible), "data": data})
+        if layer.name in collidable_layer_names:
+            for y, row in enumerate(layer.data):
+                for x, gid in enumerate(row):
+                    if gid != 0 and not solid[y][x]:
+                        solid[y][x] = True
+                        tile_count += 1
+
+    # Objets des calques d'objets (pics, portails, points d'apparition...)
+    objects = []
+    for group in tmx_data.objectgroups:
+        for obj in group:
+            objects.append({
+                "group": group.name,
+                "id": obj.id,
+                "name": obj.name,
+                "type": obj.type,
+                "x": obj.x,
+                "y": obj.y,
+                "width": obj.width,
+                "height": obj.height,
+                "properties": dict(obj.properties),
+            })
+
+    return {
+        "version": LEVEL_CACHE_VERSION,
+        "columns": columns,
+        "rows": rows,
+        "tile_width": tmx_data.tilewidth,
+        "tile_height": tmx_data.tileheight,
+        "tilesets": tilesets,
+        "tiles": tiles,
+        "layers": layers,
+        "collision_layers": list(collidable_layer_names),
+        "collision_rects": greedy_mesh(solid, columns, rows),
+        "solid_tile_count": tile_count,
+        "objects": objects,
+    }
+
+
+def save_compiled_level(cache_path, level):
+    """
+    Écrit un niveau compilé sur le disque (écriture atomique).
+    """
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(level, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+
+
+def read_compiled_level(cache_path):
+    """
+    Lit un niveau compilé, ou retourne None s'il est absent ou illisible.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            level = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(level, dict) or level.get("version") != LEVEL_CACHE_VERSION:
+        return None
+    return level
+
+
+def load_level(filename, collidable_layer_names):
+    """
+    Charge un niveau compilé depuis le cache s'il est valide, sinon recompile le
+    fichier TMX et met le cache à jour.
+    Le cache est valide si la date de modification du .tmx n'a pas changé, ou si
+    son contenu (empreinte SHA-1) est identique.
+    :param filename: Chemin vers le fichier .tmx.
+    :param collidable_layer_names: Noms des calques de tuiles qui génèrent des collisions.
+    :return: Dictionnaire du niveau compilé.
+    """
+    stat = os.stat(filename) # Lève FileNotFoundError si la carte n'existe pas
+    cache_path = get_cache_path(filename)
+    level = read_compiled_level(cache_path)
+
+    if level is not None and level["collision_layers"] == list(collidable_layer_names):
+        if level["source_mtime"] == stat.st_mtime_ns and level["source_size"] == stat.st_size:
+            return level
+        # Date modifiée (copie, checkout git...) : on vérifie le contenu avant de recompiler
+        source_hash = hash_file(filename)
+        if level["source_hash"] == source_hash:
+            level["source_mtime"] = stat.st_mtime_ns
+            try_save_compiled_level(cache_path, level)
+            return level
+    else:
+        source_hash = hash_file(filename)
+
+    print(f"Compilation du niveau '{os.path.basename(filename)}'...")
+    level = compile_level(filename, collidable_layer_names)
+    level["source_mtime"] = stat.st_mtime_ns
+    level["source_size"] = stat.st_size
+    level["source_hash"] = source_hash
+    try_save_compiled_level(cache_path, level)
+    return level
+
+
+def try_save_compiled_level(cache_path, level):
+    """
+    Sauvegarde le niveau compilé sans interrompre le jeu en cas d'échec (dossier en lecture seule...).
+    """
+    try:
+        save_compiled_level(cache_path, level)
+    except OSError as e:
+        print(f"Avertissement: Impossible d'écrire le cache du niveau '{cache_path}': {e}")
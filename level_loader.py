@@ -0,0 +1,127 @@
+# level_loader.py
+"""
+Chargement d'un niveau en arrière-plan, pendant que le jeu continue d'afficher
+autre chose (l'introduction).
+
+Un thread lit le niveau compilé (ou analyse le fichier TMX, voir level_cache.py)
+puis lit et décode les images dont le niveau a besoin. Une surface décodée ne peut
+être convertie au format de l'écran (convert / convert_alpha) que sur le thread
+principal : update() s'en charge, quelques images à la fois, dans un budget de
+temps fixe, pour ne jamais bloquer l'affichage.
+"""
+import os
+import time
+import threading
+import pygame as pg
+from settings import LEVEL_LOAD_STEP_BUDGET
+from level_cache import load_level
+from map import COLLIDABLE_LAYER_NAMES, get_tileset_images
+from assets import assets
+
+
+class LevelLoader:
+    """
+    Charge un niveau sur un thread de travail.
+    Étapes : lecture du niveau, décodage des images (thread), conversion des images
+    (thread principal, voir update). get_progress() donne l'avancement de 0 à 1.
+    """
+    def __init__(self):
+        self.path = None # Fichier .tmx en cours de chargement (ou chargé)
+        self.thread = None
+        self.level = None # Niveau compilé, une fois lu
+        self.error = None # Exception levée par le thread de travail
+        self.requests = [] # Images à préparer : (chemin, options de assets.get_image)
+        self.decoded = [] # (fichier, surface décodée), remplie par le thread de travail
+        self.decoded_count = 0 # Surfaces déjà transmises au gestionnaire d'assets
+        self.converted_count = 0 # Images déjà converties (thread principal)
+
+    @property
+    def started(self):
+        return self.thread is not None
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+    @property
+    def ready(self):
+        """ Vrai quand le niveau est lu et toutes ses images converties. """
+        return (self.level is not None and not self.thread.is_alive()
+                and self.converted_count == len(self.requests))
+
+    def start(self, path, image_requests):
+        """
+        Lance le chargement d'un niveau sur un thread de travail.
+        :param path: Chemin vers le fichier .tmx.
+        :param image_requests: Images utilisées par le niveau en dehors des tilesets,
+                               sous la forme (chemin, options de assets.get_image).
+        """
+        if assets.atlas is None:
+            assets.load_atlas() # Lu ici : le thread de travail ne fait que le consulter
+        self.path = path
+        self.level = None
+        self.error = None
+        self.requests = []
+        self.decoded = []
+        self.decoded_count = 0
+        self.converted_count = 0
+        self.thread = threading.Thread(target=self.run, args=(path, list(image_requests)),
+                                       name="level-loader", daemon=True)
+        self.thread.start()
+
+    def run(self, path, image_requests):
+        """ Thread de travail : lecture du niveau puis décodage des images (sans conversion). """
+        try:
+            level = load_level(path, COLLIDABLE_LAYER_NAMES)
+            tilesets = [(tile_path, {"colorkey": colorkey})
+                        for tile_path, colorkey in filter(None, get_tileset_images(level, os.path.dirname(path)))]
+            # Publiées avant le niveau : quand level est visible, la liste des images est complète
+            self.requests = tilesets + image_requests
+            self.level = level
+
+            seen = set()
+            for image_path, options in self.requests:
+                file_path = assets.get_file_path(image_path, **options)
+                if file_path in seen:
+                    continue
+                seen.add(file_path)
+                try:
+                    self.decoded.append((file_path, pg.image.load(file_path)))
+                except (pg.error, FileNotFoundError):
+                    pass # L'erreur sera signalée au chargement normal de l'image
+        except Exception as e:
+            self.error = e
+            print(f"Erreur lors du chargement en arrière-plan de '{path}': {e}")
+
+    def update(self, budget=LEVEL_LOAD_STEP_BUDGET):
+        """
+        Thread principal : transmet les images décodées au gestionnaire d'assets puis
+        les convertit, tant que le budget de temps (secondes) n'est pas épuisé.
+        :return: True si le niveau est prêt.
+        """
+        if self.thread is None or self.failed:
+            return False
+        while self.decoded_count < len(self.decoded):
+            assets.add_decoded(*self.decoded[self.decoded_count])
+            self.decoded_count += 1
+        if self.level is None or self.thread.is_alive():
+            return False # Toutes les images doivent être décodées avant d'être converties
+
+        deadline = time.perf_counter() + budget
+        while self.converted_count < len(self.requests) and time.perf_counter() < deadline:
+            image_path, options = self.requests[self.converted_count]
+            assets.preload([image_path], **options)
+            self.converted_count += 1
+        return self.ready
+
+    def get_progress(self):
+        """
+        Avancement du chargement, de 0 à 1 : lecture du niveau, décodage et conversion des images.
+        """
+        if self.thread is None:
+            return 0.0
+        if self.level is None:
+            return 0.0 if not self.failed else 1.0
+        total = 1 + 2 * len(self.requests)
+        decoded = len(self.requests) if not self.thread.is_alive() else len(self.decoded)
+        return min(1.0, (1 + decoded + self.converted_count) / total)
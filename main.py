@@ -5,54 +5,98 @@ Created on Sat Sep 21 21:58:26 2024
 @author: tomyj
 """
 import pygame as pg
+import os
 import sys
+import argparse
 from settings import *
 from statemanager import StateManager # Importer le StateManager
+from text import get_font
+from replay import Replay, LiveInput, RecordingInput, ReplayInput
+from profiler import FrameProfiler
+from audio import audio
 
 class Game:
     """
     Classe principale du jeu.
     Gère l'initialisation, la boucle de jeu, et délègue aux états via le StateManager.
     """
-    def __init__(self):
+    def __init__(self, record_path=None, replay_path=None, record_hashes=False):
         """
         Initialise Pygame, la fenêtre de jeu et les variables de base du jeu.
+        :param record_path: Fichier dans lequel enregistrer les entrées de la partie (replay).
+        :param replay_path: Replay à rejouer ; la partie démarre directement.
+        :param record_hashes: Enregistre aussi un hachage de l'état du monde à chaque pas.
         """
         pg.init() 
         pg.mixer.init() 
+        audio.init() # Canaux des effets sonores et volume de la musique
         self.screen = pg.display.set_mode((WIDTH, HEIGHT)) 
         pg.display.set_caption(TITLE) 
         self.clock = pg.time.Clock() 
         self.running = True # Variable pour contrôler la boucle principale du jeu
+        self.accumulator = 0.0 # Temps écoulé pas encore simulé (secondes)
+        self.time_scale = 1.0 # Vitesse de la simulation (2.0 = accéléré, 0.5 = ralenti)
         
         try:
-            self.font = pg.font.Font(None, 30) 
+            self.font = get_font(30)
         except Exception as e:
             print(f"Erreur lors de l'initialisation de la police: {e}")
             self.font = None 
 
+        # Profileur affiché avec F3 (inactif, et donc sans coût, par défaut)
+        self.profiler = FrameProfiler(self)
+
+        # Source des entrées du joueur, partagée par toutes les parties
+        if replay_path:
+            self.input_source = ReplayInput(Replay.load(replay_path))
+        elif record_path:
+            self.input_source = RecordingInput(record_path, record_hashes)
+        else:
+            self.input_source = LiveInput()
+
         # Initialisation du StateManager
         self.state_manager = StateManager(self) # Passe l'instance de Game au StateManager
+        if replay_path:
+            self.state_manager.set_state("spawn")
+        else:
+            # Les autres états sont créés pendant les premières images du menu
+            self.state_manager.prewarm(["intro", "game", "loading", "option", "pause", "outro"])
+
+    def reset_timing(self):
+        """
+        Oublie le temps écoulé depuis la dernière image (ex. après un chargement),
+        pour que la simulation ne le rattrape pas.
+        """
+        self.clock.tick()
+        self.accumulator = 0.0
 
     def run(self):
         """
         Boucle de jeu principale.
         S'exécute tant que self.running est True.
         Délègue la logique aux états via le StateManager.
+        La simulation avance par pas fixes de SIM_DT secondes, indépendamment du
+        nombre d'images par seconde ; l'affichage interpole entre les deux derniers pas.
         """
         pg.mouse.set_visible(False)  # Cache le curseur de la souris
-        while self.running:
-            dt = self.clock.tick(FPS) / 1000.0 # Delta-temps
+        while self.running and not self.input_source.finished:
+            frame_time = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME) # Delta-temps de l'image
+            self.accumulator += frame_time * self.time_scale
 
             # Gestion des événements via le StateManager
             events = pg.event.get() # Récupère tous les événements une fois par frame
+            for event in events:
+                if event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                    self.profiler.toggle()
             self.state_manager.handle_events(events)
 
-            # Mise à jour de la logique via le StateManager
-            self.state_manager.update(dt)
+            # Mise à jour de la logique via le StateManager, par pas fixes
+            while self.accumulator >= SIM_DT and self.running and not self.input_source.finished:
+                self.state_manager.update(SIM_DT)
+                self.accumulator -= SIM_DT
 
-            # Dessin via le StateManager
-            self.state_manager.draw(self.screen)
+            # Dessin via le StateManager, interpolé entre les deux derniers pas
+            self.state_manager.draw(self.screen, self.accumulator / SIM_DT)
 
             # Dessiner un cercle rouge à la position de la souris
             mouse_pos = pg.mouse.get_pos()
@@ -60,6 +104,17 @@ class Game:
             
             pg.display.flip() # Met à jour l'écran
 
+            # Prépare un état à l'avance (au plus un par image)
+            self.state_manager.prewarm_step()
+
+    def run_headless(self):
+        """
+        Simule le plus vite possible, sans affichage ni attente (relecture rapide d'un replay).
+        """
+        while self.running and not self.input_source.finished:
+            pg.event.pump()
+            self.state_manager.update(SIM_DT)
+
 class GameState:
     def __init__(self, game):
         self.game = game
@@ -99,8 +154,26 @@ class GameState:
         pass
 
 if __name__ == '__main__':
-    g = Game() 
-    g.run() # Lance la boucle principale du jeu
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--record", metavar="FICHIER", help="Enregistre les entrées de la partie dans un replay")
+    parser.add_argument("--hash", action="store_true", help="Ajoute au replay un hachage de l'état du monde à chaque pas")
+    parser.add_argument("--replay", metavar="FICHIER", help="Rejoue un replay enregistré")
+    parser.add_argument("--fast", action="store_true", help="Rejoue le replay sans fenêtre, le plus vite possible")
+    args = parser.parse_args()
+
+    if args.fast:
+        if not args.replay:
+            parser.error("--fast nécessite --replay")
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    g = Game(record_path=args.record, replay_path=args.replay, record_hashes=args.hash)
+    if args.fast:
+        g.run_headless()
+    else:
+        g.run() # Lance la boucle principale du jeu
+    if isinstance(g.input_source, ReplayInput):
+        print(g.input_source.get_summary())
     
     pg.quit() 
     sys.exit()
\ No newline at end of file
@@ -1,89 +1,315 @@
+import os
 import pygame as pg
-import pytmx
-from settings import TILE_SIZE 
+from array import array
+from collections import OrderedDict
+from settings import TILE_SIZE, CHUNK_SIZE, CHUNK_CACHE_MAX
+from level_cache import load_level
+from assets import assets
 
-class Platform(pg.sprite.Sprite):
+# Noms des calques de tuiles qui génèrent des collisions
+COLLIDABLE_LAYER_NAMES = ["Calque de Tuiles 1"]
+
+class CollisionGrid:
+    """
+    Grille d'occupation compacte des tuiles solides de la carte.
+    Chaque case contient 0 si elle est vide, sinon l'indice (+1) du rectangle
+    fusionné qui la couvre. Une collision ne consulte que les quelques cases
+    recouvertes par le rectangle testé, quel que soit le nombre de plateformes.
+    """
+    def __init__(self, columns, rows, tile_width, tile_height):
+        """
+        Initialise une grille vide.
+        :param columns, rows: Dimensions de la grille en tuiles.
+        :param tile_width, tile_height: Dimensions d'une tuile en pixels.
+        """
+        self.columns = columns
+        self.rows = rows
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.cells = array('H', bytes(2 * columns * rows)) # Indexée par ligne * columns + colonne
+        self.rects = [] # Rectangles de collision fusionnés, en pixels
+
+    def add_rect(self, col, row, width, height):
+        """
+        Ajoute un rectangle solide (en tuiles) et marque les cases qu'il couvre.
+        """
+        self.rects.append(pg.Rect(col * self.tile_width, row * self.tile_height,
+                                  width * self.tile_width, height * self.tile_height))
+        rect_id = len(self.rects)
+        for y in range(row, row + height):
+            start = y * self.columns + col
+            self.cells[start:start + width] = array('H', [rect_id] * width)
+
+    def is_solid(self, col, row):
+        """
+        Indique si la case (colonne, ligne) est solide. L'extérieur de la carte est vide.
+        """
+        if 0 <= col < self.columns and 0 <= row < self.rows:
+            return self.cells[row * self.columns + col] != 0
+        return False
+
+    def query(self, rect):
+        """
+        Retourne la liste des rectangles solides qui chevauchent le rectangle donné.
+        """
+        first_col = max(0, rect.left // self.tile_width)
+        last_col = min(self.columns - 1, (rect.right - 1) // self.tile_width)
+        first_row = max(0, rect.top // self.tile_height)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // self.tile_height)
+        if first_col > last_col or first_row > last_row:
+            return []
+
+        hits = {} # dict plutôt que set pour garder un ordre stable
+        cells = self.cells
+        for row in range(first_row, last_row + 1):
+            base = row * self.columns
+            for rect_id in cells[base + first_col:base + last_col + 1]:
+                if rect_id:
+                    hits[rect_id] = None
+        return [self.rects[rect_id - 1] for rect_id in hits]
+
+
+class ChunkCache:
     """
-    Représente une plateforme de collision simple.
+    Cache de rendu des calques de tuiles statiques.
+    La carte est découpée en blocs (chunks) de taille fixe, pré-rendus sur une
+    surface chacun. Seuls les blocs visibles par la caméra sont dessinés, et le
+    nombre de blocs gardés en mémoire est limité (éviction LRU).
     """
-    def __init__(self, x, y, width, height):
+    def __init__(self, tile_layers, tile_width, tile_height, map_width, map_height,
+                 chunk_size=CHUNK_SIZE, max_chunks=CHUNK_CACHE_MAX):
+        """
+        Prépare le découpage en blocs.
+        :param tile_layers: Liste de calques, chaque calque étant une liste de (x, y, image).
+        :param tile_width, tile_height: Dimensions d'une tuile en pixels.
+        :param map_width, map_height: Dimensions de la carte en pixels.
+        :param chunk_size: Taille d'un bloc en pixels.
+        :param max_chunks: Nombre maximum de surfaces de blocs gardées en mémoire.
+        """
+        self.chunk_size = chunk_size
+        self.max_chunks = max(1, max_chunks)
+        self.cols = (map_width + chunk_size - 1) // chunk_size
+        self.rows = (map_height + chunk_size - 1) // chunk_size
+
+        # Pour chaque bloc, la liste des (image, position locale) à dessiner,
+        # dans l'ordre des calques. Les blocs vides ne sont jamais créés.
+        self.chunk_tiles = {}
+        for layer in tile_layers:
+            for x, y, image in layer:
+                px = x * tile_width
+                py = y * tile_height
+                key = (px // chunk_size, py // chunk_size)
+                local_pos = (px - key[0] * chunk_size, py - key[1] * chunk_size)
+                self.chunk_tiles.setdefault(key, []).append((image, local_pos))
+
+        self.surfaces = OrderedDict() # (colonne, ligne) -> surface du bloc, du plus ancien au plus récent
+        self.bake_count = 0
+        self.blit_count = 0 # Nombre de blocs dessinés lors du dernier draw
+
+    def bake(self, key):
+        """
+        Dessine toutes les tuiles d'un bloc sur une nouvelle surface.
+        """
+        surface = pg.Surface((self.chunk_size, self.chunk_size), pg.SRCALPHA)
+        surface.blits(self.chunk_tiles[key], doreturn=False)
+        self.bake_count += 1
+        return surface.convert_alpha()
+
+    def get(self, key):
         """
-        Initialise une plateforme.
-        :param x, y: Coordonnées du coin supérieur gauche.
-        :param width, height: Dimensions de la plateforme.
+        Retourne la surface d'un bloc, en la créant si besoin.
+        Le bloc devient le plus récemment utilisé ; le plus ancien est évincé si le budget est dépassé.
         """
-        super().__init__()
-        self.rect = pg.Rect(x, y, width, height)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.bake(key)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_chunks:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def prebake(self):
+        """
+        Pré-rend les blocs dans la limite du budget, en partant du bas de la carte
+        (là où commence l'ascension).
+        """
+        keys = sorted(self.chunk_tiles, key=lambda key: (-key[1], key[0]))
+        for key in keys[:self.max_chunks]:
+            self.get(key)
+
+    def draw(self, surface, view_rect):
+        """
+        Dessine les blocs qui chevauchent la zone visible.
+        :param surface: Surface Pygame sur laquelle dessiner.
+        :param view_rect: Rectangle de la zone visible, en coordonnées du monde.
+        """
+        size = self.chunk_size
+        first_col = max(0, view_rect.left // size)
+        last_col = min(self.cols - 1, (view_rect.right - 1) // size)
+        first_row = max(0, view_rect.top // size)
+        last_row = min(self.rows - 1, (view_rect.bottom - 1) // size)
+
+        blit_list = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                key = (col, row)
+                if key in self.chunk_tiles:
+                    blit_list.append((self.get(key), (col * size - view_rect.x, row * size - view_rect.y)))
+        surface.blits(blit_list, doreturn=False)
+        self.blit_count = len(blit_list)
+
+
+class MapObject:
+    """
+    Objet d'un calque d'objets de la carte (pic, portail, point d'apparition...).
+    Mêmes attributs que les objets pytmx utilisés par le jeu.
+    """
+    def __init__(self, group, id, name, type, x, y, width, height, properties):
+        self.group = group # Nom du calque d'objets
+        self.id = id
+        self.name = name
+        self.type = type
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.properties = properties
+
+
+def get_tileset_images(level, base_dir):
+    """
+    Retourne, pour chaque tileset d'un niveau compilé, le chemin de son image et sa couleur
+    de transparence (ou None pour un tileset sans image).
+    :param base_dir: Dossier du fichier .tmx (les chemins des tilesets y sont relatifs).
+    """
+    tilesets = []
+    for tileset in level["tilesets"]:
+        if tileset["source"] is None:
+            tilesets.append(None)
+            continue
+        colorkey = tuple(pg.Color("#" + tileset["colorkey"])) if tileset["colorkey"] else None
+        tilesets.append((os.path.join(base_dir, tileset["source"]), colorkey))
+    return tilesets
 
 
 class Map:
     """
     Classe pour charger et afficher la carte du jeu à partir d'un fichier TMX.
+    Le fichier est compilé une fois (voir level_cache.py) puis rechargé depuis le cache
+    tant qu'il n'a pas changé.
     Génère également les objets de collision à partir des calques de tuiles.
     """
-    def __init__(self, game_state, filename):
+    def __init__(self, game_state, filename, level=None):
         """
         Initialise la carte.
         :param game_state: Référence à l'instance GameState.
         :param filename: Chemin vers le fichier .tmx de la carte.
+        :param level: Niveau compilé déjà lu (chargement en arrière-plan), sinon il est lu ici.
         """
         self.game_state = game_state
-        self.tmx_data = pytmx.load_pygame(filename, pixelalpha=True)
-        self.width = self.tmx_data.width * self.tmx_data.tilewidth
-        self.height = self.tmx_data.height * self.tmx_data.tileheight
-        self.tile_width = self.tmx_data.tilewidth
-        self.tile_height = self.tmx_data.tileheight
 
         # Noms des calques de tuiles qui doivent générer des collisions
-        self.collidable_layer_names = ["Calque de Tuiles 1"]
+        self.collidable_layer_names = list(COLLIDABLE_LAYER_NAMES)
+        self.collision_grid = None # Construite par load_map_objects
 
+        self.level = level if level is not None else load_level(filename, self.collidable_layer_names)
+        self.columns = self.level["columns"]
+        self.rows = self.level["rows"]
+        self.tile_width = self.level["tile_width"]
+        self.tile_height = self.level["tile_height"]
+        self.width = self.columns * self.tile_width
+        self.height = self.rows * self.tile_height
+
+        self.objects = [MapObject(**obj) for obj in self.level["objects"]]
+        self.tile_images = self.load_tile_images(os.path.dirname(filename))
+
+        # Pré-rendu des calques de tuiles visibles en blocs
+        self.render_cache = ChunkCache(self.get_tile_layers(), self.tile_width, self.tile_height,
+                                       self.width, self.height)
+        self.render_cache.prebake()
+
+    def load_tile_images(self, base_dir):
+        """
+        Charge les images des tilesets et découpe les tuiles utilisées par la carte.
+        :param base_dir: Dossier du fichier .tmx (les chemins des tilesets y sont relatifs).
+        :return: Liste des images des tuiles, indexée par GID (None si la tuile n'est pas utilisée).
+        """
+        tileset_images = []
+        for tileset in get_tileset_images(self.level, base_dir):
+            if tileset is None:
+                tileset_images.append(None)
+                continue
+            path, colorkey = tileset
+            tileset_images.append(assets.get_image(path, colorkey=colorkey))
+
+        tile_images = []
+        for tile in self.level["tiles"]:
+            if tile is None:
+                tile_images.append(None)
+                continue
+            tileset_index, rect, (flip_x, flip_y, flip_diagonal) = tile
+            image = tileset_images[tileset_index].subsurface(rect)
+            if flip_diagonal:
+                image = pg.transform.flip(pg.transform.rotate(image, 270), True, False)
+            if flip_x or flip_y:
+                image = pg.transform.flip(image, flip_x, flip_y)
+            tile_images.append(image)
+        return tile_images
+
+    def get_tile_layers(self):
+        """
+        Retourne les calques de tuiles visibles sous forme de listes de (x, y, image).
+        """
+        tile_layers = []
+        for layer in self.level["layers"]:
+            if not layer["visible"]:
+                continue
+            tiles = []
+            for index, gid in enumerate(layer["data"]):
+                if gid: # Vérifie si c'est bien une tuile
+                    tile_image = self.tile_images[gid]
+                    if tile_image:
+                        y, x = divmod(index, self.columns)
+                        tiles.append((x, y, tile_image))
+            tile_layers.append(tiles)
+        return tile_layers
 
     def render(self, surface, camera):
         """
-        Dessine toutes les tuiles visibles de la carte sur la surface donnée,
+        Dessine les blocs pré-rendus visibles de la carte sur la surface donnée,
         en tenant compte de la position de la caméra.
         :param surface: Surface Pygame sur laquelle dessiner.
         :param camera: Objet Camera pour appliquer le décalage.
         """
-        for layer in self.tmx_data.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, item in layer.tiles(): # Item peut être un GID(int) ou une image (surface)
-                    if item: # Vérifie si c'est bien une tuile/image
-                        if isinstance(item, pg.Surface): # Si l'item n'est pas déjà une image (surface)
-                            tile_image = item
-                        else: # Sinon, l'item est probablement un GID(int)
-                            tile_image = self.tmx_data.get_tile_image_by_gid(item)
-                        
-                        if tile_image:
-                            # Appliquer le décalage de la caméra à la position de la tuile
-                            tile_rect = pg.Rect(x * self.tile_width, 
-                                                y * self.tile_height, 
-                                                self.tile_width, 
-                                                self.tile_height)
-                            surface.blit(tile_image, camera.apply(tile_rect))
+        self.render_cache.draw(surface, camera.get_view_rect())
 
     def load_map_objects(self):
         """
-        Charge les objets de la carte, en particulier les plateformes de collision
-        générées à partir des calques de tuiles spécifiés.
-        """
-        for layer in self.tmx_data.layers: 
-            if isinstance(layer, pytmx.TiledTileLayer) and layer.name in self.collidable_layer_names:
-                for x, y, gid in layer.tiles(): # x,y sont les coordonnées de chaque tuile, (colonne, ligne)
-                    if gid != 0: # Si une tuile est présente (gid != 0)
-                        # Créer une plateforme de collision à cette position
-                        platform_x = x * self.tile_width
-                        platform_y = y * self.tile_height
-                        
-                        platform = Platform(platform_x, platform_y, self.tile_width, self.tile_height)
-                        
-                        self.game_state.platforms.add(platform)
-
-        if not self.game_state.platforms:
+        Construit la grille de collision statique à partir des rectangles de collision
+        du niveau compilé (tuiles solides adjacentes déjà fusionnées par greedy meshing).
+        Le groupe 'platforms' du GameState ne contient plus que les plateformes dynamiques (javelots plantés).
+        """
+        self.collision_grid = CollisionGrid(self.columns, self.rows, self.tile_width, self.tile_height)
+        for col, row, width, height in self.level["collision_rects"]:
+            # Un rectangle de collision couvre tout le bloc de tuiles fusionné
+            self.collision_grid.add_rect(col, row, width, height)
+
+        if not self.collision_grid.rects:
             print("Warning: No collision platforms were loaded.")
         else:
-            print(f"{len(self.game_state.platforms)} collision platforms loaded.")
+            rect_count = len(self.collision_grid.rects)
+            tile_count = self.level["solid_tile_count"]
+            print(f"{rect_count} collision platforms loaded "
+                  f"({tile_count} solid tiles, {tile_count - rect_count} rects saved).")
 
+    def get_objects(self, name):
+        """
+        Retourne les objets de la carte portant le nom donné.
+        """
+        return [obj for obj in self.objects if obj.name == name]
 
     def get_map_dimensions(self):
         """
@@ -1,91 +1,420 @@
+import numpy as np
 import pygame as pg
+from animation import clips, AnimationClip
+from settings import (MONSTER_ACTIVE_MARGIN, MONSTER_REDUCED_MARGIN, MONSTER_REDUCED_INTERVAL,
+                      MONSTER_MAX_STEP_DISTANCE, MONSTER_MAX_FAST_FORWARD, MONSTER_MAX_CATCH_UP)
 
-class Monster(pg.sprite.Sprite):
-    def __init__(self, x, y, images, platforms, speed=100):
-        super().__init__()
-        self.images = images  # Liste de surfaces pour l'animation
-        self.image = self.images[0]
-        self.rect = self.image.get_rect(topleft=(x, y))
-        self.platforms = platforms  # Groupe de sprites plateformes pour collision
-        self.speed = speed
-        self.direction = 1  # 1 = droite, -1 = gauche
-        self.animation_index = 0
-        self.animation_timer = 0
-        self.animation_speed = 0.12  # Plus petit = plus rapide
-
-        # Animation de mort
-        self.is_dead = False
-        self.death_images = ["Sprites/Zombie_dead1.png",
-                            "Sprites/Zombie_dead2.png",
-                            "Sprites/Zombie_dead3.png",]
-        self.death_anim_index = 0
-        self.death_anim_timer = 0
-        self.death_anim_speed = 0.15
-
-    def set_death_animation(self, images):
-        self.death_images = images
-
-    def update(self, dt):
-        if self.is_dead:
-            # Animation de mort
-            self.death_anim_timer += dt
-            if self.death_anim_timer > self.death_anim_speed:
-                self.death_anim_index += 1
-                self.death_anim_timer = 0
-                if self.death_anim_index >= len(self.death_images):
-                    self.kill()  # Supprime le zombie à la fin de l'animation
-                    return
-            if self.death_anim_index < len(self.death_images):
-                self.image = self.death_images[self.death_anim_index]
+# Images des animations des zombies
+ZOMBIE_WALK_IMAGES = [f"Sprites/Zombie{i}.png" for i in range(1, 9)]
+ZOMBIE_DEATH_IMAGES = ["Sprites/Zombie_dead1.png",
+                       "Sprites/Zombie_dead2.png",
+                       "Sprites/Zombie_dead3.png"]
+
+# États d'un monstre
+ALIVE = 0
+DYING = 1  # Animation de mort en cours (ne touche plus rien)
+
+# Tableaux du MonsterSystem (une valeur par monstre)
+MONSTER_FIELDS = ("x", "rect_x", "prev_rect_x", "y", "width", "height", "direction", "speed", "start_x",
+                  "walk_distance", "state", "clip", "death_clip", "frame", "timer", "pending", "tick_phase")
+
+def register_zombie_clips():
+    """
+    Enregistre les animations des zombies dans la bibliothèque partagée (une seule fois).
+    Les images de marche regardent vers la droite ; la variante gauche est retournée une fois pour toutes.
+    """
+    if clips.has("zombie_walk"):
+        return
+    clips.add("zombie_walk", ZOMBIE_WALK_IMAGES, 0.12)  # Plus petit = plus rapide
+    clips.add("zombie_death", ZOMBIE_DEATH_IMAGES, 0.15, loop=False)
+
+
+class MonsterSprite:
+    """
+    Vue d'un monstre du MonsterSystem, sous la forme attendue par le rendu
+    (image, rect, prev_center) et par les collisions (is_dead, die).
+    Elle ne stocke rien : tout est lu dans les tableaux du système.
+    """
+    __slots__ = ("system", "index")
+
+    def __init__(self, system, index):
+        self.system = system
+        self.index = index  # Ligne dans les tableaux du système (-1 une fois retiré)
+
+    @property
+    def rect(self):
+        system, i = self.system, self.index
+        return pg.Rect(int(system.rect_x[i]), int(system.y[i]), int(system.width[i]), int(system.height[i]))
+
+    @property
+    def prev_center(self):
+        system, i = self.system, self.index
+        return (int(system.prev_rect_x[i]) + int(system.width[i]) // 2, int(system.y[i]) + int(system.height[i]) // 2)
+
+    @property
+    def image(self):
+        return self.system.get_image(self.index)
+
+    @property
+    def is_dead(self):
+        return self.index < 0 or bool(self.system.state[self.index] != ALIVE)
+
+    def die(self):
+        if self.index >= 0:
+            self.system.kill(self.index)
+
+
+class MonsterSystem:
+    """
+    Tous les monstres d'un niveau, stockés en tableaux NumPy (un élément par monstre) :
+    position, direction, vitesse, patrouille et animation. Une mise à jour avance
+    tous les monstres d'un coup (déplacement, rebond sur les murs de la grille et
+    les plateformes, demi-tour en fin de patrouille, animation), sans boucle Python
+    par monstre. Les MonsterSprite ne servent qu'à dessiner et à désigner un monstre.
+
+    Seuls les monstres proches de l'écran sont simulés à chaque pas ; les plus
+    éloignés le sont moins souvent ou dorment (voir update).
+    """
+    def __init__(self, collision_grid, platforms):
+        """
+        :param collision_grid: Grille de collision statique de la carte (map.CollisionGrid).
+        :param platforms: Groupe de sprites plateformes (javelots plantés), sur lesquels les monstres rebondissent.
+        """
+        self.collision_grid = collision_grid
+        self.platforms = platforms
+        # Grille d'occupation (lignes, colonnes), lue directement dans les cases de la grille de collision,
+        # puis cumulée (table des sommes) : le nombre de cases solides d'un rectangle se lit en 4 accès
+        solid = np.frombuffer(collision_grid.cells, dtype=np.uint16).reshape(
+            collision_grid.rows, collision_grid.columns) != 0
+        self.solid_counts = np.zeros((collision_grid.rows + 1, collision_grid.columns + 1), dtype=np.int32)
+        self.solid_counts[1:, 1:] = solid.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+
+        self.clip_table = []  # Clips (sens "droite") utilisés par les monstres ; les tableaux en gardent l'indice
+        self.clip_durations = np.zeros(0)
+        self.clip_lengths = np.zeros(0, dtype=np.int32)
+
+        self.x = np.zeros(0)  # Position horizontale exacte (sous-pixel)
+        self.rect_x = np.zeros(0, dtype=np.int32)  # Position arrondie (rectangle)
+        self.prev_rect_x = np.zeros(0, dtype=np.int32)  # Position arrondie au pas précédent (interpolation à l'affichage)
+        self.y = np.zeros(0, dtype=np.int32)
+        self.width = np.zeros(0, dtype=np.int32)
+        self.height = np.zeros(0, dtype=np.int32)
+        self.direction = np.zeros(0, dtype=np.int8)  # 1 = droite, -1 = gauche
+        self.speed = np.zeros(0)  # Pixels par seconde
+        self.start_x = np.zeros(0)  # Position du dernier demi-tour (patrouille)
+        self.walk_distance = np.zeros(0)  # Distance avant de se retourner (inf = sans patrouille)
+        self.state = np.zeros(0, dtype=np.int8)  # ALIVE ou DYING
+        self.clip = np.zeros(0, dtype=np.int32)  # Clip joué (indice dans clip_table)
+        self.death_clip = np.zeros(0, dtype=np.int32)
+        self.frame = np.zeros(0, dtype=np.int32)  # Image courante du clip
+        self.timer = np.zeros(0)  # Minuterie de l'animation
+        self.pending = np.zeros(0)  # Temps (s) écoulé et pas encore simulé (monstres éloignés)
+        self.tick_phase = np.zeros(0, dtype=np.int32)  # Décalage des mises à jour réduites (étale la charge)
+
+        self.sprites = []  # Vues, dans l'ordre des tableaux
+        self.step_index = 0
+        # Répartition au dernier pas (affichée par le profileur)
+        self.active_count = 0
+        self.reduced_count = 0
+        self.sleeping_count = 0
+
+    def clear(self):
+        """ Retire tous les monstres (la grille de collision est conservée). """
+        for name in MONSTER_FIELDS:
+            array = getattr(self, name)
+            setattr(self, name, array[:0].copy())
+        for sprite in self.sprites:
+            sprite.index = -1
+        self.sprites = []
+        self.step_index = 0
+
+    def restore(self, fields, step_index):
+        """
+        Remplace tous les monstres par ceux d'un instantané (voir snapshot.py).
+        Les anciennes vues sont invalidées et de nouvelles sont créées.
+        :param fields: Dictionnaire nom de champ (MONSTER_FIELDS) -> tableau, de même longueur.
+        :param step_index: Compteur de pas (répartition des mises à jour réduites).
+        """
+        count = len(fields["x"])
+        for name in ("clip", "death_clip"):
+            if count and (fields[name].min() < 0 or fields[name].max() >= len(self.clip_table)):
+                raise ValueError("Instantané incompatible : animation de monstre inconnue.")
+        for name in MONSTER_FIELDS:
+            setattr(self, name, fields[name])
+        for sprite in self.sprites:
+            sprite.index = -1
+        self.sprites = [MonsterSprite(self, index) for index in range(count)]
+        self.step_index = step_index
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def __iter__(self):
+        return iter(list(self.sprites))
+
+    def get_clip_id(self, clip):
+        """ Indice d'un clip dans la table (ajouté au premier usage). """
+        for index, known in enumerate(self.clip_table):
+            if known is clip:
+                return index
+        self.clip_table.append(clip)
+        self.clip_durations = np.append(self.clip_durations, clip.frame_duration)
+        self.clip_lengths = np.append(self.clip_lengths, np.int32(len(clip.frames)))
+        return len(self.clip_table) - 1
+
+    def add(self, x, y, walk_clip, speed=100, walk_distance=None, death_clip=None):
+        """
+        Ajoute un monstre.
+        :param x, y: Coin supérieur gauche.
+        :param walk_clip: Clip de marche (sens "droite").
+        :param speed: Vitesse en pixels par seconde.
+        :param walk_distance: Distance parcourue avant de se retourner (None = seulement aux murs).
+        :param death_clip: Clip de mort ; si None, la dernière image reste affichée brièvement.
+        :return: La vue (MonsterSprite) du monstre.
+        """
+        return self.add_many([(x, y, speed, walk_distance)], walk_clip, death_clip)[0]
+
+    def add_many(self, spawns, walk_clip, death_clip=None):
+        """
+        Ajoute plusieurs monstres d'un même type : les tableaux ne sont agrandis qu'une fois.
+        :param spawns: Liste de (x, y, vitesse, distance de patrouille ou None), comme pour add.
+        :param walk_clip: Clip de marche (sens "droite").
+        :param death_clip: Clip de mort ; si None, la dernière image reste affichée brièvement.
+        :return: Les vues (MonsterSprite) des monstres ajoutés.
+        """
+        if death_clip is None:
+            death_clip = AnimationClip("mort", [walk_clip.frames[0]], 0.15, loop=False)
+        width, height = walk_clip.frames[0].get_size()
+        first = len(self.sprites)
+        count = len(spawns)
+        xs = [spawn[0] for spawn in spawns]
+        fields = {
+            "x": xs, "rect_x": xs, "prev_rect_x": xs, "y": [spawn[1] for spawn in spawns],
+            "width": width, "height": height, "direction": 1, "speed": [spawn[2] for spawn in spawns], "start_x": xs,
+            "walk_distance": [np.inf if spawn[3] is None else spawn[3] for spawn in spawns],
+            "state": ALIVE, "clip": self.get_clip_id(walk_clip), "death_clip": self.get_clip_id(death_clip),
+            "frame": 0, "timer": 0.0, "pending": 0.0,
+            "tick_phase": np.arange(first, first + count) % MONSTER_REDUCED_INTERVAL,
+        }
+        for name, values in fields.items():
+            array = getattr(self, name)
+            added = np.empty(count, dtype=array.dtype)
+            added[:] = values
+            setattr(self, name, np.concatenate((array, added)))
+        sprites = [MonsterSprite(self, index) for index in range(first, first + count)]
+        self.sprites.extend(sprites)
+        return sprites
+
+    def get_image(self, index):
+        """ Image courante d'un monstre (clip miroir s'il regarde à gauche et marche). """
+        clip = self.clip_table[self.clip[index]]
+        if self.state[index] == ALIVE and self.direction[index] < 0:
+            clip = clip.mirror
+        return clip.frames[self.frame[index]]
+
+    def kill(self, index):
+        """ Lance l'animation de mort d'un monstre : il ne touche plus rien. """
+        if self.state[index] != ALIVE:
             return
+        self.state[index] = DYING
+        self.clip[index] = self.death_clip[index]
+        self.frame[index] = 0
+        self.timer[index] = 0.0
+
+    def remember_positions(self):
+        """ Mémorise les positions avant un pas de simulation (interpolation à l'affichage). """
+        self.prev_rect_x[:] = self.rect_x
 
-        # Animation
-        self.animation_timer += dt
-        if self.animation_timer > self.animation_speed:
-            self.animation_index = (self.animation_index + 1) % len(self.images)
-            self.image = self.images[self.animation_index]
-            self.animation_timer = 0
-
-        # Déplacement horizontal
-        dx = self.direction * self.speed * dt
-        self.rect.x += dx
-
-        # Collision avec plateformes (rebondit)
-        collided = pg.sprite.spritecollideany(self, self.platforms)
-        if collided:
-            # Revenir en arrière et changer de direction
-            self.rect.x -= dx
-            self.direction *= -1
-
-    def die(self, death_images):
-        self.is_dead = True
-        self.death_anim_index = 0
-        self.death_anim_timer = 0
-        self.death_images = death_images
-        if self.death_images:
-            self.image = self.death_images[0]
-
-    def turn(self):
-        self.direction *= -1
-
-class Zombie(Monster):
-    def __init__(self, x, y, images, platforms, speed=100, walk_distance=200):
-        super().__init__(x, y, images, platforms, speed)
-        self.walk_distance = walk_distance  # distance à parcourir avant de se retourner (en pixels)
-        self.start_x = x  # position de départ pour le calcul de la distance
-
-    def update(self, dt):
-        super().update(dt)
-        if self.is_dead:
+    def update(self, dt, view_rect=None):
+        """
+        Avance les monstres d'un pas de simulation, selon leur distance à la zone visible :
+        - à moins de MONSTER_ACTIVE_MARGIN de l'écran (et les monstres mourants) : à chaque pas ;
+        - jusqu'à MONSTER_REDUCED_MARGIN : un pas sur MONSTER_REDUCED_INTERVAL, avec le temps accumulé ;
+        - au-delà : endormis. Le temps passé endormi est rattrapé à leur réveil.
+        Au plus MONSTER_MAX_CATCH_UP monstres sont rattrapés par pas (les plus en retard
+        d'abord), pour que le réveil d'une foule ne dépasse pas le budget d'une image.
+        :param view_rect: Zone visible du monde ; si None, tous les monstres sont mis à jour.
+        """
+        if not self.sprites:
             return
-        # Calcul de la distance parcourue depuis le dernier retournement
-        distance = abs(self.rect.x - self.start_x)
-        if distance >= self.walk_distance:
-            self.turn()
-            self.start_x = self.rect.x  # réinitialise la position de départ
-
-    def turn(self):
-        self.direction *= -1
-        # Retourner toutes les images horizontalement
-        self.images = [pg.transform.flip(img, True, False) for img in self.images]
-        self.image = self.images[self.animation_index]
+        self.pending += dt
+        self.step_index += 1
+        if view_rect is None:
+            active = np.ones(len(self.sprites), dtype=bool)
+            reduced = ~active
+            run = active
+        else:
+            active = self.overlaps(view_rect.inflate(2 * MONSTER_ACTIVE_MARGIN, 2 * MONSTER_ACTIVE_MARGIN)) \
+                | (self.state != ALIVE)
+            reduced = ~active & self.overlaps(view_rect.inflate(2 * MONSTER_REDUCED_MARGIN, 2 * MONSTER_REDUCED_MARGIN))
+            run = active | (reduced & ((self.tick_phase + self.step_index) % MONSTER_REDUCED_INTERVAL == 0))
+        self.active_count = int(active.sum())
+        self.reduced_count = int(reduced.sum())
+        self.sleeping_count = len(self.sprites) - self.active_count - self.reduced_count
+
+        indices = np.flatnonzero(run)
+        if not indices.size:
+            return
+        elapsed = self.pending[indices]
+        speed = self.speed[indices]
+        catching_up = elapsed * speed > MONSTER_MAX_STEP_DISTANCE
+        waking = np.flatnonzero(catching_up)
+        if waking.size > MONSTER_MAX_CATCH_UP:
+            # Trop de réveils à la fois : les moins en retard gardent leur temps en attente
+            deferred = waking[np.argsort(-elapsed[waking], kind="stable")[MONSTER_MAX_CATCH_UP:]]
+            keep = np.ones(indices.size, dtype=bool)
+            keep[deferred] = False
+            indices, elapsed, speed, catching_up = indices[keep], elapsed[keep], speed[keep], catching_up[keep]
+        self.pending[indices] = 0.0
+        # Rattrapage au réveil : une patrouille sans obstacle est calculée directement ;
+        # pour les autres monstres, seule la fin du temps écoulé est simulée (au plus
+        # MONSTER_MAX_FAST_FORWARD secondes) : ils étaient hors de vue, l'écart ne se voit pas
+        if catching_up.any():
+            done = self.fast_forward_patrol(indices[catching_up], elapsed[catching_up])
+            elapsed[np.flatnonzero(catching_up)[done]] = 0.0
+        elapsed = np.minimum(elapsed, MONSTER_MAX_FAST_FORWARD)
+        # Découpage en sous-pas de MONSTER_MAX_STEP_DISTANCE pixels au plus (pas de mur traversé)
+        substeps = np.maximum(1, np.ceil(elapsed * speed / MONSTER_MAX_STEP_DISTANCE)).astype(np.int32)
+        step_dt = elapsed / substeps
+
+        finished = []
+        for substep in range(int(substeps.max())):
+            selected = substeps > substep
+            finished.extend(self.advance(indices[selected], step_dt[selected]))
+        if finished:
+            mask = np.zeros(len(self.sprites), dtype=bool)
+            mask[finished] = True
+            self.remove(mask)
+
+    def fast_forward_patrol(self, indices, elapsed):
+        """
+        Rattrape directement 'elapsed' secondes de patrouille pour les monstres désignés,
+        quand c'est possible : monstre vivant, sur son trajet de patrouille, et trajet sans
+        mur ni plateforme (il fait alors des allers-retours de walk_distance pixels).
+        :return: Masque des monstres rattrapés (les autres doivent être simulés).
+        """
+        distance = self.walk_distance[indices]
+        start_x = self.start_x[indices]
+        direction = self.direction[indices]
+        travelled = (self.x[indices] - start_x) * direction  # Chemin parcouru depuis le dernier demi-tour
+        width, y, height = self.width[indices], self.y[indices], self.height[indices]
+        with np.errstate(invalid="ignore"):
+            span_left = np.floor(np.minimum(start_x, start_x + direction * distance))
+            possible = (self.state[indices] == ALIVE) & np.isfinite(distance) & (distance > 0) \
+                & (travelled >= 0) & (travelled <= distance)
+        if not possible.any():
+            return possible
+        # Le trajet complet (aller et retour) ne doit toucher aucun obstacle
+        span_left = np.where(possible, span_left, 0).astype(np.int32)
+        span_width = np.where(possible, np.ceil(distance), 0).astype(np.int32) + width
+        possible &= ~(self.collides_grid(span_left, y, span_width, height)
+                      | self.collides_platforms(span_left, y, span_width, height))
+
+        # Position sur l'aller-retour : 'legs' demi-tours, puis 'rest' pixels sur le trajet en cours
+        path = travelled + self.speed[indices] * elapsed
+        legs = np.floor_divide(path, np.where(possible, distance, 1.0))
+        rest = path - legs * np.where(possible, distance, 1.0)
+        odd = (legs % 2) == 1
+        new_start = np.where(odd, start_x + direction * distance, start_x)
+        new_direction = np.where(odd, -direction, direction)
+        new_x = new_start + new_direction * rest
+
+        done = np.flatnonzero(possible)
+        targets = indices[done]
+        self.x[targets] = new_x[done]
+        self.rect_x[targets] = np.rint(new_x[done]).astype(np.int32)
+        self.start_x[targets] = np.rint(new_start[done])
+        self.direction[targets] = new_direction[done]
+        # Animation : les images sautées ne se voient pas, on repart simplement de la suivante
+        clip = self.clip[targets]
+        self.frame[targets] = (self.frame[targets] + 1) % self.clip_lengths[clip]
+        self.timer[targets] = 0.0
+        return possible
+
+    def advance(self, indices, dt):
+        """
+        Avance les monstres désignés de dt secondes (un dt par monstre) : animation,
+        déplacement (annulé s'il touche un mur ou une plateforme) et patrouille.
+        :return: Indices des monstres dont l'animation de mort est terminée.
+        """
+        alive = self.state[indices] == ALIVE
+
+        # Animation : une image de plus quand la minuterie dépasse la durée d'image du clip
+        clip = self.clip[indices]
+        frame = self.frame[indices]
+        lengths = self.clip_lengths[clip]
+        timer = self.timer[indices] + dt
+        next_frame = timer > self.clip_durations[clip]
+        timer[next_frame] = 0.0
+        finished = next_frame & ~alive & (frame + 1 >= lengths)
+        self.frame[indices] = np.where(next_frame & ~finished, np.where(alive, (frame + 1) % lengths, frame + 1), frame)
+        self.timer[indices] = timer
+
+        # Déplacement horizontal des monstres vivants, annulé s'il touche un mur ou une plateforme
+        x = self.x[indices]
+        y, width, height = self.y[indices], self.width[indices], self.height[indices]
+        direction = self.direction[indices]
+        new_x = x + np.where(alive, direction * self.speed[indices] * dt, 0.0)
+        new_rect_x = np.rint(new_x).astype(np.int32)
+        blocked = alive & (self.collides_grid(new_rect_x, y, width, height)
+                           | self.collides_platforms(new_rect_x, y, width, height))
+        rect_x = np.where(blocked, self.rect_x[indices], new_rect_x)
+        self.x[indices] = np.where(blocked, x, new_x)
+        self.rect_x[indices] = rect_x
+        direction = np.where(blocked, -direction, direction)
+
+        # Patrouille : demi-tour après avoir parcouru walk_distance depuis le dernier demi-tour
+        start_x = self.start_x[indices]
+        patrol = alive & (np.abs(rect_x - start_x) >= self.walk_distance[indices])
+        self.direction[indices] = np.where(patrol, -direction, direction)
+        self.start_x[indices] = np.where(patrol, rect_x, start_x)
+        return indices[finished]
+
+    def collides_grid(self, rect_x, y, width, height):
+        """ Pour chaque rectangle (rect_x, y, width, height), indique s'il touche une case solide de la grille. """
+        grid = self.collision_grid
+        # Cases couvertes [début, fin[, ramenées dans la carte (l'extérieur est vide)
+        first_col = np.minimum(np.maximum(rect_x // grid.tile_width, 0), grid.columns)
+        end_col = np.maximum(np.minimum((rect_x + width - 1) // grid.tile_width + 1, grid.columns), first_col)
+        first_row = np.minimum(np.maximum(y // grid.tile_height, 0), grid.rows)
+        end_row = np.maximum(np.minimum((y + height - 1) // grid.tile_height + 1, grid.rows), first_row)
+        counts = self.solid_counts
+        return (counts[end_row, end_col] - counts[first_row, end_col]
+                - counts[end_row, first_col] + counts[first_row, first_col]) > 0
+
+    def collides_platforms(self, rect_x, y, width, height):
+        """ Pour chaque rectangle (rect_x, y, width, height), indique s'il touche une plateforme (javelot planté). """
+        hit = np.zeros(len(rect_x), dtype=bool)
+        for platform in self.platforms:
+            rect = platform.rect
+            hit |= (rect_x < rect.right) & (rect_x + width > rect.left) & (y < rect.bottom) & (y + height > rect.top)
+        return hit
+
+    def overlaps(self, rect):
+        """ Masque des monstres (vivants ou mourants) dont le rectangle chevauche 'rect'. """
+        return (self.rect_x < rect.right) & (self.rect_x + self.width > rect.left) & \
+               (self.y < rect.bottom) & (self.y + self.height > rect.top)
+
+    def query_rect(self, rect):
+        """ Retourne les vues des monstres vivants dont le rectangle chevauche 'rect'. """
+        if not self.sprites:
+            return []
+        return [self.sprites[index] for index in np.flatnonzero((self.state == ALIVE) & self.overlaps(rect))]
+
+    def get_visible_sprites(self, view_rect):
+        """ Retourne les vues des monstres (vivants ou mourants) qui chevauchent la zone visible. """
+        if not self.sprites:
+            return []
+        return [self.sprites[index] for index in np.flatnonzero(self.overlaps(view_rect))]
+
+    def remove(self, mask):
+        """ Retire les monstres désignés (fin de l'animation de mort) et renumérote les vues. """
+        keep = ~mask
+        for name in MONSTER_FIELDS:
+            setattr(self, name, getattr(self, name)[keep])
+        for sprite, removed in zip(self.sprites, mask):
+            if removed:
+                sprite.index = -1
+        self.sprites = [sprite for sprite in self.sprites if sprite.index >= 0]
+        for index, sprite in enumerate(self.sprites):
+            sprite.index = index
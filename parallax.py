@@ -0,0 +1,93 @@
+import pygame as pg
+from settings import WIDTH, HEIGHT
+from assets import assets
+
+class ParallaxLayer:
+    """
+    Couche de fond défilant à sa propre vitesse par rapport à la caméra.
+    L'image est redimensionnée une seule fois au chargement (cache du gestionnaire
+    d'assets) ; le dessin n'est ensuite qu'une suite de blits.
+    """
+    def __init__(self, image, factor=0.0, height=None, fit=False, tile_x=True, tile_y=False, alpha=None):
+        """
+        Initialise une couche.
+        :param image: Chemin de l'image de la couche.
+        :param factor: Vitesse de défilement par rapport à la caméra (0 = fixe, 1 = suit le décor).
+        :param height: Hauteur (pixels) à laquelle l'image est redimensionnée, proportions conservées.
+        :param fit: Si True, le défilement vertical est réparti sur toute la hauteur de l'image :
+                    le haut de l'image est visible en haut de la carte, le bas en bas de la carte.
+        :param tile_x, tile_y: Répète l'image horizontalement / verticalement.
+        :param alpha: Opacité de la couche (0-255), None pour une couche opaque.
+        """
+        source = assets.get_image(image, alpha=False)
+        if height is None:
+            height = source.get_height()
+        width = int(source.get_width() * (height / source.get_height()))
+        self.image = assets.get_image(image, alpha=False, size=(width, height))
+        if alpha is not None:
+            # Copie : la surface du gestionnaire d'assets est partagée
+            self.image = self.image.copy()
+            self.image.set_alpha(alpha)
+        self.width, self.height = self.image.get_size()
+        self.factor = factor
+        self.fit = fit
+        self.tile_x = tile_x
+        self.tile_y = tile_y
+
+    def get_positions(self, offset, size, screen_size, tile):
+        """
+        Retourne les positions à l'écran des copies de l'image sur un axe.
+        """
+        if not tile:
+            return [-int(offset)]
+        start = -(int(offset) % size)
+        return list(range(start, screen_size, size))
+
+    def draw(self, surface, view_rect, map_height):
+        """
+        Dessine la couche.
+        :param surface: Surface Pygame sur laquelle dessiner.
+        :param view_rect: Zone visible du monde (voir Camera.get_view_rect).
+        :param map_height: Hauteur de la carte en pixels.
+        """
+        offset_x = view_rect.x * self.factor
+        if self.fit:
+            scroll_range = max(0, self.height - HEIGHT)
+            map_range = map_height - HEIGHT
+            offset_y = view_rect.y / map_range * scroll_range if map_range > 0 else 0
+        else:
+            offset_y = view_rect.y * self.factor
+
+        xs = self.get_positions(offset_x, self.width, WIDTH, self.tile_x)
+        ys = self.get_positions(offset_y, self.height, HEIGHT, self.tile_y)
+        surface.blits([(self.image, (x, y)) for y in ys for x in xs], doreturn=False)
+
+
+class ParallaxBackground:
+    """
+    Fond d'un niveau composé de plusieurs couches, de la plus lointaine à la plus proche.
+    """
+    def __init__(self, layers):
+        self.layers = layers
+
+    @classmethod
+    def from_config(cls, layer_configs):
+        """
+        Crée un fond à partir d'une liste de dictionnaires (voir LEVEL_BACKGROUNDS dans settings.py).
+        Une couche dont l'image ne peut pas être chargée est ignorée.
+        """
+        layers = []
+        for config in layer_configs:
+            try:
+                layers.append(ParallaxLayer(**config))
+            except (pg.error, FileNotFoundError) as e:
+                print(f"Erreur: Impossible de charger la couche de fond '{config.get('image')}': {e}")
+        return cls(layers)
+
+    def draw(self, surface, camera):
+        """
+        Dessine toutes les couches en fonction de la position de la caméra.
+        """
+        view_rect = camera.get_view_rect()
+        for layer in self.layers:
+            layer.draw(surface, view_rect, camera.map_height)
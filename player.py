@@ -2,6 +2,9 @@
 import pygame as pg
 from settings import *
 from javelin import Javelin
+from animation import clips, Animator
+from replay import KEY_LEFT, KEY_RIGHT
+from collision import get_swept_rect, sweep_axis
 
 #Toutes les images du personnage (animation)
 idle = ['Sprites/L_Idle_Vagabond1.png',
@@ -45,6 +48,33 @@ dead_smoke_gauche = ['Sprites/L_dead_smoke1.png',
               'Sprites/L_dead_smoke3.png',
               'Sprites/L_dead_smoke4.png',]
 
+# Toutes les images du personnage (préchargées avec le niveau)
+PLAYER_IMAGES = (idle + walking_droite + walking_gauche + idle_javelin + walking_droite_javelin
+                 + walking_gauche_javelin + jump_gauche + jump_droite + jump_gauche_javelin + jump_droite_javelin
+                 + death + dead_smoke_droite + dead_smoke_gauche)
+
+PLAYER_ANIM_SPEED = 0.08  # secondes entre frames
+PLAYER_SMOKE_ANIM_SPEED = 0.15  # secondes entre frames
+
+def register_player_clips():
+    """
+    Enregistre les animations du joueur dans la bibliothèque partagée (une seule fois).
+    Les sprites du joueur sont dessinés dans les deux sens : pas de retournement automatique.
+    """
+    if clips.has("player_idle"):
+        return
+    clips.add("player_idle", [idle[1]], PLAYER_ANIM_SPEED, mirror_paths=[idle[0]])
+    clips.add("player_walk", walking_droite, PLAYER_ANIM_SPEED, mirror_paths=walking_gauche)
+    clips.add("player_jump", jump_droite or [idle[1]], PLAYER_ANIM_SPEED, mirror_paths=jump_gauche or [idle[0]])
+    clips.add("player_idle_javelin", [idle_javelin[1]], PLAYER_ANIM_SPEED, mirror_paths=[idle_javelin[0]])
+    clips.add("player_walk_javelin", walking_droite_javelin, PLAYER_ANIM_SPEED, mirror_paths=walking_gauche_javelin)
+    clips.add("player_jump_javelin", jump_droite_javelin or [idle_javelin[1]], PLAYER_ANIM_SPEED,
+              mirror_paths=jump_gauche_javelin or [idle_javelin[0]])
+    clips.add("player_death", [death[1]], PLAYER_ANIM_SPEED, loop=False, mirror_paths=[death[0]])
+    clips.add("player_dead_smoke", dead_smoke_droite, PLAYER_SMOKE_ANIM_SPEED, loop=False,
+              mirror_paths=dead_smoke_gauche)
+
+
 class Player(pg.sprite.Sprite):
     """
     Classe pour représenter le joueur.
@@ -54,35 +84,20 @@ class Player(pg.sprite.Sprite):
         super().__init__()
         self.game = game
 
-        # Animation
-        self.animations_no_javelin = {
-            "idle_gauche": [pg.image.load(idle[0]).convert_alpha()],
-            "idle_droite": [pg.image.load(idle[1]).convert_alpha()],
-            "walk_gauche": [pg.image.load(img).convert_alpha() for img in walking_gauche],
-            "walk_droite": [pg.image.load(img).convert_alpha() for img in walking_droite],
-            "jump_gauche": [pg.image.load(img).convert_alpha() for img in jump_gauche] if jump_gauche else [pg.image.load(idle[0]).convert_alpha()],
-            "jump_droite": [pg.image.load(img).convert_alpha() for img in jump_droite] if jump_droite else [pg.image.load(idle[1]).convert_alpha()],
-        }
-        self.animations_javelin = {
-            "idle_gauche": [pg.image.load(idle_javelin[0]).convert_alpha()],
-            "idle_droite": [pg.image.load(idle_javelin[1]).convert_alpha()],
-            "walk_gauche": [pg.image.load(img).convert_alpha() for img in walking_gauche_javelin],
-            "walk_droite": [pg.image.load(img).convert_alpha() for img in walking_droite_javelin],
-            "jump_gauche": [pg.image.load(img).convert_alpha() for img in jump_gauche_javelin] if jump_gauche_javelin else [pg.image.load(idle_javelin[0]).convert_alpha()],
-            "jump_droite": [pg.image.load(img).convert_alpha() for img in jump_droite_javelin] if jump_droite_javelin else [pg.image.load(idle_javelin[1]).convert_alpha()],
-        }
-        self.state = "idle_droite"  # idle_droite, idle_gauche, walk_droite, walk_gauche, jump_droite, jump_gauche
-        self.anim_index = 0
-        self.anim_timer = 0
-        self.anim_speed = 0.08  # secondes entre frames
-
-        self.image = self.animations_javelin["idle_droite"][0]
+        # Animation : les clips sont partagés par toutes les instances (bibliothèque d'animations)
+        register_player_clips()
+        self.state = "idle"  # idle, walk, jump
+        self.animator = Animator(clips.get("player_idle_javelin", "droite"))
+
+        self.image = self.animator.image
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
+        self.pos = pg.math.Vector2(self.rect.topleft)  # Position exacte (sous-pixel), le rect en est l'arrondi
 
-        self.vel = pg.math.Vector2(0, 0)
+        self.vel = pg.math.Vector2(0, 0)  # Vitesse en pixels par seconde
         self.acc = pg.math.Vector2(0, 0)
         self.on_ground = False
+        self.controls = 0  # Touches de direction maintenues (KEY_LEFT / KEY_RIGHT), fournies par le GameState
 
         self.has_javelin = True
         self.active_javelin_sprite = None
@@ -90,19 +105,9 @@ class Player(pg.sprite.Sprite):
         self.facing = "droite"  # Pour savoir dans quel sens on regarde
 
         # Animation de mort
-        self.death_images = {
-            "gauche": pg.image.load(death[0]).convert_alpha(),
-            "droite": pg.image.load(death[1]).convert_alpha()
-        }
-        self.dead_smoke_images = {
-            "gauche": [pg.image.load(img).convert_alpha() for img in dead_smoke_gauche],
-            "droite": [pg.image.load(img).convert_alpha() for img in dead_smoke_droite]
-        }
         self.is_dead = False
         self.death_anim_phase = None  # None, 'death', 'smoke'
         self.death_timer = 0
-        self.smoke_index = 0
-        self.smoke_anim_speed = 0.15  # secondes entre frames
 
     def jump(self):
         if self.on_ground: 
@@ -116,81 +121,55 @@ class Player(pg.sprite.Sprite):
                 if self.death_timer > 0.5:
                     self.death_anim_phase = 'smoke'
                     self.death_timer = 0
-                    self.smoke_index = 0
+                    self.animator.play(clips.get("player_dead_smoke", self.facing), restart=True)
             elif self.death_anim_phase == 'smoke':
                 # Animation de la fumée
-                if self.death_timer > self.smoke_anim_speed:
-                    self.smoke_index += 1
-                    self.death_timer = 0
-                    if self.smoke_index >= len(self.dead_smoke_images[self.facing]):
-                        # Animation terminée, retour menu principal
-                        if hasattr(self.game, 'go_to_main_menu'):
-                            self.game.go_to_main_menu()
-                        return
-                if self.smoke_index < len(self.dead_smoke_images[self.facing]):
-                    self.image = self.dead_smoke_images[self.facing][self.smoke_index]
+                if not self.animator.update(dt):
+                    # Animation terminée : retour au dernier point de contrôle (ou au menu principal)
+                    if hasattr(self.game, 'respawn_player'):
+                        self.game.respawn_player()
+                    return
+                self.image = self.animator.image
             return  # Ne fait rien d'autre si mort
 
         self.acc = pg.math.Vector2(0, PLAYER_GRAVITY)
 
-        keys = pg.key.get_pressed()
         current_acc_x = 0
         moving = False
-        if keys[pg.K_LEFT] or keys[pg.K_q]:
+        if self.controls & KEY_LEFT:
             current_acc_x = -PLAYER_SPEED 
             self.facing = "gauche"
             moving = True
-        elif keys[pg.K_RIGHT] or keys[pg.K_d]:
+        elif self.controls & KEY_RIGHT:
             current_acc_x = PLAYER_SPEED
             self.facing = "droite"
             moving = True
 
         self.vel.x = current_acc_x 
 
-        self.rect.x += self.vel.x
-        self.check_collision_x()
+        self.move_x(self.vel.x * dt)
 
-        self.vel.y += self.acc.y 
-        if self.vel.y > 15: 
-            self.vel.y = 15
+        self.vel.y += self.acc.y * dt
+        if self.vel.y > PLAYER_MAX_FALL_SPEED: 
+            self.vel.y = PLAYER_MAX_FALL_SPEED
 
-        self.rect.y += self.vel.y
         self.on_ground = False 
-        self.check_collision_y()
+        self.move_y(self.vel.y * dt)
 
         # --- Animation ---
         # Détermine l'état d'animation selon le mouvement ET si le joueur saute
         if not self.on_ground:
-            if self.facing == "droite":
-                self.state = "jump_droite"
-            else:
-                self.state = "jump_gauche"
+            self.state = "jump"
         elif moving:
-            if self.facing == "droite":
-                self.state = "walk_droite"
-            else:
-                self.state = "walk_gauche"
+            self.state = "walk"
         else:
-            if self.facing == "droite":
-                self.state = "idle_droite"
-            else:
-                self.state = "idle_gauche"
+            self.state = "idle"
 
-        # Choix du bon set d'animations selon la possession du javelot
-        if self.has_javelin:
-            animations = self.animations_javelin
-        else:
-            animations = self.animations_no_javelin
-
-        self.anim_timer += dt
-        frames = animations[self.state]
-        if self.anim_timer > self.anim_speed:
-            self.anim_index = (self.anim_index + 1) % len(frames)
-            self.anim_timer = 0
-        # Pour idle, il n'y a qu'une frame donc anim_index reste 0
-        if len(frames) == 1:
-            self.anim_index = 0
-        self.image = frames[self.anim_index]
+        # Choix du bon clip selon la possession du javelot et l'orientation
+        clip_name = "player_" + self.state + ("_javelin" if self.has_javelin else "")
+        self.animator.play(clips.get(clip_name, self.facing))
+        self.animator.update(dt)
+        self.image = self.animator.image
         # --- Fin animation ---
 
     def throw_javelin(self, target_pos_world):
@@ -217,27 +196,75 @@ class Player(pg.sprite.Sprite):
             self.death_anim_phase = 'death'
             self.death_timer = 0
             # Affiche le sprite de mort selon l'orientation
-            self.image = self.death_images[self.facing]
+            self.animator.play(clips.get("player_death", self.facing), restart=True)
+            self.image = self.animator.image
             # Désactive les collisions/mouvements
             self.vel = pg.math.Vector2(0, 0)
             self.acc = pg.math.Vector2(0, 0)
 
-    def check_collision_x(self):
-        hits = pg.sprite.spritecollide(self, self.game.platforms, False)
-        for hit_platform in hits:
-            if self.vel.x > 0: 
-                self.rect.right = hit_platform.rect.left 
-            elif self.vel.x < 0: 
-                self.rect.left = hit_platform.rect.right 
-            self.vel.x = 0 
-
-    def check_collision_y(self):
-        hits = pg.sprite.spritecollide(self, self.game.platforms, False)
-        for hit_platform in hits:
-            if self.vel.y > 0:  
-                self.rect.bottom = hit_platform.rect.top
-                self.vel.y = 0
-                self.on_ground = True
-            elif self.vel.y < 0:  
-                self.rect.top = hit_platform.rect.bottom
+    def respawn(self, pos, vel, on_ground, has_javelin, facing):
+        """
+        Ressuscite le joueur sur place, dans l'état donné (point de contrôle, voir snapshot.py).
+        """
+        self.is_dead = False
+        self.death_anim_phase = None
+        self.death_timer = 0
+        self.pos = pg.math.Vector2(pos)
+        self.vel = pg.math.Vector2(vel)
+        self.acc = pg.math.Vector2(0, 0)
+        self.on_ground = on_ground
+        self.has_javelin = has_javelin
+        self.facing = facing
+        self.controls = 0
+        self.rect.topleft = (round(self.pos.x), round(self.pos.y))
+
+        self.state = "idle" if on_ground else "jump"
+        clip_name = "player_" + self.state + ("_javelin" if self.has_javelin else "")
+        self.animator.play(clips.get(clip_name, self.facing), restart=True)
+        self.image = self.animator.image
+
+    def sync_position(self):
+        """ Recale la position exacte sur le rectangle (après une correction de collision). """
+        self.pos.update(self.rect.topleft)
+
+    def move_x(self, dx):
+        """
+        Déplacement horizontal de dx pixels, arrêté au premier mur rencontré (swept AABB) :
+        le joueur ne peut pas traverser un obstacle, quelle que soit sa vitesse.
+        """
+        if dx:
+            swept = get_swept_rect(self.pos.x, self.rect.y, self.rect.width, self.rect.height, dx, 0)
+            self.pos.x, hit = sweep_axis(self.pos.x, self.rect.width, dx, self.game.get_solid_rects(swept), 0)
+            if hit:
+                self.vel.x = 0
+        self.rect.x = round(self.pos.x)
+
+    def move_y(self, dy):
+        """
+        Déplacement vertical de dy pixels, arrêté au premier sol ou plafond rencontré.
+        Un joueur posé au sol (même à moins d'un pixel au-dessus) est au contact : on_ground.
+        """
+        if dy:
+            swept = get_swept_rect(self.rect.x, self.pos.y, self.rect.width, self.rect.height, 0, dy)
+            self.pos.y, hit = sweep_axis(self.pos.y, self.rect.height, dy, self.game.get_solid_rects(swept), 1)
+            if hit:
                 self.vel.y = 0
+                self.on_ground = dy > 0
+        self.rect.y = round(self.pos.y)
+
+    def push_out_of(self, rect):
+        """
+        Sort le joueur d'un rectangle qui vient d'apparaître sur lui (javelot planté),
+        en une seule correction : au-dessus s'il tombe, en dessous s'il monte,
+        sinon du côté le moins enfoncé.
+        """
+        if not self.rect.colliderect(rect):
+            return
+        if self.vel.y > 0 or (self.vel.y == 0 and self.rect.bottom - rect.top <= rect.bottom - self.rect.top):
+            self.rect.bottom = rect.top
+            self.vel.y = 0
+            self.on_ground = True
+        else:
+            self.rect.top = rect.bottom
+            self.vel.y = max(0, self.vel.y)
+        self.sync_position()
@@ -0,0 +1,202 @@
+# profiler.py
+"""
+Profileur de frames affiché en surimpression (touche F3).
+
+Quand il est activé, les méthodes mesurées sont remplacées par des versions
+chronométrées ; désactivé, les méthodes d'origine sont remises en place et le
+profileur ne coûte rien.
+"""
+import time
+from collections import deque
+import pygame as pg
+from statemanager import StateManager
+from map import Map
+from render_queue import RenderQueue
+from spatial_hash import SpatialHash
+from states import GameState
+from player import Player
+from javelin import Javelin
+from monstre import MonsterSystem
+from assets import assets
+from audio import audio
+from text import get_font
+
+PROFILER_HISTORY = 180 # Nombre d'images gardées dans le graphique
+PROFILER_TEXT_INTERVAL = 15 # Le texte est mis à jour toutes les N images
+PROFILER_GRAPH_SCALE = 3 # Pixels par milliseconde dans le graphique
+PROFILER_GRAPH_HEIGHT = 100
+
+# (nom affiché, classe ou module, méthode) : sous-systèmes chronométrés
+TIMED_METHODS = [
+    ("événements", StateManager, "handle_events"),
+    ("mise à jour", StateManager, "update"),
+    ("  monstres", MonsterSystem, "update"),
+    ("dessin", StateManager, "draw"),
+    ("  carte", Map, "render"),
+    ("  sprites", RenderQueue, "flush"),
+]
+# (nom affiché, classe, méthode) : collisions chronométrées, affichées à côté de leurs compteurs
+# (les requêtes de rectangles solides sont faites pendant les déplacements : leur temps y est inclus)
+COLLISION_TIMED_METHODS = [
+    ("collisions", Player, "move_x"),
+    ("collisions", Player, "move_y"),
+    ("collisions", Javelin, "check_collision_walls"),
+    ("collisions", MonsterSystem, "collides_grid"),
+    ("collisions", MonsterSystem, "collides_platforms"),
+    ("requêtes", GameState, "get_solid_rects"),
+]
+# (nom affiché, classe, méthode) : appels comptés
+COUNTED_METHODS = [
+    ("collisions", GameState, "get_solid_rects"),
+    ("collisions", MonsterSystem, "collides_grid"),
+    ("collisions", MonsterSystem, "collides_platforms"),
+    ("broadphase", SpatialHash, "query_rect"),
+    ("broadphase", MonsterSystem, "query_rect"),
+]
+
+
+class FrameProfiler:
+    """
+    Mesure le temps passé dans chaque sous-système et l'affiche par-dessus le jeu.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.enabled = False
+        self.originals = [] # (objet, nom, méthode d'origine) à restaurer
+        self.times = {} # Sous-système -> secondes pendant l'image en cours
+        self.counts = {} # Compteur -> appels pendant l'image en cours
+        self.history = deque(maxlen=PROFILER_HISTORY) # Durée des dernières images (secondes)
+        self.last_frame_end = None
+        self.frame_index = 0
+        self.font = get_font(20)
+        self.text_lines = []
+        self.panel = None
+
+    def toggle(self):
+        """ Active ou désactive le profileur. """
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.reset_frame()
+        self.history.clear()
+        self.last_frame_end = None
+        for label, owner, name in TIMED_METHODS + COLLISION_TIMED_METHODS:
+            self.patch(owner, name, self.make_timed(label, getattr(owner, name)))
+        for label, owner, name in COUNTED_METHODS:
+            self.patch(owner, name, self.make_counted(label, getattr(owner, name)))
+        # Fin d'image : la surimpression est dessinée juste avant l'affichage
+        self.patch(pg.display, "flip", self.make_flip(pg.display.flip))
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+        self.originals.clear()
+
+    def patch(self, owner, name, replacement):
+        self.originals.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def make_timed(self, label, method):
+        times = self.times
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                times[label] = times.get(label, 0.0) + time.perf_counter() - start
+        return timed
+
+    def make_counted(self, label, method):
+        counts = self.counts
+        def counted(*args, **kwargs):
+            counts[label] = counts.get(label, 0) + 1
+            return method(*args, **kwargs)
+        return counted
+
+    def make_flip(self, flip):
+        def profiled_flip(*args):
+            self.draw(pg.display.get_surface())
+            start = time.perf_counter()
+            flip(*args)
+            end = time.perf_counter()
+            self.times["affichage"] = end - start
+            self.end_frame(end)
+        return profiled_flip
+
+    def reset_frame(self):
+        self.times.clear()
+        self.counts.clear()
+
+    def end_frame(self, now):
+        """ Termine l'image : enregistre sa durée et met à jour le texte de temps en temps. """
+        if self.last_frame_end is not None:
+            self.history.append(now - self.last_frame_end)
+        self.last_frame_end = now
+        if self.frame_index % PROFILER_TEXT_INTERVAL == 0:
+            self.text_lines = self.build_text()
+        self.frame_index += 1
+        self.reset_frame()
+
+    def build_text(self):
+        """ Lignes de texte du panneau (temps par sous-système et compteurs de l'image). """
+        lines = []
+        if self.history:
+            frame_ms = 1000 * self.history[-1]
+            worst_ms = 1000 * max(self.history)
+            lines.append(f"image {frame_ms:5.1f} ms  ({1000 / frame_ms if frame_ms else 0:.0f} i/s)  pire {worst_ms:.1f} ms")
+        for label, _, _ in TIMED_METHODS:
+            lines.append(f"{label:<12}{1000 * self.times.get(label, 0.0):6.2f} ms")
+        lines.append(f"{'affichage':<12}{1000 * self.times.get('affichage', 0.0):6.2f} ms")
+
+        state = self.game.state_manager.get_active_state()
+        if isinstance(state, GameState) and state.all_sprites:
+            map_blits = state.map.render_cache.blit_count if state.map else 0
+            lines.append(f"blits: {map_blits} blocs + {state.render_queue.blit_count} sprites")
+            monsters = state.monsters
+            lines.append(f"sprites: {len(state.all_sprites)}  monstres: {len(monsters)}"
+                         f" ({monsters.active_count} actifs, {monsters.reduced_count} réduits, {monsters.sleeping_count} endormis)")
+        lines.append(f"collisions: {self.counts.get('collisions', 0)} ({1000 * self.times.get('collisions', 0.0):.2f} ms,"
+                     f" requêtes {1000 * self.times.get('requêtes', 0.0):.2f} ms)"
+                     f"  broadphase: {self.counts.get('broadphase', 0)}")
+        stats = assets.get_stats()
+        lines.append(f"images: {stats['images']}  (cache {stats['hits']} trouvées, {stats['misses']} chargées)")
+        stats = audio.get_stats()
+        lines.append(f"sons: {stats['sounds']}  ({stats['voices']} voix, {stats['stolen']} interrompues,"
+                     f" {stats['dropped']} ignorés)")
+        return [self.font.render(line, True, (255, 255, 255)) for line in lines]
+
+    def draw(self, surface):
+        """ Dessine le panneau : graphique des durées d'images et texte. """
+        if surface is None:
+            return
+        width = PROFILER_HISTORY * 2
+        height = PROFILER_GRAPH_HEIGHT + 6 + len(self.text_lines) * self.font.get_linesize()
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pg.Surface((width, height), pg.SRCALPHA)
+        self.panel.fill((0, 0, 0, 170))
+
+        # Repères à 60 et 30 images par seconde
+        for ms, color in ((1000 / 60, (0, 200, 0)), (1000 / 30, (220, 160, 0))):
+            y = PROFILER_GRAPH_HEIGHT - int(ms * PROFILER_GRAPH_SCALE)
+            if y >= 0:
+                pg.draw.line(self.panel, color, (0, y), (width, y))
+        for index, duration in enumerate(self.history):
+            ms = 1000 * duration
+            bar = min(PROFILER_GRAPH_HEIGHT, int(ms * PROFILER_GRAPH_SCALE))
+            color = (80, 220, 80) if ms <= 1000 / 60 + 1 else (240, 180, 0) if ms <= 1000 / 30 + 1 else (240, 60, 60)
+            pg.draw.line(self.panel, color, (index * 2, PROFILER_GRAPH_HEIGHT), (index * 2, PROFILER_GRAPH_HEIGHT - bar))
+
+        y = PROFILER_GRAPH_HEIGHT + 6
+        for line in self.text_lines:
+            self.panel.blit(line, (4, y))
+            y += self.font.get_linesize()
+        surface.blit(self.panel, (4, 4))
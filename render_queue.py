@@ -0,0 +1,76 @@
+import pygame as pg
+
+
+def get_render_position(sprite, alpha=1.0):
+    """
+    Position (coin supérieur gauche, coordonnées du monde) à laquelle dessiner un sprite,
+    interpolée entre le pas de simulation précédent et le pas courant.
+    :param sprite: Sprite avec un attribut rect, et optionnellement prev_center
+                   (centre au pas précédent, renseigné par le GameState).
+    :param alpha: Fraction du pas suivant déjà écoulée (0 = pas précédent, 1 = pas courant).
+    """
+    rect = sprite.rect
+    prev_center = getattr(sprite, "prev_center", None)
+    if prev_center is None or alpha >= 1.0:
+        return rect.topleft
+    t = 1.0 - alpha
+    return (rect.x + round((prev_center[0] - rect.centerx) * t),
+            rect.y + round((prev_center[1] - rect.centery) * t))
+
+
+class RenderQueue:
+    """
+    File de rendu des sprites du jeu.
+    Collecte uniquement les sprites visibles par la caméra, les trie une seule
+    fois par calque puis les envoie en un seul appel à Surface.blits.
+    """
+    def __init__(self):
+        """
+        Initialise une file de rendu vide.
+        """
+        self.items = [] # Liste de (calque, image, position monde)
+        self.blit_count = 0 # Nombre de sprites dessinés lors du dernier flush
+
+    def clear(self):
+        """ Vide la file de rendu. """
+        self.items.clear()
+
+    def add(self, image, rect, layer=0):
+        """
+        Ajoute un élément à dessiner.
+        :param image: Surface à dessiner.
+        :param rect: Rectangle de l'élément en coordonnées du monde.
+        :param layer: Calque de dessin (les calques plus grands sont dessinés par-dessus).
+        """
+        self.items.append((layer, image, rect.topleft))
+
+    def add_group(self, group, view_rect, layer=0, alpha=1.0):
+        """
+        Ajoute les sprites d'un groupe qui chevauchent la zone visible.
+        :param group: Groupe (ou liste) de sprites ayant un attribut image et rect.
+        :param view_rect: Zone visible du monde (voir Camera.get_view_rect).
+        :param layer: Calque de dessin des sprites du groupe.
+        :param alpha: Facteur d'interpolation entre deux pas de simulation (voir get_render_position).
+        """
+        sprites = group.sprites() if isinstance(group, pg.sprite.AbstractGroup) else list(group)
+        if not sprites:
+            return
+        # Test de visibilité fait en une seule fois par Pygame
+        for index in view_rect.collidelistall([sprite.rect for sprite in sprites]):
+            sprite = sprites[index]
+            self.items.append((layer, sprite.image, get_render_position(sprite, alpha)))
+
+    def flush(self, surface, camera):
+        """
+        Trie les éléments par calque, les dessine avec le décalage de la caméra
+        puis vide la file.
+        :param surface: Surface Pygame sur laquelle dessiner.
+        :param camera: Objet Camera pour appliquer le décalage.
+        """
+        # Le tri est stable : l'ordre d'ajout est conservé à l'intérieur d'un calque
+        self.items.sort(key=lambda item: item[0])
+        offset_x, offset_y = camera.camera_rect.topleft
+        surface.blits([(image, (x + offset_x, y + offset_y)) for _, image, (x, y) in self.items],
+                      doreturn=False)
+        self.blit_count = len(self.items)
+        self.items.clear()
@@ -0,0 +1,280 @@
+# replay.py
+"""
+Enregistrement et relecture déterministes des entrées du joueur.
+
+Une partie est enregistrée pas de simulation par pas de simulation (SIM_HZ) :
+touches de direction maintenues, sauts et lancers de javelot (coordonnées du
+monde). Rejouer ces entrées depuis le chargement du niveau reproduit la partie
+à l'identique ; un hachage optionnel de l'état du monde à chaque pas permet de
+détecter la première divergence.
+
+Format du fichier (petit-boutiste) :
+    en-tête  : "GOTR", version (u16), options (u16), SIM_HZ (u16), nombre de pas (u32)
+    niveau   : longueur (u8) puis nom du fichier .tmx (UTF-8)
+    données  : flux compressé (zlib) ; par pas un octet
+               (bits 0-1 : touches, bit 2 : saut, bits 3-7 : nombre de lancers),
+               puis x, y (i32) de chaque lancer, puis le hachage (u32) si activé.
+"""
+import struct
+import zlib
+import pygame as pg
+from settings import SIM_HZ
+
+REPLAY_MAGIC = b"GOTR"
+REPLAY_VERSION = 1
+FLAG_HASHES = 1 # Le fichier contient un hachage de l'état du monde par pas
+
+# Touches de direction (masque de bits)
+KEY_LEFT = 1
+KEY_RIGHT = 2
+LEFT_KEYS = (pg.K_LEFT, pg.K_q)
+RIGHT_KEYS = (pg.K_RIGHT, pg.K_d)
+
+HEADER = struct.Struct("<4sHHHI")
+TICK = struct.Struct("<B")
+THROW = struct.Struct("<ii")
+HASH = struct.Struct("<I")
+MAX_THROWS_PER_TICK = 31
+
+
+class TickInput:
+    """
+    Entrées appliquées pendant un pas de simulation.
+    """
+    __slots__ = ("keys", "jump", "throws")
+
+    def __init__(self, keys=0, jump=False, throws=()):
+        self.keys = keys # Masque KEY_LEFT / KEY_RIGHT
+        self.jump = jump # Saut demandé
+        self.throws = tuple(throws) # Positions visées (coordonnées du monde)
+
+
+def hash_world(game_state):
+    """
+    Hachage (CRC32) de l'état du monde : position et vitesse exactes du joueur,
+    rectangles et positions de tous les sprites mobiles et des monstres.
+    """
+    player = game_state.player
+    values = [player.pos.x, player.pos.y, player.vel.x, player.vel.y, player.is_dead, player.has_javelin]
+    for sprite in game_state.all_sprites:
+        values.extend(sprite.rect)
+        pos = getattr(sprite, "pos", None)
+        if pos is not None:
+            values.extend(pos)
+    monsters = game_state.monsters
+    values.extend(monsters.x.tolist())
+    values.extend(monsters.direction.tolist())
+    values.extend(monsters.state.tolist())
+    return zlib.crc32(struct.pack(f"<{len(values)}d", *values))
+
+
+class Replay:
+    """
+    Suite des entrées d'une partie (et des hachages de l'état du monde).
+    """
+    def __init__(self, level, ticks=None, hashes=None, sim_hz=SIM_HZ):
+        """
+        :param level: Nom du fichier .tmx du niveau joué.
+        :param ticks: Liste de TickInput, un par pas de simulation.
+        :param hashes: Liste des hachages de l'état du monde (un par pas), ou None.
+        :param sim_hz: Fréquence de simulation à l'enregistrement.
+        """
+        self.level = level
+        self.ticks = ticks if ticks is not None else []
+        self.hashes = hashes
+        self.sim_hz = sim_hz
+
+    def save(self, path):
+        """ Écrit le replay dans un fichier. """
+        body = bytearray()
+        for index, tick in enumerate(self.ticks):
+            if len(tick.throws) > MAX_THROWS_PER_TICK:
+                raise ValueError(f"Trop de lancers au pas {index} ({len(tick.throws)}).")
+            body += TICK.pack(tick.keys | (tick.jump << 2) | (len(tick.throws) << 3))
+            for x, y in tick.throws:
+                body += THROW.pack(int(x), int(y))
+            if self.hashes is not None:
+                body += HASH.pack(self.hashes[index])
+
+        level = self.level.encode("utf-8")
+        flags = FLAG_HASHES if self.hashes is not None else 0
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, flags, self.sim_hz, len(self.ticks)))
+            f.write(bytes([len(level)]) + level)
+            f.write(zlib.compress(bytes(body), 9))
+
+    @classmethod
+    def load(cls, path):
+        """ Lit un replay (ValueError si le fichier n'est pas un replay valide). """
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, flags, sim_hz, count = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"'{path}' n'est pas un replay compatible (version {version}).")
+        offset = HEADER.size
+        level = data[offset + 1:offset + 1 + data[offset]].decode("utf-8")
+        body = zlib.decompress(data[offset + 1 + data[offset]:])
+
+        ticks = []
+        hashes = [] if flags & FLAG_HASHES else None
+        offset = 0
+        for _ in range(count):
+            (packed,) = TICK.unpack_from(body, offset)
+            offset += TICK.size
+            throws = []
+            for _ in range(packed >> 3):
+                throws.append(THROW.unpack_from(body, offset))
+                offset += THROW.size
+            ticks.append(TickInput(packed & 3, bool(packed & 4), throws))
+            if hashes is not None:
+                hashes.append(HASH.unpack_from(body, offset)[0])
+                offset += HASH.size
+        return cls(level, ticks, hashes, sim_hz)
+
+
+class LiveInput:
+    """
+    Entrées du joueur au clavier et à la souris.
+    Les sauts et lancers reçus entre deux pas sont appliqués au pas suivant.
+    """
+    def __init__(self):
+        self.jump = False
+        self.throws = []
+
+    @property
+    def finished(self):
+        """ Vrai quand il n'y a plus d'entrées (fin d'un replay). """
+        return False
+
+    def start(self, level):
+        """ Appelé au début d'une partie (niveau chargé). """
+        self.jump = False
+        self.throws = []
+
+    def queue_jump(self):
+        self.jump = True
+
+    def queue_throw(self, world_pos):
+        self.throws.append((int(world_pos[0]), int(world_pos[1])))
+
+    def next_tick(self):
+        """ Retourne les entrées du prochain pas de simulation (None = fin des entrées). """
+        pressed = pg.key.get_pressed()
+        keys = 0
+        if any(pressed[key] for key in LEFT_KEYS):
+            keys |= KEY_LEFT
+        if any(pressed[key] for key in RIGHT_KEYS):
+            keys |= KEY_RIGHT
+        tick = TickInput(keys, self.jump, self.throws)
+        self.jump = False
+        self.throws = []
+        return tick
+
+    def end_tick(self, game_state):
+        """ Appelé après la simulation d'un pas. """
+        pass
+
+    def finish(self, game_state):
+        """ Appelé à la fin de la partie. """
+        pass
+
+
+class RecordingInput(LiveInput):
+    """
+    Entrées du joueur, enregistrées dans un fichier replay à la fin de la partie.
+    """
+    def __init__(self, path, with_hashes=False):
+        super().__init__()
+        self.path = path
+        self.with_hashes = with_hashes
+        self.replay = None
+        self.pending_hash = False # Un pas a été simulé sans que son hachage soit encore calculé
+
+    def start(self, level):
+        super().start(level)
+        self.replay = Replay(level, hashes=[] if self.with_hashes else None)
+        self.pending_hash = False
+
+    def next_tick(self):
+        tick = super().next_tick()
+        self.replay.ticks.append(tick)
+        self.pending_hash = True
+        return tick
+
+    def end_tick(self, game_state):
+        if self.pending_hash and self.replay.hashes is not None:
+            self.replay.hashes.append(hash_world(game_state))
+        self.pending_hash = False
+
+    def finish(self, game_state):
+        if self.replay is None or not self.replay.ticks:
+            return
+        # Le dernier pas peut avoir changé d'état avant la fin de sa mise à jour
+        self.end_tick(game_state)
+        try:
+            self.replay.save(self.path)
+            print(f"Replay enregistré: {self.path} ({len(self.replay.ticks)} pas)")
+        except OSError as e:
+            print(f"Erreur: Impossible d'enregistrer le replay '{self.path}': {e}")
+        self.replay = None
+
+
+class ReplayInput:
+    """
+    Entrées lues depuis un replay. Les entrées réelles sont ignorées.
+    Si le replay contient des hachages, chaque pas est vérifié.
+    """
+    def __init__(self, replay, verify=True):
+        self.replay = replay
+        self.verify = verify and replay.hashes is not None
+        self.index = 0
+        self.pending_hash = False
+        self.divergence = None # Premier pas dont le hachage diffère de l'enregistrement
+        self.ended = False # La partie rejouée est terminée (changement d'état du jeu)
+
+    def start(self, level):
+        if level != self.replay.level:
+            print(f"Avertissement: replay enregistré sur '{self.replay.level}', niveau chargé '{level}'.")
+        if self.replay.sim_hz != SIM_HZ:
+            print(f"Avertissement: replay enregistré à {self.replay.sim_hz} Hz, simulation à {SIM_HZ} Hz.")
+        self.index = 0
+        self.pending_hash = False
+        self.divergence = None
+        self.ended = False
+
+    @property
+    def finished(self):
+        return self.ended or self.index >= len(self.replay.ticks)
+
+    def queue_jump(self):
+        pass
+
+    def queue_throw(self, world_pos):
+        pass
+
+    def next_tick(self):
+        if self.finished:
+            return None
+        tick = self.replay.ticks[self.index]
+        self.index += 1
+        self.pending_hash = True
+        return tick
+
+    def end_tick(self, game_state):
+        if self.pending_hash and self.verify and self.divergence is None:
+            if hash_world(game_state) != self.replay.hashes[self.index - 1]:
+                self.divergence = self.index - 1
+                print(f"Replay: divergence détectée au pas {self.divergence}.")
+        self.pending_hash = False
+
+    def finish(self, game_state):
+        self.end_tick(game_state)
+        self.ended = True
+
+    def get_summary(self):
+        """ Résumé de la relecture (pour l'affichage en fin de replay). """
+        summary = f"Replay: {self.index}/{len(self.replay.ticks)} pas rejoués"
+        if self.verify:
+            summary += ", identique à l'enregistrement" if self.divergence is None \
+                else f", divergence au pas {self.divergence}"
+        return summary
@@ -3,7 +3,14 @@
 # Dimensions de la fenêtre de jeu
 WIDTH = 800  # Largeur de la fenêtre
 HEIGHT = 600 # Hauteur de la fenêtre
-FPS = 60     # Images par seconde
+FPS = 60     # Images par seconde (0 = sans limite)
+
+# Boucle de jeu à pas fixe : la simulation avance toujours par pas de SIM_DT,
+# quel que soit le nombre d'images par seconde ; l'affichage interpole entre deux pas.
+SIM_HZ = 120 # Pas de simulation par seconde
+SIM_DT = 1 / SIM_HZ # Durée d'un pas de simulation (secondes)
+MAX_FRAME_TIME = 0.25 # Temps maximal (secondes) rattrapé en une image, évite l'emballement après un ralentissement
+LEVEL_LOAD_STEP_BUDGET = 0.002 # Temps (secondes) de conversion d'images par mise à jour pendant un chargement en arrière-plan
 
 # Titre du jeu
 TITLE = "Get On Top Of It"
@@ -17,21 +24,53 @@ BLUE = (0, 0, 255)
 LIGHTBLUE = (173, 216, 230) # Couleur de fond
 BEIGE = (255, 229, 204)
 
-# Propriétés du joueur
+# Propriétés du joueur (distances en pixels, temps en secondes)
 PLAYER_ACC = 0.5  # Accélération du joueur (non utilisé dans ce modèle simple)
 PLAYER_FRICTION = -0.12 # Friction (non utilisé dans ce modèle simple)
-PLAYER_GRAVITY = 0.8 # Gravité appliquée au joueur
-PLAYER_JUMP_STRENGTH = -14 # Force du saut du joueur (valeur négative pour monter)
-PLAYER_SPEED = 5 # Vitesse de déplacement horizontal du joueur
+PLAYER_GRAVITY = 2880 # Gravité appliquée au joueur (px/s²)
+PLAYER_JUMP_STRENGTH = -840 # Force du saut du joueur (px/s, valeur négative pour monter)
+PLAYER_SPEED = 300 # Vitesse de déplacement horizontal du joueur (px/s)
+PLAYER_MAX_FALL_SPEED = 900 # Vitesse de chute maximale (px/s)
 
 # Propriétés de la carte
 TILE_SIZE = 40 # Taille d'une tuile (carrée) en pixels
+CHUNK_SIZE = 256 # Taille (en pixels) d'un bloc pré-rendu de la carte
+CHUNK_CACHE_MAX = 48 # Nombre maximum de blocs gardés en mémoire (éviction LRU)
+RENDER_MARGIN = 32 # Marge (en pixels) autour de l'écran dans laquelle les sprites sont quand même dessinés
+BROADPHASE_CELL_SIZE = 128 # Taille (en pixels) d'une case de la table spatiale des entités
+
+# Activation des monstres selon leur distance à l'écran
+MONSTER_ACTIVE_MARGIN = 256 # Marge (px) autour de l'écran : monstres mis à jour à chaque pas
+MONSTER_REDUCED_MARGIN = 1024 # Marge (px) jusqu'à laquelle les monstres sont mis à jour moins souvent (au-delà : endormis)
+MONSTER_REDUCED_INTERVAL = 4 # Les monstres de la zone réduite sont mis à jour un pas sur N
+MONSTER_MAX_STEP_DISTANCE = 8 # Déplacement maximal (px) d'un sous-pas de rattrapage (réveil d'un monstre)
+MONSTER_MAX_FAST_FORWARD = 0.5 # Temps (s) simulé au plus au réveil d'un monstre dont la patrouille ne peut pas être calculée directement
+MONSTER_MAX_CATCH_UP = 64 # Monstres rattrapés au plus par pas de simulation (les autres attendent les pas suivants)
+
+# Fonds parallaxe par niveau (nom du fichier .tmx -> couches, de la plus lointaine à la plus proche)
+# Options d'une couche : voir ParallaxLayer dans parallax.py
+LEVEL_BACKGROUNDS = {
+    "game_map.tmx": [
+        {"image": "Fond/beautiful-skyscape-daytime_23-2149265589.jpg", "factor": 0.03, "height": HEIGHT * 2,
+         "tile_x": True, "tile_y": True},
+        {"image": "Fond/dark_forest.png", "factor": 0.1, "height": HEIGHT * 2, "fit": True, "alpha": 220},
+    ],
+}
 
 # Propriétés du Javelot
-JAVELIN_SPEED = 15       # Vitesse initiale du javelot
-JAVELIN_GRAVITY = 0.5    # Gravité affectant le javelot
-JAVELIN_RECALL_SPEED = 25 # Vitesse à laquelle le javelot retourne au joueur
+JAVELIN_SPEED = 900       # Vitesse initiale du javelot (px/s)
+JAVELIN_GRAVITY = 1800    # Gravité affectant le javelot (px/s²)
+JAVELIN_RECALL_SPEED = 1500 # Vitesse à laquelle le javelot retourne au joueur (px/s)
+JAVELIN_CATCH_DISTANCE = 12.5 # Distance (px) à laquelle le joueur rattrape le javelot rappelé
 JAVELIN_LIFESPAN_STUCK = 10000 # Temps en ms avant qu'un javelot planté disparaisse (optionnel, non implémenté ici)
+JAVELIN_ROTATION_STEP = 3 # Pas (en degrés) des images pré-tournées du javelot
+JAVELIN_TIP_SIZE = 4 # Côté (px) de la boîte de collision de la pointe du javelot avec les murs
 
 # Volume Global de la musique
 GAME_VOLUME = 1.0  # Default volume (100%)
+
+# Son (voir audio.py)
+MUSIC_VOLUME = 1.0 # Volume du bus musique (multiplié par GAME_VOLUME)
+SFX_VOLUME = 1.0 # Volume du bus des effets sonores (multiplié par GAME_VOLUME)
+AUDIO_CHANNELS = 16 # Nombre de canaux du mixeur : effets sonores joués en même temps au plus
+AUDIO_MAX_VOICES = 4 # Nombre de fois au plus qu'un même effet est joué en même temps
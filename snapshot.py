@@ -0,0 +1,156 @@
+# snapshot.py
+"""
+Instantané binaire compact de l'état du monde (points de contrôle et sauvegardes).
+
+Un instantané contient tout ce qui change pendant une partie : joueur, javelot,
+monstres et caméra. Le niveau chargé (carte, collisions, images) n'en fait pas
+partie : restaurer un instantané ne recharge rien, il remet seulement les
+valeurs en place. Le même format sert aux fichiers de sauvegarde.
+
+Format (petit-boutiste) :
+    en-tête  : "GOTS", version (u16), javelot (u8 : 0 = aucun, sinon 1 + indice
+               dans JAVELIN_STATES), longueur du nom du niveau (u8), nombre de monstres (u32)
+    niveau   : nom du fichier .tmx (UTF-8)
+    joueur   : position exacte x, y et vitesse x, y (f64),
+               options (u8 : bit 0 au sol, bit 1 javelot en main, bit 2 regarde à gauche)
+    javelot  : (s'il existe) position x, y, vitesse x, y et angle (f64),
+               options (u8 : bit 0 dans 'platforms', bit 1 dans 'javelins_flying')
+    monde    : décalage de la caméra x, y (i32), compteur de pas des monstres (u32)
+    monstres : tableaux de MONSTER_FIELDS l'un après l'autre (octets bruts NumPy)
+"""
+import os
+import struct
+import numpy as np
+from javelin import Javelin
+from monstre import MONSTER_FIELDS
+
+SNAPSHOT_MAGIC = b"GOTS"
+SNAPSHOT_VERSION = 1
+
+HEADER = struct.Struct("<4sHBBI")
+PLAYER = struct.Struct("<4dB")
+JAVELIN = struct.Struct("<5dB")
+WORLD = struct.Struct("<iiI")
+
+JAVELIN_STATES = ("flying", "stuck", "returning")
+
+# Options du joueur
+PLAYER_ON_GROUND = 1
+PLAYER_HAS_JAVELIN = 2
+PLAYER_FACING_LEFT = 4
+# Options du javelot
+JAVELIN_IN_PLATFORMS = 1
+JAVELIN_IN_FLIGHT = 2
+
+
+def get_field_dtype(array):
+    """ Type des valeurs d'un tableau de monstres dans l'instantané (petit-boutiste). """
+    return array.dtype.newbyteorder("<")
+
+
+def capture_world(game_state):
+    """
+    Capture l'état du monde d'une partie en cours.
+    :return: L'instantané (bytes).
+    """
+    player = game_state.player
+    monsters = game_state.monsters
+    javelin = player.active_javelin_sprite
+    level = os.path.basename(game_state.level_path).encode("utf-8")
+
+    javelin_code = 1 + JAVELIN_STATES.index(javelin.state) if javelin else 0
+    parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, javelin_code, len(level), len(monsters)), level]
+
+    options = ((PLAYER_ON_GROUND if player.on_ground else 0) | (PLAYER_HAS_JAVELIN if player.has_javelin else 0)
+               | (PLAYER_FACING_LEFT if player.facing == "gauche" else 0))
+    parts.append(PLAYER.pack(player.pos.x, player.pos.y, player.vel.x, player.vel.y, options))
+
+    if javelin:
+        options = ((JAVELIN_IN_PLATFORMS if game_state.platforms.has(javelin) else 0)
+                   | (JAVELIN_IN_FLIGHT if game_state.javelins_flying.has(javelin) else 0))
+        parts.append(JAVELIN.pack(javelin.pos.x, javelin.pos.y, javelin.vel.x, javelin.vel.y,
+                                  javelin.stuck_angle, options))
+
+    camera_x, camera_y = game_state.camera.camera_rect.topleft
+    parts.append(WORLD.pack(camera_x, camera_y, monsters.step_index))
+    for name in MONSTER_FIELDS:
+        array = getattr(monsters, name)
+        parts.append(array.astype(get_field_dtype(array), copy=False).tobytes())
+    return b"".join(parts)
+
+
+def restore_world(game_state, data):
+    """
+    Remet le monde dans l'état d'un instantané, sans rien recharger : le joueur est
+    ressuscité sur place, le javelot et les monstres sont recréés à l'identique.
+    Lève ValueError si l'instantané est invalide ou provient d'un autre niveau.
+    """
+    magic, version, javelin_code, level_length, monster_count = HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"Instantané incompatible (version {version}).")
+    offset = HEADER.size
+    level = data[offset:offset + level_length].decode("utf-8")
+    if level != os.path.basename(game_state.level_path):
+        raise ValueError(f"Instantané d'un autre niveau ({level}).")
+    offset += level_length
+
+    pos_x, pos_y, vel_x, vel_y, options = PLAYER.unpack_from(data, offset)
+    offset += PLAYER.size
+    player = game_state.player
+    player.respawn((pos_x, pos_y), (vel_x, vel_y), bool(options & PLAYER_ON_GROUND),
+                   bool(options & PLAYER_HAS_JAVELIN), "gauche" if options & PLAYER_FACING_LEFT else "droite")
+
+    # Javelot : l'ancien est retiré de tous les groupes, celui de l'instantané est recréé
+    for sprite in game_state.all_sprites:
+        if sprite is not player:
+            sprite.kill()
+    game_state.platforms.empty()
+    game_state.javelins_flying.empty()
+    player.active_javelin_sprite = None
+    if javelin_code:
+        pos_x, pos_y, vel_x, vel_y, angle, options = JAVELIN.unpack_from(data, offset)
+        offset += JAVELIN.size
+        javelin = Javelin(game_state, player, player.rect.center)
+        javelin.restore(JAVELIN_STATES[javelin_code - 1], (pos_x, pos_y), (vel_x, vel_y), angle)
+        game_state.all_sprites.add(javelin)
+        if options & JAVELIN_IN_PLATFORMS:
+            game_state.platforms.add(javelin)
+        if options & JAVELIN_IN_FLIGHT:
+            game_state.javelins_flying.add(javelin)
+        player.active_javelin_sprite = javelin
+
+    camera_x, camera_y, step_index = WORLD.unpack_from(data, offset)
+    offset += WORLD.size
+    game_state.camera.camera_rect.topleft = (camera_x, camera_y)
+
+    monsters = game_state.monsters
+    fields = {}
+    for name in MONSTER_FIELDS:
+        dtype = getattr(monsters, name).dtype
+        array = np.frombuffer(data, dtype=dtype.newbyteorder("<"), count=monster_count, offset=offset)
+        fields[name] = array.astype(dtype)
+        offset += array.nbytes
+    monsters.restore(fields, step_index)
+
+    # Pas d'interpolation entre la position de la mort et celle du point de contrôle
+    for sprite in game_state.all_sprites:
+        sprite.prev_center = sprite.rect.center
+    monsters.remember_positions()
+
+
+def save_snapshot(path, data):
+    """ Écrit un instantané dans un fichier de sauvegarde. """
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def load_snapshot(path):
+    """ Lit un fichier de sauvegarde (ValueError si ce n'est pas un instantané compatible). """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"'{path}' n'est pas une sauvegarde valide.")
+    magic, version = HEADER.unpack_from(data)[:2]
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"'{path}' n'est pas une sauvegarde compatible (version {version}).")
+    return data
@@ -0,0 +1,72 @@
+from settings import BROADPHASE_CELL_SIZE
+
+class SpatialHash:
+    """
+    Table de hachage spatiale uniforme (broadphase) pour les entités fixes du niveau.
+    Le monde est découpé en cases carrées ; chaque objet est rangé dans les cases
+    que couvre son rectangle. Une requête ne teste que les objets des cases voisines.
+    Les objets sont classés par étiquette ("spike", "portal", "checkpoint") et insérés
+    une seule fois au chargement. Les monstres n'y sont pas : le MonsterSystem les
+    teste tous d'un coup dans ses tableaux (voir MonsterSystem.query_rect).
+    """
+    def __init__(self, cell_size=BROADPHASE_CELL_SIZE):
+        """
+        Initialise une table vide.
+        :param cell_size: Taille d'une case en pixels.
+        """
+        self.cell_size = cell_size
+        self.buckets = {} # étiquette -> {(colonne, ligne): [objets]}
+        self.objects = {} # étiquette -> [objets], dans l'ordre d'insertion
+
+    def cells_for(self, rect):
+        """
+        Retourne la plage de cases (colonnes, lignes) couverte par un rectangle.
+        """
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def clear(self, tag=None):
+        """
+        Vide la table, ou seulement les objets d'une étiquette.
+        """
+        if tag is None:
+            self.buckets.clear()
+            self.objects.clear()
+        else:
+            self.buckets.pop(tag, None)
+            self.objects.pop(tag, None)
+
+    def insert(self, obj, tag):
+        """
+        Ajoute un objet (ayant un attribut rect) sous une étiquette.
+        """
+        buckets = self.buckets.setdefault(tag, {})
+        self.objects.setdefault(tag, []).append(obj)
+        cols, rows = self.cells_for(obj.rect)
+        for row in rows:
+            for col in cols:
+                buckets.setdefault((col, row), []).append(obj)
+
+    def insert_group(self, group, tag):
+        """
+        Ajoute tous les objets d'un groupe de sprites (ou d'une liste) sous une étiquette.
+        """
+        for obj in group:
+            self.insert(obj, tag)
+
+    def query_rect(self, rect, tag):
+        """
+        Retourne les objets d'une étiquette dont le rectangle chevauche 'rect'.
+        """
+        buckets = self.buckets.get(tag)
+        if not buckets:
+            return []
+        found = {} # dict plutôt que set pour garder un ordre stable
+        cols, rows = self.cells_for(rect)
+        for row in rows:
+            for col in cols:
+                for obj in buckets.get((col, row), ()):
+                    if obj not in found and rect.colliderect(obj.rect):
+                        found[obj] = None
+        return list(found)
@@ -1,27 +1,72 @@
+import time
+from collections import deque
 import pygame as pg
-from states import MenuState, GameState, PauseState, SettingsState, IntroState, OutroState
+from settings import LEVEL_LOAD_STEP_BUDGET
+from states import MenuState, GameState, PauseState, SettingsState, IntroState, LoadingState, OutroState
 
 class StateManager:
     """
     Gère la pile d'états du jeu et les transitions.
+    Les états sont enregistrés sous forme de constructeurs : chacun n'est créé qu'à
+    sa première utilisation (ou en avance, dans un budget de temps par image, voir prewarm).
     """
     def __init__(self, game_instance):
         self.game = game_instance # Référence à l'instance principale du jeu
-        self.states_map = { # Dictionnaire pour stocker les instances des états
-            "menu": MenuState(self, self.game),
-            "game": GameState(self, self.game),
-            "spawn": GameState(self, self.game),  # Alias pour compatibilité
-            "pause": PauseState(self, self.game),
-            "option": SettingsState(self, self.game),
-            "intro": IntroState(self, self.game),  # Register the new state
-            "outro": OutroState(self, self.game)   # Ajoute l'état de fin
-        }
+        self.factories = {} # Clé -> constructeur de l'état, appelé avec (manager, game)
+        self.aliases = {} # Autre nom -> clé de l'état (une seule instance partagée)
+        self.states_map = {} # Clé -> instance de l'état, une fois créée
+        self.prewarm_queue = deque() # Clés des états à créer en avance
+
+        self.register("menu", MenuState)
+        self.register("game", GameState)
+        self.register_alias("spawn", "game")  # Alias pour compatibilité
+        self.register("pause", PauseState)
+        self.register("option", SettingsState)
+        self.register("intro", IntroState)
+        self.register("loading", LoadingState) # Si l'intro est passée avant la fin du chargement du niveau
+        self.register("outro", OutroState) # État de fin
 
         self.state_stack = [] # Pile pour gérer les états (ex: pause par-dessus jeu)
         
         # Démarrer avec l'état du menu
         self.push_state("menu") 
 
+    def register(self, state_key, factory):
+        """ Enregistre le constructeur d'un état (créé à sa première utilisation). """
+        self.factories[state_key] = factory
+
+    def register_alias(self, alias, state_key):
+        """ Donne un autre nom à un état : les deux noms désignent la même instance. """
+        self.aliases[alias] = state_key
+
+    def get_state(self, state_key):
+        """ Retourne l'instance d'un état, en la créant si besoin (None si la clé est inconnue). """
+        state_key = self.aliases.get(state_key, state_key)
+        state = self.states_map.get(state_key)
+        if state is None and state_key in self.factories:
+            state = self.states_map[state_key] = self.factories[state_key](self, self.game)
+        return state
+
+    def prewarm(self, state_keys):
+        """
+        Demande la création en avance de quelques états, quelques-uns par appel à
+        prewarm_step, pour qu'ils soient prêts sans ralentir le démarrage.
+        """
+        self.prewarm_queue.extend(state_keys)
+
+    def prewarm_step(self, budget=LEVEL_LOAD_STEP_BUDGET):
+        """
+        Crée les états demandés par prewarm tant que le budget de temps (secondes) n'est
+        pas épuisé (à appeler une fois par image). Un constructeur ne peut pas être
+        interrompu : au moins un état est créé par appel, même s'il dépasse le budget.
+        """
+        deadline = time.perf_counter() + budget
+        while self.prewarm_queue and time.perf_counter() < deadline:
+            state_key = self.aliases.get(self.prewarm_queue[0], self.prewarm_queue[0])
+            self.prewarm_queue.popleft()
+            if state_key not in self.states_map:
+                self.get_state(state_key)
+
     def get_active_state(self):
         """ Retourne l'état actif (au sommet de la pile). """
         return self.state_stack[-1] if self.state_stack else None
@@ -31,7 +76,7 @@ class StateManager:
         if self.state_stack:
             self.state_stack[-1].exit_state()  # Notifie l'ancien état actif (s'il y en a un)
         
-        state = self.states_map.get(state_key)
+        state = self.get_state(state_key)
         if state:
             self.state_stack.append(state)
             state.enter_state()  # Notifie le nouvel état actif
@@ -71,8 +116,9 @@ class StateManager:
         if active_state:
             active_state.update(dt)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         # Dessine tous les états dans la pile, du bas vers le haut,
         # pour que les états superposés (comme la pause) se dessinent correctement.
+        # alpha : fraction du pas de simulation suivant déjà écoulée (interpolation)
         for state in self.state_stack:
-            state.draw(surface)
+            state.draw(surface, alpha)
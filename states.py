@@ -3,11 +3,25 @@ from settings import *
 from player import Player
 from map import Map
 from camera import Camera
-from ui_elements import Button
-from javelin import Javelin
-from monstre import Zombie
+from ui_elements import Button, Label, AltitudeGauge, Hud
+from javelin import Javelin, JAVELIN_IMAGE, JAVELIN_HIT_SOUND
+from monstre import MonsterSystem, register_zombie_clips, ZOMBIE_WALK_IMAGES, ZOMBIE_DEATH_IMAGES
+from player import PLAYER_IMAGES
+from animation import clips
+from render_queue import RenderQueue, get_render_position
+from spatial_hash import SpatialHash
+from assets import assets
+from audio import audio
+from parallax import ParallaxBackground
+from snapshot import capture_world, restore_world
+from level_loader import LevelLoader
+from text import get_font, TypewriterText
 import os
-from settings import GAME_VOLUME
+
+# Niveau joué
+LEVEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "TileMap", "game_map.tmx")
+SPIKE_IMAGE = "TileMap/picpic.png"
+PORTAL_IMAGE = "TileMap/portail1.png"
 
 class State:
     """
@@ -31,8 +45,11 @@ class State:
         """ Met à jour la logique de cet état. """
         pass
 
-    def draw(self, surface):
-        """ Dessine cet état sur la surface donnée. """
+    def draw(self, surface, alpha=1.0):
+        """
+        Dessine cet état sur la surface donnée.
+        :param alpha: Fraction du pas de simulation suivant déjà écoulée, pour interpoler l'affichage.
+        """
         surface.fill(LIGHTBLUE)
         for button in self.buttons:
             button.draw(surface)
@@ -52,15 +69,17 @@ class IntroState(State):
     """
     def __init__(self, manager, game_instance):
         super().__init__(manager, game_instance)
-        self.font = pg.font.Font(None, 36)
+        self.font = get_font(36)
         self.paragraphes = [
             "La fête faisait rage sur le mont Olympe, un banquet où les dieux se lâchaient complètement, oubliant toute retenue.",
             " Dionysos, le dieu du vin et de la fête, était au centre de l’attention, riant et plaisantant, tandis que les dieux se livraient à des excès de tous genres. Le vin coulait à flots, les mets se succédaient sans fin, et les danses étaient de plus en plus folles.",
             " Mais pour Zeus, le roi des dieux, c’était trop. Il voyait ses pairs sombrer dans la démesure, et l’harmonie de l’Olympe s’effondrer sous le poids des excès. Son regard, habituellement sage, se faisait de plus en plus sombre. Une colère sourde montait en lui, alors que la fête de Dionysos devenait un chaos qu’il ne pouvait plus supporter."
         ]
+        # Mise en page calculée une seule fois par paragraphe
+        self.texts = [TypewriterText(paragraphe, self.font, (255,255,255), WIDTH - 2 * 100, WIDTH // 2, 60)
+                      for paragraphe in self.paragraphes]
         self.current_paragraph = 0
         self.current_letter = 0
-        self.displayed_text = ""
         self.last_update = pg.time.get_ticks()
         self.letter_delay = 40  # ms
         self.pause_time = 2000  # ms
@@ -69,15 +88,20 @@ class IntroState(State):
         self.finished = False
         self.skip_rect = pg.Rect(300, 500, 200, 50)
         self.skip_hover = False
+        self.skip_text = self.font.render("Passer l'intro", True, (255,255,255))
+        self.skip_text_rect = self.skip_text.get_rect(center=self.skip_rect.center)
+        self.game_state = None
 
     def enter_state(self):
         self.current_paragraph = 0
         self.current_letter = 0
-        self.displayed_text = ""
         self.last_update = pg.time.get_ticks()
         self.paused = False
         self.pause_start = 0
         self.finished = False
+        # Le niveau est chargé en arrière-plan pendant l'introduction
+        self.game_state = self.manager.get_state("game")
+        self.game_state.start_loading()
 
     def handle_events(self, events):
         for event in events:
@@ -88,8 +112,11 @@ class IntroState(State):
                     self.finished = True
 
     def update(self, dt):
+        # Le niveau n'est construit (seule étape bloquante) que pendant une pause du texte, quand rien ne bouge
+        self.game_state.continue_loading(build=self.paused)
         if self.finished:
-            self.manager.set_state("spawn")
+            # Intro passée avant la fin du chargement : écran de chargement
+            self.manager.set_state("spawn" if self.game_state.is_level_ready() else "loading")
             return
 
         now = pg.time.get_ticks()
@@ -98,13 +125,11 @@ class IntroState(State):
                 self.paused = False
                 self.current_paragraph += 1
                 self.current_letter = 0
-                self.displayed_text = ""
                 self.last_update = now
         elif self.current_paragraph < len(self.paragraphes):
             paragraphe = self.paragraphes[self.current_paragraph]
             if self.current_letter < len(paragraphe):
                 if now - self.last_update > self.letter_delay:
-                    self.displayed_text += paragraphe[self.current_letter]
                     self.current_letter += 1
                     self.last_update = now
             else:
@@ -114,38 +139,51 @@ class IntroState(State):
             # Fin de l'intro, bascule immédiatement sur "spawn"
             self.finished = True
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         surface.fill((0, 0, 0))
         # Affiche le texte centré, multi-lignes
-        self._draw_text(surface, self.displayed_text, self.font, (255,255,255), 100, 60)
+        if self.current_paragraph < len(self.texts):
+            self.texts[self.current_paragraph].draw(surface, self.current_letter)
         # Bouton "passer l'intro"
         mouse_pos = pg.mouse.get_pos()
         self.skip_hover = self.skip_rect.collidepoint(mouse_pos)
         color = (150,150,150) if self.skip_hover else (100,100,100)
         pg.draw.rect(surface, color, self.skip_rect)
-        txt = self.font.render("Passer l'intro", True, (255,255,255))
-        txt_rect = txt.get_rect(center=self.skip_rect.center)
-        surface.blit(txt, txt_rect)
-
-    def _draw_text(self, ecran, texte, font, color, x, y):
-        largeur_max = WIDTH - 2 * x
-        mots = texte.split(' ')
-        lignes = []
-        ligne_actuelle = ""
-        for mot in mots:
-            test_ligne = f"{ligne_actuelle} {mot}".strip()
-            if font.size(test_ligne)[0] <= largeur_max:
-                ligne_actuelle = test_ligne
-            else:
-                lignes.append(ligne_actuelle)
-                ligne_actuelle = mot
-        if ligne_actuelle:
-            lignes.append(ligne_actuelle)
-        for ligne in lignes:
-            texte_surface = font.render(ligne, True, color)
-            texte_rect = texte_surface.get_rect(center=(WIDTH // 2, y))
-            ecran.blit(texte_surface, texte_rect)
-            y += font.get_linesize()
+        surface.blit(self.skip_text, self.skip_text_rect)
+
+
+class LoadingState(State):
+    """
+    Écran de chargement, affiché si l'introduction est passée avant que le niveau
+    chargé en arrière-plan soit prêt.
+    """
+    def __init__(self, manager, game_instance):
+        super().__init__(manager, game_instance)
+        self.font = get_font(36)
+        self.text = self.font.render("Chargement...", True, (255, 255, 255))
+        self.text_rect = self.text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
+        self.bar_rect = pg.Rect(WIDTH // 4, HEIGHT // 2, WIDTH // 2, 20)
+        self.game_state = None
+        self.drawn = False
+
+    def enter_state(self):
+        self.game_state = self.manager.get_state("game")
+        self.game_state.start_loading()
+        self.drawn = False
+
+    def update(self, dt):
+        # La construction du niveau (bloquante) attend qu'une image de l'écran soit affichée
+        if self.game_state.continue_loading(build=self.drawn):
+            self.manager.set_state("spawn")
+
+    def draw(self, surface, alpha=1.0):
+        surface.fill((0, 0, 0))
+        surface.blit(self.text, self.text_rect)
+        pg.draw.rect(surface, (100, 100, 100), self.bar_rect)
+        progress_rect = self.bar_rect.copy()
+        progress_rect.width = int(self.bar_rect.width * self.game_state.get_loading_progress())
+        pg.draw.rect(surface, (255, 255, 255), progress_rect)
+        self.drawn = True
 
 
 class OutroState(State):
@@ -154,7 +192,7 @@ class OutroState(State):
     """
     def __init__(self, manager, game_instance):
         super().__init__(manager, game_instance)
-        self.font = pg.font.Font(None, 36)
+        self.font = get_font(36)
         self.texte = (
             "Après un long exil loin du Mont Olympe, Dionysos fit enfin son retour.\n"
             "Le silence planait sur les cieux tandis qu’il s’avançait, le pas plus calme,\n"
@@ -163,7 +201,7 @@ class OutroState(State):
             "sans dire un mot. Puis, dans un souffle à peine audible, il hocha la tête.\n"
             "L’Olympe pouvait de nouveau vibrer — non pas dans l’excès, mais dans l’équilibre retrouvé."
         )
-        self.displayed_text = ""
+        self.text = TypewriterText(self.texte, self.font, (255,255,255), WIDTH - 2 * 100, WIDTH // 2, 60)
         self.current_letter = 0
         self.last_update = pg.time.get_ticks()
         self.letter_delay = 40  # ms
@@ -173,7 +211,6 @@ class OutroState(State):
         self.pause_start = 0
 
     def enter_state(self):
-        self.displayed_text = ""
         self.current_letter = 0
         self.last_update = pg.time.get_ticks()
         self.finished = False
@@ -196,7 +233,6 @@ class OutroState(State):
                 self.finished = True
         elif self.current_letter < len(self.texte):
             if now - self.last_update > self.letter_delay:
-                self.displayed_text += self.texte[self.current_letter]
                 self.current_letter += 1
                 self.last_update = now
         else:
@@ -204,30 +240,9 @@ class OutroState(State):
             self.paused = True
             self.pause_start = now
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         surface.fill((0, 0, 0))
-        self._draw_text(surface, self.displayed_text, self.font, (255,255,255), 100, 60)
-
-    def _draw_text(self, ecran, texte, font, color, x, y):
-        largeur_max = WIDTH - 2 * x
-        lignes = []
-        for ligne in texte.split('\n'):
-            mots = ligne.split(' ')
-            ligne_actuelle = ""
-            for mot in mots:
-                test_ligne = f"{ligne_actuelle} {mot}".strip()
-                if font.size(test_ligne)[0] <= largeur_max:
-                    ligne_actuelle = test_ligne
-                else:
-                    lignes.append(ligne_actuelle)
-                    ligne_actuelle = mot
-            if ligne_actuelle:
-                lignes.append(ligne_actuelle)
-        for ligne in lignes:
-            texte_surface = font.render(ligne, True, color)
-            texte_rect = texte_surface.get_rect(center=(WIDTH // 2, y))
-            ecran.blit(texte_surface, texte_rect)
-            y += font.get_linesize()
+        self.text.draw(surface, self.current_letter)
 
 
 class MenuState(State):
@@ -236,13 +251,13 @@ class MenuState(State):
     """
     def __init__(self, manager, game_instance):
         super().__init__(manager, game_instance)
-        self.title_font = pg.font.Font(None, 74)
+        self.title_font = get_font(74)
+        self.title = Label(TITLE, self.title_font, WHITE, (WIDTH // 2, HEIGHT // 4))
         self.setup_buttons()
 
         # Charger l'image de fond
         try:
-            self.background_image = pg.image.load("Fond/menu_background.png").convert()
-            self.background_image = pg.transform.scale(self.background_image, (WIDTH, HEIGHT))
+            self.background_image = assets.get_image("Fond/menu_background.png", alpha=False, size=(WIDTH, HEIGHT))
         except Exception as e:
             print(f"Erreur: Impossible de charger l'image de fond du menu: {e}")
             self.background_image = None
@@ -287,7 +302,7 @@ class MenuState(State):
         super().exit_state()
         # Pas besoin de gérer la musique ici, elle est arrêtée dans enter_state
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         # Dessiner l'image de fond
         if self.background_image:
             surface.blit(self.background_image, (0, 0))
@@ -295,9 +310,7 @@ class MenuState(State):
             surface.fill(LIGHTBLUE)  # Retourne à la couleur de fond par défaut si l'image échoue à charger
 
         # Dessiner le titre
-        title_surf = self.title_font.render(TITLE, True, WHITE)  # Change color to WHITE
-        title_rect = title_surf.get_rect(center=(WIDTH // 2, HEIGHT // 4))
-        surface.blit(title_surf, title_rect)
+        self.title.draw(surface)
 
         # Dessiner les boutons
         for button in self.buttons:
@@ -319,172 +332,257 @@ class GameState(State):
         self.monsters = None
         self.spikes = None  # Ajout pour les pics
         self.portals = None  # Ajout pour les portails
+        self.checkpoints = None # Zones de déclenchement des points de contrôle
+        self.checkpoint = None # Instantané du monde au dernier point de contrôle atteint (voir snapshot.py)
+        self.last_checkpoint = None # Dernier point de contrôle atteint
         self.portal_img = None
         self.music_playing = False
-
-        # Charger l'image de fond
-        try:
-            self.background_image = pg.image.load("Fond/dark_forest.png").convert()
-            self.background_image = pg.transform.scale(self.background_image, (WIDTH, HEIGHT))
-        except Exception as e:
-            print(f"Erreur: Impossible de charger l'image de fond 'fond/dark_forest.png': {e}")
-            self.background_image = None
+        self.render_queue = RenderQueue()
+        self.broadphase = None
+        self.background = None # Fond parallaxe, créé au chargement du niveau
+        self.input = None # Source des entrées du joueur (clavier/souris, enregistrement ou replay)
+        self.level_path = None # Niveau chargé (gardé en mémoire entre deux parties)
+        self.loader = LevelLoader() # Chargement du niveau en arrière-plan (pendant l'introduction)
+        self.player_spawn = None
+        self.monster_spawns = []
+        self.monster_clips = None
 
         self.gauge_rect = pg.Rect(WIDTH - 20, HEIGHT // 2 - 150, 20, 300)  # création du rectangle de la jauge
         self.gauge_color = (0, 255, 0)  # Couleur de la jauge (vert)
         self.start_y = 6229  # Coordonée Y de départ
         self.end_y = 341  # Fin de la jauge (coordonnée Y de la carte)
+        self.altitude_gauge = AltitudeGauge(self.gauge_rect, self.start_y, self.end_y, self.gauge_color)
+        self.hud = Hud([self.altitude_gauge])
 
-    def draw_altitude_gauge(self, surface):
+    def draw_hud(self, surface):
         """
-        Draws the altitude gauge on the screen.
+        Dessine le HUD (jauge d'altitude). Il n'est recomposé que si la jauge a changé.
         """
         # calculer la hauteur de la jauge en fonction de la position du joueur
         if self.player:
-            player_y = self.player.rect.y
-            fill_percentage = max(0, min(1, (self.start_y - player_y) / (self.start_y - self.end_y)))
-
-            # Calculer la hauteur remplie de la jauge
-            filled_height = int(self.gauge_rect.height * fill_percentage)
-
-            # dessiner le contour de la jauge
-            pg.draw.rect(surface, (0, 0, 0), self.gauge_rect, 2)  # bordure noire
-
-            # Dessiner la jauge remplie
-            filled_rect = pg.Rect(
-                self.gauge_rect.x,
-                self.gauge_rect.y + self.gauge_rect.height - filled_height,
-                self.gauge_rect.width,
-                filled_height
-            )
-            pg.draw.rect(surface, self.gauge_color, filled_rect)
+            self.altitude_gauge.set_value(self.player.rect.y)
+            self.hud.draw(surface)
 
     def enter_state(self):
         super().enter_state()
         # commenté la musique si elle est déjà jouée
         if not self.music_playing:
-            try:
-                pg.mixer.music.load("Music/Benz.wav")  # charger le fichier Benz.wav
-                pg.mixer.music.set_volume(GAME_VOLUME)  # mettre le volume (0.0 à 1.0)
-                pg.mixer.music.play(-1)  # jouer en boucle (-1 pour une boucle infinie)
-                self.music_playing = True
-            except pg.error as e:
-                print(f"Erreur: Impossible de charger ou jouer la musique 'Music/Benz.wav': {e}")
+            # jouer Benz.wav en boucle, au volume du bus musique
+            self.music_playing = audio.play_music("Music/Benz.wav")
 
-        self.all_sprites = pg.sprite.Group()
-        self.platforms = pg.sprite.Group()
-        self.javelins_flying = pg.sprite.Group()
-        self.monsters = pg.sprite.Group()
-        self.spikes = pg.sprite.Group()  # Initialisation du groupe de pics
-        self.portals = pg.sprite.Group()  # Initialisation du groupe de portails
+        # Le niveau (carte, collisions, images) n'est chargé qu'une fois, souvent déjà pendant
+        # l'introduction (voir start_loading) ; ensuite, il est seulement remis à zéro
+        if not self.is_level_ready():
+            if not self.load_level(LEVEL_PATH):
+                self.manager.set_state("menu")
+                return
+        self.reset_level()
+
+        # Entrées du joueur : une nouvelle partie commence (enregistrement ou relecture depuis ce pas)
+        self.input = self.game.input_source
+        self.input.start(os.path.basename(LEVEL_PATH))
+
+        # Le temps passé à charger le niveau ne doit pas être rattrapé par la simulation
+        self.game.reset_timing()
 
-        map_file_path = ""
+    def is_level_ready(self):
+        """ Vrai si le niveau est construit : la partie peut commencer sans chargement. """
+        return self.map is not None and self.level_path == LEVEL_PATH
+
+    def get_level_images(self, map_file_path):
+        """
+        Images utilisées par un niveau en dehors de ses tilesets (préparées par le LevelLoader),
+        sous la forme (chemin, options de assets.get_image).
+        """
+        images = [(layer["image"], {"alpha": False})
+                  for layer in LEVEL_BACKGROUNDS.get(os.path.basename(map_file_path), [])]
+        for path in [SPIKE_IMAGE, PORTAL_IMAGE, JAVELIN_IMAGE] + ZOMBIE_WALK_IMAGES + ZOMBIE_DEATH_IMAGES + PLAYER_IMAGES:
+            images.append((path, {}))
+        return images
+
+    def start_loading(self):
+        """
+        Lance le chargement du niveau en arrière-plan (lecture, analyse et décodage des images
+        sur un thread), s'il n'est pas déjà chargé ou en cours de chargement.
+        """
+        if self.is_level_ready() or (self.loader.started and self.loader.path == LEVEL_PATH):
+            return
+        self.loader.start(LEVEL_PATH, self.get_level_images(LEVEL_PATH))
+
+    def continue_loading(self, build=True):
+        """
+        Fait avancer le chargement en arrière-plan (à appeler à chaque mise à jour) : conversion
+        de quelques images, puis construction du niveau quand tout est prêt.
+        :param build: Si False, la construction du niveau (bloquante) est repoussée.
+        :return: True quand la partie peut commencer sans attendre.
+        """
+        if self.is_level_ready():
+            return True
+        if self.loader.failed:
+            return True # La partie chargera le niveau normalement (et signalera l'erreur)
+        if self.loader.update() and build:
+            if not self.load_level(LEVEL_PATH, self.loader.level):
+                return True
+            return self.is_level_ready()
+        return False
+
+    def get_loading_progress(self):
+        """ Avancement du chargement du niveau, de 0 à 1. """
+        return 1.0 if self.is_level_ready() else self.loader.get_progress()
+
+    def load_level(self, map_file_path, level=None):
+        """
+        Charge un niveau et tout ce qui ne change pas pendant une partie : carte, grille
+        de collision, fond, pics, portails, animations et points d'apparition.
+        :param level: Niveau compilé déjà lu par le LevelLoader, sinon il est lu ici.
+        :return: False si le niveau n'a pas pu être chargé.
+        """
+        self.map = None
+        self.level_path = None
         try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            map_file_path = os.path.join(base_dir, "TileMap", "game_map.tmx")
-            
-            self.map = Map(self, map_file_path)
+            self.map = Map(self, map_file_path, level)
         except FileNotFoundError:
             print(f"Erreur critique: Fichier TMX introuvable ({map_file_path}).")
             print("Vérifications suggérées:")
             print(f"1. Le fichier TMX existe-t-il à '{map_file_path}'?")
             print(f"2. Les images des tilesets sont-elles présentes dans '{os.path.dirname(map_file_path)}'?")
-            self.manager.set_state("menu")
-            return
+            return False
         except Exception as e:
             print(f"Erreur lors du chargement de la carte TMX ({map_file_path}): {e}.")
-            self.manager.set_state("menu")
-            return
+            return False
 
         self.map.load_map_objects()
 
+        # Groupes de sprites : conservés d'une partie à l'autre (vidés par reset_level)
+        self.all_sprites = pg.sprite.Group()
+        self.platforms = pg.sprite.Group()
+        self.javelins_flying = pg.sprite.Group()
+        self.spikes = pg.sprite.Group()  # Initialisation du groupe de pics
+        self.portals = pg.sprite.Group()  # Initialisation du groupe de portails
+        self.checkpoints = pg.sprite.Group()
+
+        # Fond parallaxe du niveau (couches redimensionnées une seule fois)
+        self.background = ParallaxBackground.from_config(LEVEL_BACKGROUNDS.get(os.path.basename(map_file_path), []))
+
         # --- Ajout : Charger les pics depuis la map avec une image ---
-        if hasattr(self.map, "tmx_data"):
-            try:
-                spike_img = pg.image.load("TileMap/picpic.png").convert_alpha()
-            except Exception as e:
-                print(f"Erreur chargement image pic: {e}")
-                spike_img = None
-            for layer in self.map.tmx_data.objectgroups:
-                for obj in layer:
-                    if obj.name == "picpic":
-                        spike_sprite = pg.sprite.Sprite()
-                        if spike_img:
-                            spike_sprite.image = pg.transform.scale(spike_img, (int(obj.width), int(obj.height)))
-                        else:
-                            spike_sprite.image = pg.Surface((obj.width, obj.height), pg.SRCALPHA)
-                        spike_sprite.rect = pg.Rect(obj.x, obj.y, obj.width, obj.height)
-                        self.spikes.add(spike_sprite)
+        try:
+            spike_img = assets.get_image(SPIKE_IMAGE)
+        except Exception as e:
+            print(f"Erreur chargement image pic: {e}")
+            spike_img = None
+        for obj in self.map.get_objects("picpic"):
+            spike_sprite = pg.sprite.Sprite()
+            if spike_img:
+                spike_sprite.image = assets.get_image(SPIKE_IMAGE, size=(obj.width, obj.height))
+            else:
+                spike_sprite.image = pg.Surface((obj.width, obj.height), pg.SRCALPHA)
+            spike_sprite.rect = pg.Rect(obj.x, obj.y, obj.width, obj.height)
+            self.spikes.add(spike_sprite)
 
         # Charger les objets portail_de_l'end
-        if hasattr(self.map, "tmx_data"):
-            # Charger l'image du portail
-            try:
-                self.portal_img = pg.image.load("TileMap/portail1.png").convert_alpha()
-            except Exception as e:
-                print(f"Erreur chargement image portail: {e}")
-                self.portal_img = None
-            for layer in self.map.tmx_data.objectgroups:
-                for obj in layer:
-                    if obj.name == "Portail_de_l'end":
-                        portal_sprite = pg.sprite.Sprite()
-                        if self.portal_img:
-                            portal_sprite.image = pg.transform.scale(self.portal_img, (int(obj.width), int(obj.height)))
-                        else:
-                            portal_sprite.image = pg.Surface((obj.width, obj.height), pg.SRCALPHA)
-                        portal_sprite.rect = pg.Rect(obj.x, obj.y, obj.width, obj.height)
-                        self.portals.add(portal_sprite)
+        # Charger l'image du portail
+        try:
+            self.portal_img = assets.get_image(PORTAL_IMAGE)
+        except Exception as e:
+            print(f"Erreur chargement image portail: {e}")
+            self.portal_img = None
+        for obj in self.map.get_objects("Portail_de_l'end"):
+            portal_sprite = pg.sprite.Sprite()
+            if self.portal_img:
+                portal_sprite.image = assets.get_image(PORTAL_IMAGE, size=(obj.width, obj.height))
+            else:
+                portal_sprite.image = pg.Surface((obj.width, obj.height), pg.SRCALPHA)
+            portal_sprite.rect = pg.Rect(obj.x, obj.y, obj.width, obj.height)
+            self.portals.add(portal_sprite)
+
+        # Points de contrôle : zones invisibles, un instantané du monde est pris quand le joueur les atteint
+        for obj in self.map.get_objects("Checkpoint"):
+            checkpoint_sprite = pg.sprite.Sprite()
+            checkpoint_sprite.rect = pg.Rect(obj.x, obj.y, obj.width, obj.height)
+            self.checkpoints.add(checkpoint_sprite)
+
+        # Broadphase : les pics, portails et points de contrôle ne bougent pas, ils ne sont insérés qu'une fois
+        self.broadphase = SpatialHash()
+        self.broadphase.insert_group(self.spikes, "spike")
+        self.broadphase.insert_group(self.portals, "portal")
+        self.broadphase.insert_group(self.checkpoints, "checkpoint")
 
         map_width_pixels, map_height_pixels = self.map.get_map_dimensions()
         self.camera = Camera(map_width_pixels, map_height_pixels)
 
         spawn_point = self.find_spawn_point()
-        player_start_x, player_start_y = 810, 6200 #Coordonnées de départ du personnage
+        self.player_spawn = (810, 6200) #Coordonnées de départ du personnage
         if spawn_point:
-            player_start_x, player_start_y = spawn_point.x, spawn_point.y
+            self.player_spawn = (spawn_point.x, spawn_point.y)
         else:
             print("Avertissement (GameState): Aucun objet 'SpawnPoint' trouvé. Position par défaut.")
 
-        self.player = Player(self, player_start_x, player_start_y)
+        # Animations des zombies (marche dans les deux sens et mort), partagées par tous les zombies
+        register_zombie_clips()
+        self.monster_clips = (clips.get("zombie_walk"), clips.get("zombie_death"))
+
+        # Images et sons utilisés en cours de partie : chargés maintenant plutôt que pendant une frame
+        assets.preload([JAVELIN_IMAGE])
+        audio.preload([JAVELIN_HIT_SOUND])
+
+        # Monstres : simulés ensemble par le MonsterSystem (hors de all_sprites)
+        self.monsters = MonsterSystem(self.map.collision_grid, self.platforms)
+        #différent positionnement de départ des zombies avec toutes leurs caractéristiques (x, y, vitesse, patrouille)
+        self.monster_spawns = [(235, 4570, 60, 110),
+                               (385, 1210, 60, 225)]
+
+        self.level_path = map_file_path
+        return True
+
+    def reset_level(self):
+        """
+        Remet le niveau chargé dans son état de départ sans rien recharger :
+        joueur, javelots, monstres et caméra.
+        """
+        self.all_sprites.empty()
+        self.platforms.empty()
+        self.javelins_flying.empty()
+
+        self.player = Player(self, *self.player_spawn)
         self.all_sprites.add(self.player)
 
-        # Différents sprites de marche du zombie
-        zombie_images = [
-            pg.image.load("Sprites/Zombie1.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie2.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie3.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie4.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie5.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie6.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie7.png").convert_alpha(),
-            pg.image.load("Sprites/Zombie8.png").convert_alpha(),
-        ]
-        #différent positionnement de départ des zombies avec toutes leurs caractéristiques
-        zombie1 = Zombie(235, 4570, zombie_images, self.platforms, speed=80, walk_distance=110)
-        zombie2 = Zombie(385, 1210, zombie_images, self.platforms, speed=80, walk_distance=225)
-        # Ajout des zombies au groupe de sprites
-        self.all_sprites.add(zombie1)
-        self.all_sprites.add(zombie2) 
-        self.monsters.add(zombie1)
-        self.monsters.add(zombie2) 
+        walk_clip, death_clip = self.monster_clips
+        self.monsters.clear()
+        self.monsters.add_many(self.monster_spawns, walk_clip, death_clip)
 
+        self.camera.update(self.player.rect)
         self._player_dead = False  # Flag pour bloquer le jeu pendant la mort
+        self.checkpoint = None
+        self.last_checkpoint = None
 
     def exit_state(self):
         super().exit_state()
         # arrete la musique si elle est en cours
         if self.music_playing:
-            pg.mixer.music.stop()
+            audio.stop_music()
             self.music_playing = False
+        # Fin de la partie : enregistre le replay ou termine la relecture
+        if self.input and self.player:
+            self.input.finish(self)
+            self.input = None
+
+    def get_solid_rects(self, rect):
+        """
+        Retourne les rectangles solides qui chevauchent 'rect' :
+        la géométrie statique de la carte (grille de collision) et les plateformes
+        dynamiques du groupe 'platforms' (javelots plantés).
+        """
+        hits = self.map.collision_grid.query(rect)
+        for platform in self.platforms:
+            if platform.rect.colliderect(rect):
+                hits.append(platform.rect)
+        return hits
 
     def find_spawn_point(self):
-        if not hasattr(self, 'map') or not self.map.tmx_data:
+        if not self.map:
             return None
-        for layer in self.map.tmx_data.objectgroups:
-            for obj in layer:
-                if obj.name == "PlayerSpawn":
-                    return obj
-        return None
+        spawn_points = self.map.get_objects("PlayerSpawn")
+        return spawn_points[0] if spawn_points else None
 
     def handle_events(self, events):
         super().handle_events(events)
@@ -494,27 +592,54 @@ class GameState(State):
         for event in events:
             if event.type == pg.KEYDOWN:
                 if event.key == pg.K_SPACE or event.key == pg.K_UP or event.key == pg.K_z:
-                    if self.player:
-                        self.player.jump()
+                    if self.player and self.input:
+                        self.input.queue_jump()  # Appliqué au prochain pas de simulation
                 if event.key == pg.K_ESCAPE:
                     self.manager.push_state("pause")
 
             if event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    if self.player and self.camera:
+                    if self.player and self.camera and self.input:
                         mouse_screen_pos = event.pos
                         mouse_world_pos = self.camera.screen_to_world(mouse_screen_pos)
-                        self.player.throw_javelin(mouse_world_pos)
+                        self.input.queue_throw(mouse_world_pos)
 
     def update(self, dt):
         super().update(dt)
-        # Augmente dynamique le volume de la musique
-        if self.music_playing:
-            pg.mixer.music.set_volume(GAME_VOLUME)
 
-        if not self.player or not self.camera or not self.all_sprites:
+        if not self.player or not self.camera or not self.all_sprites or not self.input:
             return
 
+        # Entrées de ce pas (clavier/souris, ou lues dans le replay)
+        input_source = self.input  # La partie peut se terminer pendant le pas (exit_state)
+        tick = input_source.next_tick()
+        if tick is None:
+            return # Fin du replay
+        self.apply_input(tick)
+        self.step(dt)
+        input_source.end_tick(self)
+
+    def apply_input(self, tick):
+        """
+        Applique au joueur les entrées d'un pas de simulation (voir replay.TickInput).
+        """
+        self.player.controls = tick.keys
+        if self.player.is_dead:
+            return
+        if tick.jump:
+            self.player.jump()
+        for target in tick.throws:
+            self.player.throw_javelin(target)
+
+    def step(self, dt):
+        """
+        Avance la simulation d'un pas : sprites, caméra et collisions.
+        """
+        # Mémorise la position de chaque sprite avant le pas, pour l'interpolation à l'affichage
+        for sprite in self.all_sprites:
+            sprite.prev_center = sprite.rect.center
+        self.monsters.remember_positions()
+
         # Si le joueur est en train de mourir, ne rien mettre à jour d'autre que lui
         if getattr(self.player, "is_dead", False):
             self.player.update(dt)
@@ -523,27 +648,39 @@ class GameState(State):
 
         self.all_sprites.update(dt)
         self.camera.update(self.player.rect)
+        # Monstres : mis à jour selon leur distance à la zone visible (suit le joueur, pas l'affichage)
+        self.monsters.update(dt, self.camera.get_view_rect())
+
+        # --- Collision javelot-monstre : un seul monstre tué par javelot et par frame ---
+        # (les monstres vivants sont testés d'un coup par le MonsterSystem)
+        for javelin in self.javelins_flying:
+            if javelin.can_hit:
+                hits = self.monsters.query_rect(javelin.rect)
+                if hits:
+                    javelin.hit_monster(hits[0])
 
         # --- Collision joueur-monstre : lancer animation de mort ---
-        if self.monsters:
-            for monster in list(self.monsters):
-                if getattr(monster, "is_dead", False):
-                    continue
-                if pg.sprite.collide_rect(self.player, monster):
-                    if not getattr(self.player, "is_dead", False):
-                        self.player.die()
-                    break
+        if self.monsters.query_rect(self.player.rect):
+            if not getattr(self.player, "is_dead", False):
+                self.player.die()
         # --- Collision joueur-pics : lancer animation de mort ---
-        if self.spikes and pg.sprite.spritecollideany(self.player, self.spikes):
+        if self.broadphase.query_rect(self.player.rect, "spike"):
             if not getattr(self.player, "is_dead", False):
                 self.player.die()
 
+        # Point de contrôle : instantané du monde quand le joueur se pose sur un nouveau point
+        if self.player.on_ground and not self.player.is_dead:
+            for checkpoint in self.broadphase.query_rect(self.player.rect, "checkpoint"):
+                if checkpoint is not self.last_checkpoint:
+                    self.last_checkpoint = checkpoint
+                    self.checkpoint = capture_world(self)
+
         # Collision joueur-portail_de_l'end
-        if hasattr(self, "portals") and self.portals and pg.sprite.spritecollideany(self.player, self.portals):
+        if self.broadphase.query_rect(self.player.rect, "portal"):
             self.manager.set_state("outro")
             return
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         if not self.map or not self.camera or not self.all_sprites or not self.player:
             surface.fill(BLACK)
             if self.game.font:
@@ -552,45 +689,41 @@ class GameState(State):
                 surface.blit(err_surf, err_rect)
             return
 
-        # Dessiner l'image de fond
-        if self.background_image:
-            scaled_height = HEIGHT * 2  # Make the background image twice the screen height
-            scaled_width = int(self.background_image.get_width() * (scaled_height / self.background_image.get_height()))
-            scaled_background = pg.transform.scale(self.background_image, (scaled_width, scaled_height))
-
-            # calculer le décalage en fonction de la position du joueur
-            player_y = self.player.rect.y
-            max_offset = scaled_height - HEIGHT  # Maximum scrollable height
+        # La caméra suit la position interpolée du joueur (mouvement fluide quel que soit le nombre d'images)
+        self.camera.update(pg.Rect(get_render_position(self.player, alpha), self.player.rect.size))
 
-            # rendre le décalage proportionnel à la position du joueur
-            offset_y = max(0, min(max_offset, (player_y - self.end_y) / (self.start_y - self.end_y) * max_offset))
-
-            # Dessiner l'image de fond avec le décalage
-            surface.blit(scaled_background, (0, -offset_y))
+        # Dessiner le fond parallaxe
+        if self.background and self.background.layers:
+            self.background.draw(surface, self.camera)
         else:
             surface.fill(LIGHTBLUE)
 
         # dessiner la carte
         self.map.render(surface, self.camera)
 
-        for sprite in self.all_sprites:
-            if hasattr(sprite, 'image') and hasattr(sprite, 'rect'):
-                surface.blit(sprite.image, self.camera.apply(sprite.rect))
-
-        # --- Dessine les pics ---
-        if self.spikes:
-            for spike in self.spikes:
-                surface.blit(spike.image, self.camera.apply(spike.rect))
+        # Dessiner uniquement les sprites visibles, en un seul appel
+        # (monstres, joueur et javelots, puis les pics, puis le portail)
+        view_rect = self.camera.get_view_rect(RENDER_MARGIN)
+        self.render_queue.add_group(self.monsters.get_visible_sprites(view_rect), view_rect, layer=0, alpha=alpha)
+        self.render_queue.add_group(self.all_sprites, view_rect, layer=0, alpha=alpha)
+        self.render_queue.add_group(self.spikes, view_rect, layer=1)
+        self.render_queue.add_group(self.portals, view_rect, layer=2)
+        self.render_queue.flush(surface, self.camera)
 
-        # Dessiner le portail avec une image si disponible
-        if self.portals:
-            for portal in self.portals:
-                surface.blit(portal.image, self.camera.apply(portal.rect))
-
-        # Dessiner les javelots
-        self.draw_altitude_gauge(surface)
+        # Dessiner le HUD
+        self.draw_hud(surface)
 
     # Méthode appelée par Player à la fin de l'animation de mort
+    def respawn_player(self):
+        """
+        Ramène le monde au dernier point de contrôle atteint (sans rien recharger),
+        ou retourne au menu principal si aucun n'a été atteint.
+        """
+        if self.checkpoint is None:
+            self.go_to_main_menu()
+            return
+        restore_world(self, self.checkpoint)
+
     def go_to_main_menu(self):
         self.manager.set_state("menu")
 
@@ -602,7 +735,8 @@ class PauseState(State):
         super().__init__(manager, game_instance)
         self.overlay = pg.Surface((WIDTH, HEIGHT), pg.SRCALPHA)
         self.overlay.fill((0, 0, 0, 180))
-        self.title_font = pg.font.Font(None, 74)
+        self.title_font = get_font(74)
+        self.title = Label("Pause", self.title_font, WHITE, (WIDTH // 2, HEIGHT // 4))
         self.setup_buttons()
 
     def setup_buttons(self):
@@ -636,12 +770,10 @@ class PauseState(State):
                 if event.key == pg.K_ESCAPE:
                     self.resume_game()
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         surface.blit(self.overlay, (0, 0))
 
-        title_surf = self.title_font.render("Pause", True, WHITE)
-        title_rect = title_surf.get_rect(center=(WIDTH // 2, HEIGHT // 4))
-        surface.blit(title_surf, title_rect)
+        self.title.draw(surface)
 
         for button in self.buttons:
             button.draw(surface)
@@ -655,13 +787,18 @@ class SettingsState(State):
         super().__init__(manager, game_instance)
         self.overlay = pg.Surface((WIDTH, HEIGHT), pg.SRCALPHA)
         self.overlay.fill((0, 0, 0, 180))
-        self.title_font = pg.font.Font(None, 74)
+        self.title_font = get_font(74)
         self.slider_rect = pg.Rect(WIDTH // 2 - 150, HEIGHT // 2, 300, 10)  # Slider
         self.knob_rect = pg.Rect(self.slider_rect.x + self.slider_rect.width - 10, self.slider_rect.y - 5, 20, 20)  # Slider knob
         self.dragging = False
-        self.volume = 1.0  #  volume (100%)
+        self.volume = audio.get_volume("master")  # volume général (musique et effets)
+        self.title = Label("Options", self.title_font, BLACK, (WIDTH // 2, HEIGHT // 4))
+        self.volume_label = Label(self.get_volume_text(), self.game.font, BLACK, (WIDTH // 2, self.slider_rect.y - 30))
         self.setup_buttons()
 
+    def get_volume_text(self):
+        return f"Volume: {int(self.volume * 100)}%"
+
     def setup_buttons(self):
         button_width = 200
         button_height = 50
@@ -692,19 +829,17 @@ class SettingsState(State):
                 # volume = (position du curseur - position de départ) / (largeur totale - largeur du curseur)
                 self.volume = (self.knob_rect.x - self.slider_rect.x) / (self.slider_rect.width - self.knob_rect.width)
                 self.volume = max(0.0, min(self.volume, 1.0))  # Clamp the volume to [0.0, 1.0]
+                self.volume_label.set_text(self.get_volume_text())
 
-                global GAME_VOLUME
-                GAME_VOLUME = self.volume  # mettre à jour le volume global
-                pg.mixer.music.set_volume(GAME_VOLUME)  # ajuster le volume de la musique
+                # volume général : appliqué à la musique et aux effets (seulement s'il a changé)
+                audio.set_volume("master", self.volume)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         # remplir l'écran avec une couleur
         surface.fill(BEIGE)
 
         # dessiner l'overlay
-        title_surf = self.title_font.render("Options", True, BLACK)
-        title_rect = title_surf.get_rect(center=(WIDTH // 2, HEIGHT // 4))
-        surface.blit(title_surf, title_rect)
+        self.title.draw(surface)
 
         # Dessiner le slider
         pg.draw.rect(surface, BLACK, self.slider_rect)
@@ -712,11 +847,7 @@ class SettingsState(State):
         pg.draw.ellipse(surface, RED, self.knob_rect)
 
         # dessiner le texte du volume
-        if self.game.font:
-            volume_text = f"Volume: {int(self.volume * 100)}%"
-            volume_surf = self.game.font.render(volume_text, True, BLACK)
-            volume_rect = volume_surf.get_rect(center=(WIDTH // 2, self.slider_rect.y - 30))
-            surface.blit(volume_surf, volume_rect)
+        self.volume_label.draw(surface)
 
         # Dessiner les boutons
         for button in self.buttons:
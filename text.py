@@ -0,0 +1,125 @@
+import pygame as pg
+
+# Polices partagées par tous les états : (nom, taille) -> pg.font.Font
+fonts = {}
+
+def get_font(size, name=None):
+    """
+    Retourne une police partagée, créée au premier appel.
+    :param size: Taille de la police.
+    :param name: Fichier de police (None = police par défaut de Pygame).
+    """
+    key = (name, size)
+    font = fonts.get(key)
+    if font is None:
+        font = fonts[key] = pg.font.Font(name, size)
+    return font
+
+
+def layout_lines(text, font, max_width):
+    """
+    Découpe un texte en lignes d'au plus max_width pixels (retour à la ligne par mots).
+    Les sauts de ligne du texte sont conservés.
+    :return: Liste de (début, fin) : indices des caractères de chaque ligne dans 'text'.
+    """
+    spans = []
+    position = 0
+    for paragraph in text.split('\n'):
+        line_start = line_end = None
+        line_text = ""
+        word_start = position
+        for word in paragraph.split(' '):
+            word_end = word_start + len(word)
+            test_line = f"{line_text} {word}".strip()
+            if font.size(test_line)[0] <= max_width:
+                line_text = test_line
+                if word:
+                    if line_start is None:
+                        line_start = word_start
+                    line_end = word_end
+            else:
+                spans.append((line_start if line_start is not None else word_start,
+                              line_end if line_end is not None else word_start))
+                line_text = word
+                line_start = word_start if word else None
+                line_end = word_end if word else None
+            word_start = word_end + 1 # Saute l'espace
+        if line_text:
+            spans.append((line_start, line_end))
+        position += len(paragraph) + 1 # Saute le saut de ligne
+    return spans
+
+
+class TypewriterText:
+    """
+    Texte affiché lettre par lettre (effet machine à écrire).
+    La mise en page est calculée une seule fois pour le texte complet ; les lignes
+    terminées sont rendues une fois sur une surface commune, et seule la ligne en
+    cours de frappe est rendue à nouveau quand une lettre apparaît.
+    """
+    def __init__(self, text, font, color, max_width, center_x, top):
+        """
+        Prépare la mise en page.
+        :param text: Texte complet.
+        :param font: Police (voir get_font).
+        :param color: Couleur du texte.
+        :param max_width: Largeur maximale d'une ligne en pixels.
+        :param center_x: Abscisse du centre des lignes.
+        :param top: Ordonnée du centre de la première ligne.
+        """
+        self.text = text
+        self.font = font
+        self.color = color
+        self.center_x = center_x
+        self.top = top
+        self.line_height = font.get_linesize()
+        self.spans = layout_lines(text, font, max_width)
+
+        # Lignes terminées, rendues une seule fois sur une surface commune
+        self.block_width = max([font.size(text[start:end])[0] for start, end in self.spans] + [1])
+        self.block_left = center_x - self.block_width // 2
+        self.block_top = top - self.line_height # Marge pour les lignes plus hautes que l'interligne
+        self.finished_surface = None
+        self.finished_lines = 0
+        # Ligne en cours de frappe : (indice de ligne, nombre de lettres) -> surface
+        self.current_key = None
+        self.current_surface = None
+
+    def finish_lines(self, count):
+        """ Ajoute à la surface commune les lignes terminées qui n'y sont pas encore. """
+        if self.finished_surface is None:
+            height = (len(self.spans) + 2) * self.line_height
+            self.finished_surface = pg.Surface((self.block_width, height), pg.SRCALPHA)
+        while self.finished_lines < count:
+            start, end = self.spans[self.finished_lines]
+            line_surface = self.font.render(self.text[start:end], True, self.color)
+            x = self.center_x - line_surface.get_width() // 2 - self.block_left
+            y = self.top + self.finished_lines * self.line_height - line_surface.get_height() // 2 - self.block_top
+            # Copie des pixels (et de leur transparence) sans mélange avec le fond vide
+            self.finished_surface.blit(line_surface, (x, y), special_flags=pg.BLEND_RGBA_MAX)
+            self.finished_lines += 1
+
+    def draw(self, surface, visible_count):
+        """
+        Dessine le texte jusqu'au caractère 'visible_count' (exclu).
+        """
+        # Nombre de lignes entièrement visibles, puis ligne en cours
+        done = 0
+        while done < len(self.spans) and self.spans[done][1] <= visible_count:
+            done += 1
+        if done > self.finished_lines:
+            self.finish_lines(done)
+
+        if self.finished_lines:
+            surface.blit(self.finished_surface, (self.block_left, self.block_top))
+
+        if done < len(self.spans):
+            start, end = self.spans[done]
+            if visible_count > start:
+                key = (done, visible_count)
+                if key != self.current_key:
+                    self.current_key = key
+                    self.current_surface = self.font.render(self.text[start:visible_count].rstrip(), True, self.color)
+                line_rect = self.current_surface.get_rect(
+                    center=(self.center_x, self.top + done * self.line_height))
+                surface.blit(self.current_surface, line_rect)
@@ -4,6 +4,8 @@ from settings import BLACK, WHITE, GREEN # Assuming some colors are defined in s
 class Button:
     """
     Classe simple pour un bouton cliquable.
+    L'image du bouton (fond, bordure et texte) est rendue une seule fois par état
+    de survol, puis réutilisée tant que le texte ne change pas.
     """
     def __init__(self, x, y, width, height, text, callback, font, text_color=BLACK, button_color=WHITE, hover_color=GREEN):
         """
@@ -25,19 +27,40 @@ class Button:
         self.button_color = button_color
         self.hover_color = hover_color
         self.is_hovered = False
+        self.images = {} # Survolé (bool) -> image du bouton
 
-    def draw(self, surface):
+    def set_text(self, text):
         """
-        Dessine le bouton sur la surface donnée.
+        Change le texte du bouton (l'image est rendue à nouveau au prochain dessin).
         """
-        current_color = self.hover_color if self.is_hovered else self.button_color
-        pg.draw.rect(surface, current_color, self.rect)
-        pg.draw.rect(surface, BLACK, self.rect, 2) # Bordure
+        if text != self.text:
+            self.text = text
+            self.images.clear()
+
+    def render(self, hovered):
+        """
+        Rend l'image complète du bouton pour un état de survol.
+        """
+        image = pg.Surface(self.rect.size)
+        local_rect = image.get_rect()
+        current_color = self.hover_color if hovered else self.button_color
+        pg.draw.rect(image, current_color, local_rect)
+        pg.draw.rect(image, BLACK, local_rect, 2) # Bordure
 
         if self.font and self.text:
             text_surface = self.font.render(self.text, True, self.text_color)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            surface.blit(text_surface, text_rect)
+            text_rect = text_surface.get_rect(center=local_rect.center)
+            image.blit(text_surface, text_rect)
+        return image
+
+    def draw(self, surface):
+        """
+        Dessine le bouton sur la surface donnée.
+        """
+        image = self.images.get(self.is_hovered)
+        if image is None:
+            image = self.images[self.is_hovered] = self.render(self.is_hovered)
+        surface.blit(image, self.rect)
 
     def handle_event(self, event):
         """
@@ -51,3 +74,137 @@ class Button:
                     self.callback()
                     return True # Événement géré
         return False # Événement non géré par ce bouton
+
+
+class Label:
+    """
+    Texte statique ou rarement modifié (titres, valeurs affichées).
+    Le texte n'est rendu qu'à sa création et lorsqu'il change.
+    """
+    def __init__(self, text, font, color, center):
+        """
+        Initialise une étiquette.
+        :param text: Texte à afficher.
+        :param font: Objet pg.font.Font pour rendre le texte (None = rien n'est affiché).
+        :param color: Couleur du texte.
+        :param center: Position du centre du texte.
+        """
+        self.text = text
+        self.font = font
+        self.color = color
+        self.center = center
+        self.image = None
+        self.rect = pg.Rect(center, (0, 0))
+        self.version = 0 # Incrémenté à chaque nouveau rendu
+        self.render()
+
+    def render(self):
+        """ Rend le texte et met à jour son rectangle. """
+        if self.font and self.text:
+            self.image = self.font.render(self.text, True, self.color)
+            self.rect = self.image.get_rect(center=self.center)
+        else:
+            self.image = None
+            self.rect = pg.Rect(self.center, (0, 0))
+        self.version += 1
+
+    def set_text(self, text):
+        """
+        Change le texte affiché ; le rendu n'est refait que si le texte est différent.
+        """
+        if text != self.text:
+            self.text = text
+            self.render()
+
+    def draw(self, surface, offset=(0, 0)):
+        """
+        Dessine l'étiquette (décalée de 'offset').
+        """
+        if self.image:
+            surface.blit(self.image, (self.rect.x + offset[0], self.rect.y + offset[1]))
+
+
+class AltitudeGauge:
+    """
+    Jauge verticale indiquant la progression du joueur entre deux altitudes.
+    L'image de la jauge n'est redessinée que lorsque la hauteur remplie change.
+    """
+    def __init__(self, rect, start_y, end_y, color=GREEN, border_color=BLACK):
+        """
+        Initialise la jauge.
+        :param rect: Rectangle de la jauge à l'écran.
+        :param start_y: Coordonnée Y de la carte correspondant à une jauge vide.
+        :param end_y: Coordonnée Y de la carte correspondant à une jauge pleine.
+        :param color: Couleur de la partie remplie.
+        :param border_color: Couleur de la bordure.
+        """
+        self.rect = pg.Rect(rect)
+        self.start_y = start_y
+        self.end_y = end_y
+        self.color = color
+        self.border_color = border_color
+        self.filled_height = None
+        self.image = pg.Surface(self.rect.size, pg.SRCALPHA)
+        self.version = 0
+        self.set_value(start_y)
+
+    def set_value(self, y):
+        """
+        Met à jour la jauge à partir de la coordonnée Y du joueur sur la carte.
+        """
+        fill_percentage = max(0, min(1, (self.start_y - y) / (self.start_y - self.end_y)))
+        filled_height = int(self.rect.height * fill_percentage)
+        if filled_height == self.filled_height:
+            return
+        self.filled_height = filled_height
+
+        local_rect = self.image.get_rect()
+        self.image.fill((0, 0, 0, 0))
+        pg.draw.rect(self.image, self.border_color, local_rect, 2) # Bordure
+        filled_rect = pg.Rect(0, local_rect.height - filled_height, local_rect.width, filled_height)
+        pg.draw.rect(self.image, self.color, filled_rect)
+        self.version += 1
+
+    def draw(self, surface, offset=(0, 0)):
+        """
+        Dessine la jauge (décalée de 'offset').
+        """
+        surface.blit(self.image, (self.rect.x + offset[0], self.rect.y + offset[1]))
+
+
+class Hud:
+    """
+    Interface affichée par-dessus le jeu, composée sur sa propre surface.
+    La surface n'est recomposée que si l'un des éléments a changé (numéro de
+    version différent) ; sinon le dessin du HUD se résume à un seul blit.
+    """
+    def __init__(self, widgets):
+        """
+        :param widgets: Éléments du HUD (objets avec 'rect', 'version' et draw(surface, offset)).
+        """
+        self.widgets = list(widgets)
+        self.versions = None
+        self.rect = pg.Rect(0, 0, 0, 0)
+        self.surface = None
+
+    def compose(self):
+        """ Redessine tous les éléments sur la surface du HUD. """
+        self.rect = self.widgets[0].rect.unionall([widget.rect for widget in self.widgets[1:]])
+        if self.surface is None or self.surface.get_size() != self.rect.size:
+            self.surface = pg.Surface(self.rect.size, pg.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        offset = (-self.rect.x, -self.rect.y)
+        for widget in self.widgets:
+            widget.draw(self.surface, offset)
+
+    def draw(self, surface):
+        """
+        Dessine le HUD, en le recomposant seulement si nécessaire.
+        """
+        if not self.widgets:
+            return
+        versions = tuple(widget.version for widget in self.widgets)
+        if versions != self.versions:
+            self.versions = versions
+            self.compose()
+        surface.blit(self.surface, self.rect)